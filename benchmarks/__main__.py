@@ -0,0 +1,91 @@
+"""Run the benchmark suite, store its results and compare them to a baseline
+
+    python -m benchmarks                                  # print timings
+    python -m benchmarks -o results.json                  # save them
+    python -m benchmarks --baseline results.json          # fail on regressions
+    python -m benchmarks fib sieve                        # only some kernels
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Sequence
+
+from benchmarks.suite import KERNELS, Kernel
+
+
+DEFAULT_REPEAT: int = 5
+DEFAULT_TOLERANCE: float = 0.15  # slowdown ratio above which a kernel regressed
+
+
+def run_kernel(kernel: Kernel, repeat: int) -> float:
+    """best time in seconds out of repeat runs"""
+    timed = kernel.prepare()
+    return min(timeit.repeat(timed, number=1, repeat=repeat))
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], tolerance: float) -> list[str]:
+    """names of the kernels slower than in baseline, beyond tolerance"""
+    regressions: list[str] = []
+    for name, seconds in results.items():
+        if name not in baseline:
+            print(f"{name:<14} no baseline")
+            continue
+        ratio: float = seconds / baseline[name]
+        regressed: bool = ratio > 1 + tolerance
+        print(f"{name:<14} {baseline[name] * 1000:10.2f}ms -> {seconds * 1000:10.2f}ms  x{ratio:.2f}"
+              + ("  REGRESSION" if regressed else ""))
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('kernels', nargs='*', help="kernels to run, all by default")
+    parser.add_argument('-o', '--output', type=Path, help="write results to this JSON file")
+    parser.add_argument('-b', '--baseline', type=Path, help="JSON results to compare with")
+    parser.add_argument('-r', '--repeat', type=int, default=DEFAULT_REPEAT)
+    parser.add_argument('-t', '--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument('-l', '--list', action='store_true', help="list kernels and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for kernel in KERNELS:
+            print(f"{kernel.name:<14} {kernel.description}")
+        return 0
+
+    unknown: set[str] = set(args.kernels) - {kernel.name for kernel in KERNELS}
+    if unknown:
+        parser.error(f"unknown kernels: {', '.join(sorted(unknown))}")
+
+    results: dict[str, float] = {}
+    for kernel in KERNELS:
+        if args.kernels and kernel.name not in args.kernels:
+            continue
+        results[kernel.name] = run_kernel(kernel, args.repeat)
+        print(f"{kernel.name:<14} {results[kernel.name] * 1000:10.2f}ms  {kernel.description}")
+
+    if args.output is not None:
+        report: dict[str, Any] = {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'repeat': args.repeat,
+            'results': results,
+        }
+        args.output.write_text(json.dumps(report, indent=2) + '\n')
+
+    if args.baseline is not None:
+        print(f"\ncompared to {args.baseline}")
+        baseline: dict[str, float] = json.loads(args.baseline.read_text())['results']
+        if compare(results, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,34 @@
+"""Fixed-point dot product of two 10000 cells arrays, interpreted loop against ARRAY-FDOT
+
+    python -m benchmarks.bench_arrays
+"""
+import timeit
+
+from pyforth.interpreter import Interpreter
+from pyforth.runtime import arrays
+
+
+SIZE: int = 10000
+SOURCE: str = f"""
+{SIZE} constant size
+create a size allot create b size allot
+: init size 0 do i a i + ! size i - b i + ! loop ;
+: loop-dot 0 size 0 do a i + @ b i + @ f* + loop ;
+: array-dot a b size array-fdot ;
+"""
+
+
+def main() -> None:
+    interpreter = Interpreter()
+    interpreter.run(SOURCE + 'init')
+    for word in ('loop-dot', 'array-dot'):
+        elapsed: float = min(timeit.repeat(lambda: interpreter.run(word), number=1, repeat=5))
+        print(f"{word:<10} {elapsed * 1000:8.3f}ms")
+    if arrays.np is not None:
+        arrays.np = None
+        elapsed = min(timeit.repeat(lambda: interpreter.run('array-dot'), number=1, repeat=5))
+        print(f"{'array-dot':<10} {elapsed * 1000:8.3f}ms without NumPy")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+"""Calls to colon definitions: lookup by name at runtime vs. binding at compile time
+
+    python -m benchmarks.bench_early_binding
+"""
+import timeit
+
+from pyforth.interpreter import Interpreter
+
+
+PROGRAM: str = """
+: push-two 1 dup ;
+: drop-two 2drop ;
+: MAIN 20000 0 do push-two drop-two loop ;
+"""
+
+
+def main() -> None:
+    for early_binding in (False, True):
+        interpreter = Interpreter(early_binding=early_binding)
+        interpreter.run(PROGRAM)
+        elapsed: float = min(timeit.repeat(lambda: interpreter.run('MAIN'), number=1, repeat=5))
+        print(f"early_binding={early_binding!s:<5} {elapsed:.3f}s")
+
+
+if __name__ == '__main__':
+    main()
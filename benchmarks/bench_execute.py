@@ -0,0 +1,25 @@
+"""Vectored execution: a dispatch table of xts run through EXECUTE
+
+    python -m benchmarks.bench_execute
+"""
+import timeit
+
+from pyforth.interpreter import Interpreter
+
+
+DISPATCH_TABLE = """
+create table ' 1+ , ' 1- , ' 2* , ' 2/ ,
+: dispatch ( n i -- n ) table + @ execute ;
+: main 1 10000 0 do i 3 and dispatch loop drop ;
+"""
+
+
+def main() -> None:
+    interpreter = Interpreter()
+    interpreter.run(DISPATCH_TABLE)
+    elapsed: float = min(timeit.repeat(lambda: interpreter.run('main'), number=1, repeat=5))
+    print(f"10000 EXECUTE {elapsed * 1000:.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
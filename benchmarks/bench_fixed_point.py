@@ -0,0 +1,47 @@
+"""Fixed-point math words, float fast path and exact computation against the former float-string round-trip
+
+    python -m benchmarks.bench_fixed_point
+"""
+import math
+import timeit
+from typing import Callable
+
+from pyforth.runtime import fixed_math
+from pyforth.runtime.fixed_point import parse_to_fp
+
+
+ARGUMENTS = [x * 1234 for x in range(1, 200)]  # fixed-point numbers, 0.01234 to 2.45566 at precision 5
+FUNCTIONS: tuple[tuple[str, Callable[[float], float], Callable[[int, int], int]], ...] = (
+    ('fsqrt', math.sqrt, fixed_math.sqrt),
+    ('fexp', math.exp, fixed_math.exp),
+    ('fln', math.log, fixed_math.ln),
+    ('fsin', math.sin, fixed_math.sin),
+)
+
+
+def legacy(func: Callable[[float], float], x: int, precision: int) -> int:
+    """what fixed-point words used to compute"""
+    return parse_to_fp(str(func(x / 10 ** precision)), precision)
+
+
+def fast(func: Callable[[float], float], x: int, precision: int) -> int:
+    scale: int = 10 ** precision
+    return round(func(x / scale) * scale)
+
+
+def time_per_call(call: Callable[[], object]) -> float:
+    return min(timeit.repeat(call, number=1, repeat=5)) / len(ARGUMENTS) * 1e6
+
+
+def main() -> None:
+    for name, func, exact in FUNCTIONS:
+        legacy_us = time_per_call(lambda: [legacy(func, x, 5) for x in ARGUMENTS])
+        fast_us = time_per_call(lambda: [fast(func, x, 5) for x in ARGUMENTS])
+        exact_us = time_per_call(lambda: [exact(x, 10 ** 5) for x in ARGUMENTS])
+        exact_30_us = time_per_call(lambda: [exact(x * 10 ** 25, 10 ** 30) for x in ARGUMENTS])
+        print(f"{name:<6} legacy {legacy_us:6.2f}µs  float {fast_us:6.2f}µs  "
+              f"exact {exact_us:6.2f}µs  exact at precision 30 {exact_30_us:6.2f}µs")
+
+
+if __name__ == '__main__':
+    main()
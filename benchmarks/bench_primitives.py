@@ -0,0 +1,23 @@
+"""Cost of a primitive call in the inner interpreter
+
+    python -m benchmarks.bench_primitives
+"""
+import timeit
+
+from pyforth.interpreter import Interpreter
+
+
+PRIMITIVES = ('1 2 swap over + - dup * drop ', 9)  # source repeated in a definition, primitives in source
+REPEAT = 100
+
+
+def main() -> None:
+    source, count = PRIMITIVES
+    interpreter = Interpreter(optimize=False)  # no superinstruction, each primitive is called
+    interpreter.run(f": body {source * REPEAT} ; : main 100 0 do body loop ;")
+    elapsed: float = min(timeit.repeat(lambda: interpreter.run('main'), number=1, repeat=5))
+    print(f"{elapsed / (100 * REPEAT * count) * 1e9:.1f}ns per primitive")
+
+
+if __name__ == '__main__':
+    main()
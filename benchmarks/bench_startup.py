@@ -0,0 +1,18 @@
+"""Interpreter() startup: bootstrap from Forth source vs. loading the cached snapshot
+
+    python -m benchmarks.bench_startup
+"""
+import timeit
+
+from pyforth.interpreter import Interpreter
+
+
+def main() -> None:
+    Interpreter()  # make sure the snapshot is cached
+    for use_snapshot in (False, True):
+        elapsed: float = min(timeit.repeat(lambda: Interpreter(use_snapshot=use_snapshot), number=100, repeat=5))
+        print(f"use_snapshot={use_snapshot!s:<5} {elapsed * 10:.3f}ms")
+
+
+if __name__ == '__main__':
+    main()
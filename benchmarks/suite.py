@@ -0,0 +1,74 @@
+"""Classic Forth kernels timed as a suite, see benchmarks/__main__.py to run them"""
+import io
+from typing import Callable, NamedTuple
+
+from pyforth.interpreter import Interpreter
+
+
+class Kernel(NamedTuple):
+    name: str
+    description: str
+    prepare: Callable[[], Callable[[], None]]  # returns what is timed, once checked
+
+
+def _program(source: str, run: str, expected: list[int], native_code: bool = False) -> Callable[[], Callable[[], None]]:
+    """compile source then time run, which must leave expected on the data stack"""
+    def prepare() -> Callable[[], None]:
+        interpreter = Interpreter(output=io.StringIO(), native_code=native_code)
+        interpreter.run(source)
+        interpreter.run(run)
+        assert interpreter.data_stack == expected, interpreter.data_stack
+        return lambda: interpreter.run(run)
+    return prepare
+
+
+def _bootstrap() -> Callable[[], None]:
+    return lambda: Interpreter(use_snapshot=False)
+
+
+def _parse() -> Callable[[], None]:
+    source: str = '\n'.join(f': word{n} {n} 1 + drop ; ( comment {n} ) word{n}' for n in range(5000))
+    interpreter = Interpreter()
+    return lambda: interpreter.run(source)
+
+
+# source, words timed and the data stack they leave, run threaded and translated to Python
+_FIB: tuple[str, str, list[int]] = (
+    ': fib dup 2 < if exit then dup 1- recurse swap 2 - recurse + ;', '18 fib', [2584]
+)
+_SIEVE: tuple[str, str, list[int]] = (
+    """
+    8192 constant size
+    create flags size allot
+    : sieve ( -- n ) flags size -1 fill 0 size 2 do
+        flags i + @ if 1+ i dup * size < if size i dup * do 0 flags i + ! j +loop then then
+      loop ;
+    """,
+    'sieve', [1028]
+)
+_NESTED: tuple[str, str, list[int]] = (
+    ': nested 0 100 0 do 100 0 do 10 0 do i j + k + + loop loop loop ;', 'nested', [10350000]
+)
+_COUNTDOWN: tuple[str, str, list[int]] = (': countdown 50000 begin dup while 1- repeat ;', 'countdown', [0])
+
+
+KERNELS: tuple[Kernel, ...] = (
+    Kernel('fib', 'fib(18) with RECURSE', _program(*_FIB)),
+    Kernel('sieve', 'primes below 8192 in a heap array', _program(*_SIEVE)),
+    Kernel('nested-loops', '3 nested DO LOOP, 100000 iterations', _program(*_NESTED)),
+    Kernel('begin-while', 'BEGIN WHILE REPEAT countdown from 50000', _program(*_COUNTDOWN)),
+    Kernel('fib-native', 'fib translated to Python', _program(*_FIB, native_code=True)),
+    Kernel('sieve-native', 'sieve translated to Python', _program(*_SIEVE, native_code=True)),
+    Kernel('nested-native', 'nested loops translated to Python', _program(*_NESTED, native_code=True)),
+    Kernel('while-native', 'countdown translated to Python', _program(*_COUNTDOWN, native_code=True)),
+    Kernel(
+        'fixed-point', 'f* and fsqrt, 2000 iterations',
+        _program(': fixed 0 2000 0 do 2.0 fsqrt 1.5 f* f+ loop ;', 'fixed', [424262000])
+    ),
+    Kernel(
+        'type', 'TYPE and CR of a string literal, 2000 lines',
+        _program(': greet s" Hello, world!" type cr ; : output 2000 0 do greet loop ;', 'output', [])
+    ),
+    Kernel('bootstrap', 'Interpreter() without snapshot', _bootstrap),
+    Kernel('parse', 'parse and compile 5000 definitions', _parse),
+)
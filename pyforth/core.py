@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from array import array
+from collections.abc import Callable, MutableMapping, MutableSequence
 from typing import TypeAlias, Optional, TypeVar, Generic, Any
 
+from .sink import OutputSink
+
 T = TypeVar('T')
 
 class DefinedExecutionToken(list, Generic[T]):
     """Needed to set an _immediate attribute to True/False"""
-    pass
+    name: str = ''  # of the word it was defined for
 
 
 WORD: TypeAlias = str
@@ -17,7 +20,8 @@ STACK: TypeAlias = list
 LITERAL: TypeAlias = int
 DATA_STACK = STACK[LITERAL]
 RETURN_STACK = STACK[LITERAL]
-CONTROL_STRUCT = tuple[WORD, POINTER | WORD, tuple[WORD, POINTER] | tuple[()]]
+EXIT_STRUCT = tuple[WORD, *tuple[POINTER, ...]] | tuple[()]  # EXIT and the slots of jumps out of a block
+CONTROL_STRUCT = tuple[WORD, POINTER | WORD, EXIT_STRUCT]
 CONTROL_STACK = STACK[CONTROL_STRUCT]
 NATIVE_XT = Callable[["State"], Optional[POINTER]]
 XT_ATOM = NATIVE_XT | LITERAL | WORD
@@ -42,8 +46,17 @@ class State(ABC):
     ds: DATA_STACK = []
     rs: RETURN_STACK = []
     control_stack: CONTROL_STACK = []
-    heap: list[LITERAL] = [0] * 20
+    heap: MutableSequence[LITERAL] = array('q', [0] * 20)
     next_heap_address: int = 0
+    output: OutputSink = OutputSink()
+    scale: int = 1  # 10 ** precision, kept by set_precision
+    fp_format: str = '{}{}.{}'  # sign, integer part and fractional part padded to precision
+
+    @abstractmethod
+    def allot(self, nb_cells: int) -> POINTER: ...
+
+    @abstractmethod
+    def intern_string(self, s: str, counted: bool = False) -> POINTER: ...
 
     @abstractmethod
     def prepare_current_definition(self) -> None: ...
@@ -51,11 +64,14 @@ class State(ABC):
     @abstractmethod
     def compile_to_current_definition(self, obj: Optional[Any] = None) -> POINTER: ...
 
+    @abstractmethod
+    def compile_word(self, word: WORD, xt: XT) -> POINTER: ...
+
     @abstractmethod
     def close_jump_address(self, addr: POINTER) -> None: ...
 
     @abstractmethod
-    def set_exit_jump_address(self, exit_: tuple[WORD, POINTER] | tuple[()]) -> None: ...
+    def set_exit_jump_address(self, exit_: EXIT_STRUCT) -> None: ...
 
     @abstractmethod
     def complete_current_definition(self) -> None: ...
@@ -81,6 +97,10 @@ class State(ABC):
     @abstractmethod
     def reveal_created_word(self, word: WORD) -> None: ...
 
+    @property
+    @abstractmethod
+    def early_binding(self) -> bool: ...
+
     @property
     @abstractmethod
     def base(self) -> int: ...
@@ -100,17 +120,35 @@ class State(ABC):
 
     @property
     @abstractmethod
-    def execution_tokens(self) -> dict[WORD, XT]: ...
+    def execution_tokens(self) -> MutableMapping[WORD, XT]: ...
+
+    @abstractmethod
+    def writable_xt(self, word: WORD) -> XT: ...
+
+    @abstractmethod
+    def xt_address(self, word: WORD, xt: XT) -> POINTER: ...
+
+    @abstractmethod
+    def xt_at(self, addr: POINTER) -> tuple[WORD, XT] | None: ...
 
     @abstractmethod
     def next_char(self) -> str: ...
 
+    @abstractmethod
+    def parse(self, delimiter: str) -> str: ...
+
     @abstractmethod
     def next_word(self, preserve_case: bool = False) -> WORD: ...
 
     @abstractmethod
     def execute(self, code: DefinedExecutionToken) -> None: ...
 
+    @abstractmethod
+    def set_profiling(self, enabled: bool) -> None: ...
+
+    @abstractmethod
+    def collapsed_stacks(self) -> str: ...
+
     @property
     @abstractmethod
     def instruction_pointer(self) -> POINTER: ...
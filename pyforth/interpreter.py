@@ -1,24 +1,58 @@
 from __future__ import annotations
-import re
+import io
+import sys
+from time import perf_counter
+from array import array
 from pathlib import Path
-from typing import cast, Sequence, Generator, Final
+from collections import ChainMap
+from collections.abc import Mapping, MutableMapping, MutableSequence
+from types import MappingProxyType
+from typing import cast, Any, BinaryIO, Callable, Optional, Sequence, Final, TextIO
 
 from .runtime.primitives import compile_address, deferred_definition, search_word
 from .runtime.utils import fatal
 from .core import DATA_STACK, DEFINED_XT, NATIVE_XT, POINTER, RETURN_STACK, WORD, XT, DefinedExecutionToken, \
     StackUnderflowError, LITERAL, ForthRuntimeError, XT_ATOM
-from .core import ForthCompilationError, State
+from .core import EXIT_STRUCT, ForthCompilationError, State
 from .runtime import dictionary
+from .runtime.utils import copy_xt, stack_underflow
 from .runtime.primitives import xt_r_push, execute_immediate
-from .runtime.fixed_point import parse_to_fp
+from .runtime.fixed_point import MAX_DIGITS, parse_number
+from .runtime.heap import CELL_BYTES, CELL_TYPECODE
+from .runtime.strings import store_string
+from .optimizer import inline, optimize
+from .native import compile_native
+from .profiler import TRANSPARENT_XTS, Profiler, WordProfile
+from .tracer import TRACE_SIZE, Tracer, TraceEntry
+from .snapshot import Snapshot, load_snapshot, save_snapshot, snapshot_key
+from .sink import OutputSink
+from .source import CHUNK_SIZE, InputSource
+from .mapped_heap import MappedHeap
 
 
 DEFAULT_PRECISION: Final[int] = 5
-MEMORY_SIZE: Final[int] = 64
+MEMORY_SIZE: Final[int] = 64  # initial heap size in cells, it grows as needed
+INLINE_THRESHOLD: Final[int] = 8  # max size in cells of an inlined definition
 EXTENSIONS: Sequence[str] = (
     'core.forth',
 )
 
+_PRIMITIVES: Mapping[WORD, XT] = MappingProxyType(dictionary)
+_INPUT: Final[DEFINED_XT] = DefinedExecutionToken()  # stands for the input in traces
+_INPUT.name = '(input)'
+_CALL = Callable[[DEFINED_XT, POINTER, NATIVE_XT], Optional[POINTER]]  # runs a word of a definition
+_BOOTSTRAP_IMAGES: dict[tuple[tuple[str, ...], tuple[bool, bool, int]], Snapshot] = {}
+
+
+class _ExecutionContext:
+    """Code being executed and its instruction pointer, as seen by primitives"""
+
+    __slots__ = ('code', 'ip')
+
+    def __init__(self, code: DEFINED_XT) -> None:
+        self.code: DEFINED_XT = code
+        self.ip: POINTER = 0
+
 
 class _InnerInterpreter(State):
 
@@ -29,18 +63,45 @@ class _InnerInterpreter(State):
         self,
         parent: Interpreter,
         input_code: str = '',
-        heap_size: int = MEMORY_SIZE
+        heap_size: int = MEMORY_SIZE,
+        heap_limit: int | None = None,
+        heap_file: str | Path | None = None,
+        output: Optional[TextIO | BinaryIO] = None,
+        early_binding: bool = True,
+        optimize: bool = True,
+        inline_threshold: int = INLINE_THRESHOLD
     ):
         self._prompt: str = self._DEFAULT_PROMPT
         self._interpreter: Interpreter = parent
         self._interactive: bool = False
         self._is_compiling: bool = False  # set by colon, reset by semicolon
-        self._execution_contextes: list[list[DEFINED_XT | POINTER]] = []
-        self._input_buffer: str = input_code
-        self.heap = [0] * heap_size
+        self._early_binding: bool = early_binding
+        self._optimize: bool = optimize
+        self._inline_threshold: int = inline_threshold
+        self._native_code: bool = False  # set once bootstrapped, the snapshot cannot pickle generated functions
+        self._execution_contextes: list[_ExecutionContext] = []
+        self._source: InputSource = InputSource(input_code)
+        self.output = OutputSink(output)
+        self._mapped_heap: MappedHeap | None = None
+        self.heap: MutableSequence[LITERAL]
+        if heap_file is None:
+            self.heap = array(CELL_TYPECODE, bytes(heap_size * CELL_BYTES))
+        else:
+            self._mapped_heap = MappedHeap(heap_file, heap_size)
+            self.heap = self._mapped_heap.cells
+        self._heap_limit: int | None = heap_limit
+        self._strings: dict[tuple[str, bool], POINTER] = {}  # literals compiled so far
+        self._kept_heap_address: POINTER = 0  # end of the last of them
         self._precision: int = DEFAULT_PRECISION
+        self.set_precision(DEFAULT_PRECISION)  # and the constants derived from it
         self._last_created_word: WORD = ''
         self._current_definition: DefinedExecutionToken = DefinedExecutionToken()
+        self._words: ChainMap[WORD, XT] = ChainMap({}, _PRIMITIVES)
+        self._profiler: Profiler | None = None
+        self._profiling: bool = False
+        self._tracer: Tracer | None = None
+        self._xts: list[tuple[WORD, XT]] = []  # xt addresses, in the order they were given
+        self._xt_addresses: dict[int, POINTER] = {}  # by xt identity, xts are kept alive by _xts
 
     def prepare_current_definition(self) -> None:
         assert self.is_compiling
@@ -51,15 +112,21 @@ class _InnerInterpreter(State):
         self._current_definition[addr] = len(self._current_definition)
 
     def complete_current_definition(self) -> None:
-        self.execution_tokens[self.last_created_word] = DefinedExecutionToken(self._current_definition[:])
+        definition: DEFINED_XT = DefinedExecutionToken(self._current_definition[:])
+        if self._optimize:
+            definition = optimize(definition)
+        definition.name = self.last_created_word
+        native: NATIVE_XT | None = compile_native(self.last_created_word, definition) if self._native_code else None
+        self.execution_tokens[self.last_created_word] = definition if native is None else native
         self._current_definition.clear()
 
-    def set_exit_jump_address(self, exit_: tuple[WORD, POINTER] | tuple[()]) -> None:
+    def set_exit_jump_address(self, exit_: EXIT_STRUCT) -> None:
         if exit_:
-            word, slot = exit_
+            word, *slots = exit_
             if word != "EXIT":
                 fatal(f"Unexpected word in place of EXIT: {word!r}")
-            self._current_definition[slot] = len(self._current_definition)
+            for slot in slots:
+                self._current_definition[slot] = len(self._current_definition)
 
     def compile_to_current_definition(self, obj = None) -> POINTER:
         if obj is None:
@@ -72,6 +139,17 @@ class _InnerInterpreter(State):
 
         return len(self._current_definition)
 
+    def compile_word(self, word: WORD, xt: XT) -> POINTER:
+        if self._early_binding and isinstance(xt, list):
+            body: list[XT_ATOM] | None = inline(
+                cast(DEFINED_XT, xt),
+                offset=len(self._current_definition),
+                threshold=self._inline_threshold
+            )
+            if body is not None:
+                return self.compile_to_current_definition(body)
+        return self.compile_to_current_definition(compile_address(word, xt, self._early_binding))
+
     @property
     def interactive(self) -> bool:
         return self._interactive
@@ -82,33 +160,44 @@ class _InnerInterpreter(State):
 
     @property
     def input_code(self) -> str:
-        return self._input_buffer
+        return self._source.remaining
 
     @input_code.setter
     def input_code(self, value: str) -> None:
-        self._input_buffer = value + ' \n'
+        self._source = InputSource(value + ' \n')
 
-    def wait_for_input(self) -> Generator[str]:
-        while True:
-            if self.interactive and len(self._input_buffer.strip()) == 0:
-                _raw_input: str = input(self._prompt) + " \n"
-                self._input_buffer += _raw_input
-            yield self._input_buffer
+    @property
+    def input_source(self) -> InputSource:
+        return self._source
+
+    @input_source.setter
+    def input_source(self, source: InputSource) -> None:
+        self._source = source
+
+    def wait_for_input(self) -> None:
+        if self.interactive and self._source.blank:
+            self.output.flush()  # whatever the prompt answers
+            self._source.feed(input(self._prompt) + " \n")
 
     def next_char(self) -> str:
-        s: str = next(self.wait_for_input())
-        s, self._input_buffer = s[0], s[1:]
-        return s
+        self.wait_for_input()
+        return self._source.next_char()
+
+    def parse(self, delimiter: str) -> str:
+        self.wait_for_input()
+        text, found = self._source.parse(delimiter)
+        while not found and self.interactive:  # delimiter is on a line yet to come
+            self.wait_for_input()
+            more, found = self._source.parse(delimiter)
+            text += more
+        return text
 
     def next_word(self, preserve_case: bool = False) -> WORD:
-        word: WORD = ''
-        s: str = next(self.wait_for_input())
-        match = re.match(r'\s*(\S+)\s+', s)
-        if match is not None:
-            word = match.group(1).strip()
+        self.wait_for_input()
+        word: WORD = self._source.next_word()
+        if word:
             if not preserve_case:
                 word = word.lower()
-            self._input_buffer = self._input_buffer[match.span()[1]:]
             if word == "bye":
                 raise StopIteration
 
@@ -118,17 +207,184 @@ class _InnerInterpreter(State):
         return word
 
     @property
-    def execution_tokens(self) -> dict[WORD, XT]:
-        return dictionary
+    def execution_tokens(self) -> MutableMapping[WORD, XT]:
+        return self._words
+
+    def writable_xt(self, word: WORD) -> XT:
+        xt: XT = self._words[word]
+        if word not in self._words.maps[0]:  # shared by all interpreters, copy it first
+            xt = copy_xt(xt)
+            self._words[word] = xt
+        return xt
+
+    def xt_address(self, word: WORD, xt: XT) -> POINTER:
+        """address given to xt the first time it is asked for, redefining word does not change it"""
+        addr: POINTER | None = self._xt_addresses.get(id(xt))
+        if addr is None:
+            addr = len(self._xts)
+            self._xts.append((word, xt))
+            self._xt_addresses[id(xt)] = addr
+        return addr
+
+    def xt_at(self, addr: POINTER) -> tuple[WORD, XT] | None:
+        if isinstance(addr, int) and 0 <= addr < len(self._xts):
+            return self._xts[addr]
+        return None
+
+    def allot(self, nb_cells: int) -> POINTER:
+        """reserve nb_cells from the next heap address on, a negative count releases them"""
+        start: POINTER = self.next_heap_address
+        end: POINTER = start + nb_cells
+        if end < 0:
+            raise ForthRuntimeError(f"Cannot release {-nb_cells} cells, only {start} are allotted")
+        if end > len(self.heap):
+            self._grow_heap(end)
+        self.next_heap_address = end
+        return start
+
+    def intern_string(self, s: str, counted: bool = False) -> POINTER:
+        """heap address of a string literal, stored once and kept from run to run"""
+        addr: POINTER | None = self._strings.get((s, counted))
+        if addr is None:
+            addr = store_string(self, s, counted)
+            self._strings[(s, counted)] = addr
+            self._kept_heap_address = self.next_heap_address
+        return addr
+
+    def _grow_heap(self, size: int) -> None:
+        if self._heap_limit is not None and size > self._heap_limit:
+            raise ForthRuntimeError(f"Heap overflow: {size} cells needed, limit is {self._heap_limit}")
+        new_size: int = max(size, 2 * len(self.heap))  # amortize growth over many , and allot
+        if self._heap_limit is not None:
+            new_size = min(new_size, self._heap_limit)
+        if self._mapped_heap is not None:
+            self.heap = self._mapped_heap.resize(new_size)
+        else:
+            heap: array[LITERAL] = cast(array, self.heap)
+            heap.extend(array(CELL_TYPECODE, bytes((new_size - len(heap)) * CELL_BYTES)))
+
+    def close(self) -> None:
+        if self._mapped_heap is not None:
+            self._mapped_heap.close()
+            self._mapped_heap = None
+
+    def load_image(self, image: Snapshot) -> None:
+        """share image words, they are overridden by words defined from now on"""
+        self._words = ChainMap({}, MappingProxyType(image.words), _PRIMITIVES)
+        if len(image.heap) > len(self.heap):
+            self._grow_heap(len(image.heap))
+        self.heap[:len(image.heap)] = image.heap
+        self.next_heap_address = image.next_heap_address
+        self._xts = list(image.xts)
+        self._xt_addresses = {id(xt): addr for addr, (_, xt) in enumerate(self._xts)}
+
+    def image(self) -> Snapshot:
+        """words defined by this interpreter and its heap up to here"""
+        return Snapshot(
+            words=dict(self._words.maps[0]),
+            heap=array(CELL_TYPECODE, self.heap[:self.next_heap_address]),
+            next_heap_address=self.next_heap_address,
+            xts=list(self._xts)
+        )
 
     def execute(self, code: DEFINED_XT) -> None:
-        self._set_execution_context(code)  # TODO could be a context manager
-        while not self.past_end_of_code:
-            func: NATIVE_XT = self._next_exec_token()
-            new_inst_ptr: POINTER | None = func(self)
-            if new_inst_ptr is not None:
-                self._set_instruction_pointer(new_inst_ptr)
-        self._reset_execution_context()
+        self._dispatch(code, None)
+
+    def _dispatch(self, code: DEFINED_XT, call: Optional[_CALL]) -> None:
+        """run code, each of its words through call when instrumented"""
+        # code and IP are kept in locals, the context is only refreshed so that
+        # primitives reading their inline operand still see where they are
+        context = _ExecutionContext(code)
+        self._execution_contextes.append(context)
+        instructions: Sequence[Any] = code  # only NATIVE_XT are met at IP, no need to cast
+        end: POINTER = len(code)
+        ip: POINTER = 0
+        try:
+            while ip < end:
+                func: NATIVE_XT = instructions[ip]
+                ip += 1
+                context.ip = ip
+                new_inst_ptr: POINTER | None = func(self) if call is None else call(code, ip - 1, func)
+                if new_inst_ptr is not None:
+                    ip = new_inst_ptr
+        except IndexError:  # primitives do not check their stacks, a pop from an empty one tells
+            raise stack_underflow(self, instructions[ip - 1]) from None
+        finally:
+            self._execution_contextes.pop()
+
+    def _execute_profiled(self, code: DEFINED_XT) -> None:
+        """execute timing each word, swapped in for execute while profiling"""
+        profiler: Profiler = cast(Profiler, self._profiler)
+        profiler.enter(profiler.name(code))
+        started: float = perf_counter()
+        try:
+            self._dispatch(code, self._call_profiled)
+        finally:
+            profiler.leave(perf_counter() - started)
+
+    def _call_profiled(self, _code: DEFINED_XT, _ip: POINTER, func: NATIVE_XT) -> Optional[POINTER]:
+        if func in TRANSPARENT_XTS:  # the definition called is profiled instead
+            return func(self)
+        profiler: Profiler = cast(Profiler, self._profiler)
+        profiler.enter(profiler.name(func))
+        called: float = perf_counter()
+        try:
+            return func(self)
+        finally:
+            profiler.leave(perf_counter() - called)
+
+    def _execute_traced(self, code: DEFINED_XT) -> None:
+        """execute recording each word in the trace, swapped in for execute while tracing"""
+        self._dispatch(code, self._call_traced)
+
+    def _call_traced(self, code: DEFINED_XT, ip: POINTER, func: NATIVE_XT) -> Optional[POINTER]:
+        cast(Tracer, self._tracer).record((code, ip, func, self.ds[-1] if self.ds else None))
+        return func(self)
+
+    def execute_word(self, xt: XT) -> None:
+        """run a word met in the input, traced when a primitive as definitions trace the words they run"""
+        if self._tracer is not None and not self._profiling and not isinstance(xt, list):
+            self._tracer.record((_INPUT, 0, xt, self.ds[-1] if self.ds else None))
+        execute_immediate(self, xt)
+
+    def _select_execute(self) -> None:
+        """instrumented execute when profiling, or else tracing, the plain one pays nothing for them"""
+        if self._profiling:
+            setattr(self, 'execute', self._execute_profiled)
+        elif self._tracer is not None:
+            setattr(self, 'execute', self._execute_traced)
+        else:
+            vars(self).pop('execute', None)
+
+    def set_native_code(self, enabled: bool) -> None:
+        """translate the definitions completed from now on to Python functions, when they can be"""
+        self._native_code = enabled
+
+    def set_profiling(self, enabled: bool) -> None:
+        """a new profile is started each time profiling is enabled, tracing is suspended meanwhile"""
+        if enabled:
+            self._profiler = Profiler(self._words)
+        self._profiling = enabled
+        self._select_execute()
+
+    def set_tracing(self, size: int) -> None:
+        """trace the last size words executed, none when size is 0"""
+        self._tracer = Tracer(size) if size > 0 else None
+        self._select_execute()
+
+    def trace(self) -> list[TraceEntry]:
+        return [] if self._tracer is None else self._tracer.entries(self._words)
+
+    @property
+    def profiler(self) -> Profiler | None:
+        return self._profiler
+
+    def collapsed_stacks(self) -> str:
+        return '' if self._profiler is None else self._profiler.collapsed_stacks()
+
+    @property
+    def early_binding(self) -> bool:
+        return self._early_binding
 
     @property
     def base(self) -> int:
@@ -139,9 +395,12 @@ class _InnerInterpreter(State):
         return self._precision
 
     def set_precision(self, u_val: int) -> None:
+        """any precision computes on the stacks, up to 18 only 1.0 can be stored in a 64 bits heap cell"""
         if u_val < 0:
             raise ForthRuntimeError("Precision mist be a positive integer")
         self._precision = u_val
+        self.scale = 10 ** u_val
+        self.fp_format = f'{{}}{{}}.{{:0{u_val}d}}'
 
     def int_to_str(self, value: int) -> str:
         match self.base:
@@ -155,13 +414,10 @@ class _InnerInterpreter(State):
                 raise ValueError(f"Unsupported numeric basis: {self.base!r}")
 
     def word_to_int(self, word: WORD) -> int:
-        try:
-            return parse_to_fp(word, precision=self.precision)
-        except ValueError:
-            try:
-                return int(word, base=self.base)
-            except ValueError:
-                raise ForthCompilationError(f"Cannot parse {word!r} as a literal") from None
+        value: int | None = parse_number(word, self.base, self._precision)
+        if value is None:
+            raise ForthCompilationError(f"Cannot parse {word!r} as a literal")
+        return value
 
     def set_compile_flag(self) -> None:
         assert not self.is_compiling
@@ -184,36 +440,18 @@ class _InnerInterpreter(State):
     def reveal_created_word(self, word: WORD) -> None:
         self._last_created_word = word
 
-    @property
-    def past_end_of_code(self) -> bool:
-        return not self.instruction_pointer < len(self.current_defined_execution_token)
-
-    def _next_exec_token(self) -> NATIVE_XT:
-        func = cast(NATIVE_XT, self.current_execution_token)
-        self._set_instruction_pointer(self.instruction_pointer + 1)
-        return func
-
     @property
     def instruction_pointer(self) -> POINTER:
-        return cast(POINTER, self._execution_contextes[-1][1])
-
-    def _set_instruction_pointer(self, p: POINTER) -> None:
-        self._execution_contextes[-1][1] = p
+        return self._execution_contextes[-1].ip
 
     @property
     def current_defined_execution_token(self) -> DEFINED_XT:
-        return cast(DEFINED_XT, self._execution_contextes[-1][0])
+        return self._execution_contextes[-1].code
 
     @property
     def current_execution_token(self) -> XT_ATOM:
-        return cast(DEFINED_XT, self._execution_contextes[-1][0])[self.instruction_pointer]
-
-    def _set_execution_context(self, code: DEFINED_XT) -> None:
-        self._execution_contextes.append([code, 0])
-
-    def _reset_execution_context(self) -> tuple[DEFINED_XT, POINTER]:
-        code, p = cast(tuple[DEFINED_XT, POINTER], self._execution_contextes.pop())
-        return code, p
+        context = self._execution_contextes[-1]
+        return context.code[context.ip]
 
     def reset(self, heap_fence: POINTER) -> None:
         self.input_code = ''
@@ -221,7 +459,9 @@ class _InnerInterpreter(State):
         self.rs = []
         self.control_stack = []
         self._last_created_word = ''
-        self.next_heap_address = heap_fence
+        if self._tracer is not None:
+            self._tracer.clear()
+        self.next_heap_address = max(heap_fence, self._kept_heap_address)  # definitions refer to strings
 
         assert not self.is_compiling
         self._current_definition = DefinedExecutionToken()
@@ -229,11 +469,38 @@ class _InnerInterpreter(State):
 
 class Interpreter:
 
-    def __init__(self, extensions: Sequence[str] = EXTENSIONS) -> None:
-        self._state: _InnerInterpreter = _InnerInterpreter(parent=self)
+    def __init__(
+        self,
+        extensions: Sequence[str] = EXTENSIONS,
+        early_binding: bool = True,
+        optimize: bool = True,
+        inline_threshold: int = INLINE_THRESHOLD,
+        use_snapshot: bool = True,
+        heap_limit: int | None = None,
+        heap_file: str | Path | None = None,
+        output: Optional[TextIO | BinaryIO] = None,
+        native_code: bool = False
+    ) -> None:
+        """heap_file maps the heap onto a file, which keeps the cells stored once the interpreter is closed
+
+        Output goes to sys.stdout unless a text or binary output stream is given. With native_code, colon
+        definitions are translated to Python functions, those of the extensions excepted.
+        """
+        self._state: _InnerInterpreter = _InnerInterpreter(
+            parent=self,
+            output=output,
+            heap_limit=heap_limit,
+            heap_file=heap_file,
+            early_binding=early_binding,
+            optimize=optimize,
+            inline_threshold=inline_threshold
+        )
         self._heap_fence: int = 0
-        self._bootstrap(extensions)
+        self._state.load_image(
+            self._bootstrap_image(extensions, (early_binding, optimize, inline_threshold), use_snapshot)
+        )
         self._heap_fence = self._state.next_heap_address  # protect vars & cons defined in bootstrap
+        self._state.set_native_code(native_code)
 
     @property
     def data_stack(self) -> DATA_STACK:
@@ -241,7 +508,7 @@ class Interpreter:
 
     @property
     def heap(self) -> Sequence[LITERAL]:
-        return self._state.heap[self._heap_fence:][:]
+        return list(self._state.heap[self._heap_fence:])
 
     @property
     def return_stack(self) -> RETURN_STACK:
@@ -249,7 +516,40 @@ class Interpreter:
 
     @property
     def words(self) -> Sequence[WORD]:
-        return list(dictionary)
+        return list(self._state.execution_tokens)
+
+    def profile_on(self) -> None:
+        """profile words from now on, as PROFILE-ON does"""
+        self._state.set_profiling(True)
+
+    def profile_off(self) -> None:
+        self._state.set_profiling(False)
+
+    def profile(self) -> dict[WORD, WordProfile]:
+        """calls and time per word of the last profile"""
+        profiler: Profiler | None = self._state.profiler
+        return {} if profiler is None else profiler.words()
+
+    def trace_on(self, size: int = TRACE_SIZE) -> None:
+        """keep the last size words executed by a run, printed to stderr when an error ends it"""
+        self._state.set_tracing(size)
+
+    def trace_off(self) -> None:
+        self._state.set_tracing(0)
+
+    def trace(self) -> list[TraceEntry]:
+        """last words executed, oldest first"""
+        return self._state.trace()
+
+    def close(self) -> None:
+        """unmap the heap file, if any"""
+        self._state.close()
+
+    def __enter__(self) -> Interpreter:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
 
     def run(self, input_code: str = '', interactive: bool = False) -> None:
 
@@ -259,6 +559,34 @@ class Interpreter:
         if input_code:
             self._state.input_code = input_code
 
+        self._interpret_input()
+
+    def run_stream(self, stream: TextIO, interactive: bool = False, chunk_size: int = CHUNK_SIZE) -> None:
+        """interpret source pulled from stream by chunks as parsing goes on"""
+        self._state.reset(self._heap_fence)
+        self._state.interactive = interactive
+        self._state.input_source = InputSource(stream=stream, chunk_size=chunk_size)
+        self._interpret_input()
+
+    def load_file(self, path: str | Path, interactive: bool = False) -> None:
+        with io.open(path, mode='r', encoding='utf-8') as stream:
+            self.run_stream(stream, interactive=interactive)
+
+    def _interpret_input(self) -> None:
+        try:
+            self._interpret_words()
+        except (ForthCompilationError, StackUnderflowError, ForthRuntimeError) as condition:
+            self._state.output.flush()
+            trace: list[TraceEntry] = self._state.trace()
+            if trace:
+                sys.stderr.write(
+                    f"{condition}, last words executed:\n" + ''.join(f"  {entry}\n" for entry in trace)
+                )
+            raise
+        finally:
+            self._state.output.flush()
+
+    def _interpret_words(self) -> None:
         while True:
             try:
                 word: WORD = self._state.next_word()
@@ -272,25 +600,26 @@ class Interpreter:
                 ForthRuntimeError
             ) as condition:
                 if self._state.interactive:
-                    print(condition)
+                    self._state.output.write(f"{condition}\n")
                     continue
                 raise condition from None
 
     def interpret(self, word: WORD) -> None:
 
         # loop as in https://www.forth.org/lost-at-c.html [figure 1.]
-        found, immediate, xt = search_word(dictionary, word)
+        found, immediate, xt = search_word(self._state.execution_tokens, word)
         if found:
             assert xt is not None
             if immediate:
-                execute_immediate(self._state, xt)
+                self._state.execute_word(xt)
             elif self._state.is_compiling:  #  state entered with : and exited by ;
-                self._state.compile_to_current_definition(compile_address(word, xt))
+                self._state.compile_word(word, xt)
             else:
-                execute_immediate(self._state, xt)
+                self._state.execute_word(xt)
         else:
-            if self.is_literal(word):
-                action: DEFINED_XT = DefinedExecutionToken([xt_r_push, self._state.word_to_int(word)])
+            value: int | None = parse_number(word, self._state.base, self._state.precision)
+            if value is not None:
+                action: DEFINED_XT = DefinedExecutionToken([xt_r_push, value])
                 if self._state.is_compiling:
                     self._state.compile_to_current_definition(action)
                 else:
@@ -303,22 +632,30 @@ class Interpreter:
 
     def is_literal(self, word: str) -> bool:
         try:
-            int(word, base=self._state.base)
-            return True
-        except ValueError as exc:
-            if 'invalid literal' in str(exc):
-                # maybe it's a decimal a.k.a. fixed point literal
-                try:
-                    float(word)
-                    return True
-                except ValueError:
-                    pass
-        return False
+            return parse_number(word, self._state.base, self._state.precision) is not None
+        except ForthCompilationError:  # a number the base or range refuses, unless longer than any literal
+            return len(word) <= MAX_DIGITS
 
     def _bootstrap(self, extensions: Sequence[str]) -> None:
         self._state.interactive = False
         for extension in extensions:
-            extension_path = Path(__file__).parent / extension
-            with extension_path.open(mode='r') as stream:
-                code: str = ' \n'.join(stream.readlines())
-                self.run(input_code=code)
+            self.load_file(Path(__file__).parent / extension)
+
+    def _bootstrap_image(self, extensions: Sequence[str], options: tuple[bool, bool, int], use_snapshot: bool) -> Snapshot:
+        """state left by the bootstrap, shared by the interpreters of a process and cached on disk"""
+        if not use_snapshot:
+            self._bootstrap(extensions)
+            return self._state.image()
+
+        image: Snapshot | None = _BOOTSTRAP_IMAGES.get((tuple(extensions), options))
+        if image is not None:
+            return image
+
+        key: str = snapshot_key([Path(__file__).parent / extension for extension in extensions], options)
+        image = load_snapshot(key)
+        if image is None:
+            self._bootstrap(extensions)
+            image = self._state.image()
+            save_snapshot(key, image)
+        _BOOTSTRAP_IMAGES[(tuple(extensions), options)] = image
+        return image
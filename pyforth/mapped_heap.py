@@ -0,0 +1,42 @@
+from __future__ import annotations
+import mmap
+import os
+from pathlib import Path
+
+from .runtime.heap import CELL_BYTES, CELL_TYPECODE
+
+
+class MappedHeap:
+    """Heap cells stored in a file mapped in memory
+
+    Cells are read and written in place, hence what is stored persists
+    once the interpreter is gone and is seen by every process mapping
+    the same file. An existing file is mapped as a whole.
+    """
+
+    def __init__(self, path: str | Path, size: int) -> None:
+        self._file = open(path, 'r+b' if os.path.exists(path) else 'w+b')
+        self._map: mmap.mmap | None = None
+        self.cells: memoryview = memoryview(b'')
+        self._remap(max(size, os.fstat(self._file.fileno()).st_size // CELL_BYTES))
+
+    def _remap(self, size: int) -> None:
+        self.cells.release()  # the mapping cannot be closed while it is viewed
+        if self._map is not None:
+            self._map.close()
+        if os.fstat(self._file.fileno()).st_size < size * CELL_BYTES:
+            os.ftruncate(self._file.fileno(), size * CELL_BYTES)  # new cells are zeroed
+        self._map = mmap.mmap(self._file.fileno(), size * CELL_BYTES)
+        self.cells = memoryview(self._map).cast(CELL_TYPECODE)
+
+    def resize(self, size: int) -> memoryview:
+        """cells of a heap grown to size, those previously returned must no longer be used"""
+        self._remap(size)
+        return self.cells
+
+    def close(self) -> None:
+        self.cells.release()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
@@ -0,0 +1,403 @@
+"""Colon definitions translated to Python functions
+
+A definition whose jumps come from IF ELSE THEN, BEGIN loops, DO loops,
+EXIT and LEAVE is turned into the source of a single Python function,
+which becomes its native xt. Jumps become if, while, break, continue and
+return statements. Cells pushed by words of known stack effect are kept
+in local variables until a word needs them on the data stack, and DO
+loops not touching the return stack keep their index in a local too.
+A definition calling itself calls its function directly. A native runs
+as a single word, profiles, traces and stack underflows name it rather
+than the words it is made of.
+
+Definitions using other constructs (DOES>, jumps not nested as control
+structures compile them) stay threaded.
+"""
+from __future__ import annotations
+import re
+from typing import Any, Callable, NamedTuple, Optional, cast
+
+from .core import DEFINED_XT, NATIVE_XT, POINTER, WORD
+from .optimizer import INSTRUCTION, decode, operand_kind
+from .runtime import arithmetic, comparison, doloop, fixed_point, heap, logical, primitives, stacks
+
+
+class Unsupported(Exception):
+    """the definition cannot be translated, it stays threaded"""
+
+
+# words of known stack effect: number of cells popped, and Python expression pushed or statement run
+_EXPRESSIONS: dict[NATIVE_XT, tuple[int, str]] = {
+    arithmetic.xt_r_add: (2, '{0} + {1}'),
+    arithmetic.xt_r_sub: (2, '{0} - {1}'),
+    arithmetic.xt_r_mul: (2, '{0} * {1}'),
+    arithmetic.xt_r_div: (2, '{0} // {1}'),
+    arithmetic.xt_r_mod: (2, '{0} % {1}'),
+    arithmetic.xt_r_lshift: (2, '{0} << {1}'),
+    arithmetic.xt_r_rshift: (2, '{0} >> {1}'),
+    arithmetic.xt_r_one_plus: (1, '{0} + 1'),
+    arithmetic.xt_r_one_minus: (1, '{0} - 1'),
+    arithmetic.xt_r_two_mul: (1, '{0} << 1'),
+    arithmetic.xt_r_two_div: (1, '{0} >> 1'),
+    arithmetic.xt_r_negate: (1, '-{0}'),
+    arithmetic.xt_r_abs: (1, 'abs({0})'),
+    arithmetic.xt_r_min: (2, 'min({0}, {1})'),
+    arithmetic.xt_r_max: (2, 'max({0}, {1})'),
+    arithmetic.xt_r_mul_div: (3, '{0} * {1} // {2}'),
+    comparison.xt_r_eq: (2, '-({0} == {1})'),
+    comparison.xt_r_ne: (2, '-({0} != {1})'),
+    comparison.xt_r_lt: (2, '-({0} < {1})'),
+    comparison.xt_r_gt: (2, '-({0} > {1})'),
+    comparison.xt_r_le: (2, '-({0} <= {1})'),
+    comparison.xt_r_ge: (2, '-({0} >= {1})'),
+    comparison.xt_r_zero_eq: (1, '-({0} == 0)'),
+    comparison.xt_r_zero_ne: (1, '-({0} != 0)'),
+    comparison.xt_r_zero_lt: (1, '-({0} < 0)'),
+    comparison.xt_r_zero_gt: (1, '-({0} > 0)'),
+    logical.xt_r_and: (2, '{0} & {1}'),
+    logical.xt_r_or: (2, '{0} | {1}'),
+    logical.xt_r_xor: (2, '{0} ^ {1}'),
+    logical.xt_r_invert: (1, '~{0}'),
+    fixed_point.xt_r_f_mul: (2, '{0} * {1} // state.scale'),
+    fixed_point.xt_r_f_div: (2, '{0} * state.scale // {1}'),
+    heap.xt_r_at: (1, 'state.heap[_check_address(state, {0})]'),
+    stacks.xt_r_from_rs: (0, 'rs.pop()'),
+    stacks.xt_r_rs_at: (0, 'rs[-1]'),
+}
+_STATEMENTS: dict[NATIVE_XT, tuple[int, str]] = {
+    heap.xt_r_bang: (2, '_store(state, _check_address(state, {1}), {0})'),
+    stacks.xt_r_to_rs: (1, 'rs.append({0})'),
+    stacks.xt_r_2to_rs: (2, 'rs += ({0}, {1})'),
+}
+# words moving cells: number of cells popped, and which of them are pushed back
+_SHUFFLES: dict[NATIVE_XT, tuple[int, tuple[int, ...]]] = {
+    stacks.xt_r_dup: (1, (0, 0)),
+    stacks.xt_r_drop: (1, ()),
+    stacks.xt_r_swap: (2, (1, 0)),
+    stacks.xt_r_over: (2, (0, 1, 0)),
+    stacks.xt_r_rot: (3, (1, 2, 0)),
+    stacks.xt_r_nip: (2, (1,)),
+    stacks.xt_r_tuck: (2, (1, 0, 1)),
+    stacks.xt_r_2dup: (2, (0, 1, 0, 1)),
+    stacks.xt_r_2drop: (2, ()),
+    stacks.xt_r_2swap: (4, (2, 3, 0, 1)),
+    stacks.xt_r_2over: (4, (0, 1, 2, 3, 0, 1)),
+}
+_RETURN_STACK_WORDS: frozenset[NATIVE_XT] = frozenset({
+    stacks.xt_r_from_rs, stacks.xt_r_rs_at, stacks.xt_r_to_rs, stacks.xt_r_2to_rs,
+})
+_LOOP_INDEXES: dict[NATIVE_XT, int] = {doloop.xt_r_i: 1, doloop.xt_r_j: 2, doloop.xt_r_k: 3}
+_CONDITIONAL_JUMPS: dict[NATIVE_XT, str] = {  # condition under which the jump is not taken
+    primitives.xt_r_jz: '{0}',
+    primitives.xt_r_eq_jz: '{0} == {1}',
+    primitives.xt_r_lt_jz: '{0} < {1}',
+    primitives.xt_r_gt_jz: '{0} > {1}',
+}
+_JUMPS: frozenset[NATIVE_XT] = frozenset({primitives.xt_r_jmp, *_CONDITIONAL_JUMPS})
+_DO: frozenset[NATIVE_XT] = frozenset({doloop.xt_r_do, doloop.xt_r_question_do})
+_LOOP: frozenset[NATIVE_XT] = frozenset({doloop.xt_r_loop, doloop.xt_r_plus_loop})
+# words translated whatever they are given, any other one is called and sees the return stack as it is
+_TRANSLATED: frozenset[NATIVE_XT] = frozenset({
+    *_EXPRESSIONS, *_STATEMENTS, *_SHUFFLES, *_LOOP_INDEXES, *_JUMPS, *_DO, *_LOOP,
+    primitives.xt_r_push, primitives.xt_r_push_add,
+})
+
+
+class _Loop(NamedTuple):
+    head: int  # first instruction of the body
+    exit: int  # instruction a break goes to
+    do: bool
+    index: str  # local holding the index of a DO loop, '' when kept on the return stack
+    limit: str
+
+
+class _Translation:
+    """source of a function running the instructions of a definition"""
+
+    def __init__(self, name: WORD, instructions: list[INSTRUCTION], size: POINTER, function: str) -> None:
+        self.name: WORD = name
+        self.function: str = function
+        self.instructions: list[INSTRUCTION] = instructions
+        positions: dict[POINTER, int] = {address: index for index, (address, _, _) in enumerate(instructions)}
+        positions[size] = len(instructions)
+        self.targets: dict[int, int] = {}  # jump instruction -> instruction jumped to
+        self.back_edges: dict[int, list[int]] = {}
+        for index, (_, xt, operand) in enumerate(instructions):
+            if operand_kind(xt) == 'jump':
+                if operand not in positions:
+                    raise Unsupported(f"jump into an operand at {index}")
+                target: int = positions[cast(POINTER, operand)]
+                self.targets[index] = target
+                if xt in _JUMPS and target <= index:
+                    self.back_edges.setdefault(target, []).append(index)
+        self.lines: list[str] = []
+        self.level: int = 1
+        self.stack: list[str] = []  # cells pushed and not yet on the data stack, as Python expressions
+        self.loops: list[_Loop] = []
+        self.locals: int = 0
+        self.constants: dict[str, Any] = {}
+
+    def emit(self, line: str) -> None:
+        self.lines.append('    ' * self.level + line)
+
+    def local(self, prefix: str = 't') -> str:
+        self.locals += 1
+        return f'{prefix}{self.locals}'
+
+    def constant(self, value: Any) -> str:
+        if type(value) is int:
+            return repr(value) if value >= 0 else f'({value!r})'
+        name: str = f'c{len(self.constants)}'
+        self.constants[name] = value
+        return name
+
+    def push(self, expression: str) -> None:
+        """the value of expression now pushed"""
+        target: str = self.local()
+        self.emit(f'{target} = {expression}')
+        self.stack.append(target)
+
+    def pop(self) -> str:
+        return self.stack.pop() if self.stack else self._pop_data_stack()
+
+    def _pop_data_stack(self) -> str:
+        target: str = self.local()
+        self.emit(f'{target} = ds.pop()')
+        return target
+
+    def pops(self, count: int) -> list[str]:
+        """cells popped, deepest first"""
+        return [self.pop() for _ in range(count)][::-1]
+
+    def flush(self) -> None:
+        """cells kept in locals moved to the data stack, as words called and control flow joins expect"""
+        if len(self.stack) == 1:
+            self.emit(f'ds.append({self.stack[0]})')
+        elif self.stack:
+            self.emit(f'ds += ({", ".join(self.stack)})')
+        self.stack = []
+
+    def block(
+        self, start: int, end: int, head: Optional[int] = None, close: Optional[Callable[[], None]] = None
+    ) -> None:
+        """instructions from start to end then close, the loop at head being translated already"""
+        emitted: int = len(self.lines)
+        index: int = start
+        while index < end:
+            if index != head and index in self.back_edges:
+                edges: list[int] = [edge for edge in self.back_edges[index] if edge < end]
+                if edges:
+                    index = self.begin_loop(index, max(edges))
+                    continue
+            index = self.instruction(index, end)
+        if close is not None:
+            close()
+        self.flush()
+        if len(self.lines) == emitted:
+            self.emit('pass')
+
+    def instruction(self, index: int, end: int) -> int:
+        """translate one instruction, or the structure it starts, and return the next instruction"""
+        _, xt, operand = self.instructions[index]
+        if xt in _EXPRESSIONS:
+            count, expression = _EXPRESSIONS[xt]
+            self.push(expression.format(*self.pops(count)))
+        elif xt in _STATEMENTS:
+            count, statement = _STATEMENTS[xt]
+            self.emit(statement.format(*self.pops(count)))
+        elif xt in _SHUFFLES:
+            count, pushed = _SHUFFLES[xt]
+            cells: list[str] = self.pops(count)
+            self.stack += [cells[cell] for cell in pushed]
+        elif xt is primitives.xt_r_push:
+            self.stack.append(self.constant(operand))
+        elif xt is primitives.xt_r_push_add:
+            self.push(f'{self.pop()} + {self.constant(operand)}')
+        elif xt in _LOOP_INDEXES:
+            self.stack.append(self.loop_index(_LOOP_INDEXES[xt]))
+        elif xt in _DO:
+            return self.do_loop(index, end)
+        elif xt in _JUMPS:
+            return self.jump(index, end)
+        elif xt is primitives.xt_r_call:
+            self.flush()
+            self.emit(f'state.execute({self.constant(operand)})')
+        elif xt is primitives.xt_r_run:
+            self.flush()
+            if operand == self.name:
+                self.emit(f'{self.function}(state)')
+            else:
+                self.emit(f'_run_word(state, {self.constant(operand)})')
+        elif operand_kind(xt) is None and xt is not primitives.xt_r_does:
+            self.flush()
+            self.emit(f'{self.constant(xt)}(state)')
+        else:
+            raise Unsupported(f"{getattr(xt, '__name__', xt)} at {index}")
+        return index + 1
+
+    def loop_index(self, level: int) -> str:
+        do_loops: list[_Loop] = [loop for loop in self.loops if loop.do]
+        if len(do_loops) < level:
+            raise Unsupported("loop index outside of its loop")
+        loop: _Loop = do_loops[-level]
+        if loop.index:
+            return loop.index
+        depth: int = 1 + 2 * sum(1 for inner in do_loops[len(do_loops) - level + 1:] if not inner.index)
+        target: str = self.local()
+        self.emit(f'{target} = rs[-{depth}]')
+        return target
+
+    def condition(self, xt: NATIVE_XT) -> str:
+        cells: list[str] = self.pops(2 if xt is not primitives.xt_r_jz else 1)
+        return _CONDITIONAL_JUMPS[xt].format(*cells)
+
+    def jump(self, index: int, end: int) -> int:
+        _, xt, _ = self.instructions[index]
+        target: int = self.targets[index]
+        if xt is not primitives.xt_r_jmp and index < target <= end:
+            return self.if_then(index, target, end)
+
+        condition: str = '' if xt is primitives.xt_r_jmp else self.condition(xt)
+        self.flush()
+        if self.loops and target == self.loops[-1].exit:
+            statement = 'break'
+        elif self.loops and target == self.loops[-1].head and not self.loops[-1].do:
+            statement = 'continue'
+        elif target == len(self.instructions):
+            statement = 'return'
+        else:
+            raise Unsupported(f"jump from {index} to {target}")
+        self.emit(f'if not ({condition}): {statement}' if condition else statement)
+        return index + 1
+
+    def if_then(self, index: int, target: int, end: int) -> int:
+        _, xt, _ = self.instructions[index]
+        condition: str = self.condition(xt)
+        self.flush()
+        then_end, else_end = target, target
+        if target - 1 > index:
+            _, last_xt, _ = self.instructions[target - 1]
+            if last_xt is primitives.xt_r_jmp and target <= self.targets[target - 1] <= end:
+                then_end, else_end = target - 1, self.targets[target - 1]
+        self.emit(f'if {condition}:')
+        self.level += 1
+        self.block(index + 1, then_end)
+        self.level -= 1
+        if else_end > target:
+            self.emit('else:')
+            self.level += 1
+            self.block(target, else_end)
+            self.level -= 1
+        return else_end
+
+    def begin_loop(self, head: int, edge: int) -> int:
+        """loop from head back from edge, it exits after edge"""
+        self.flush()
+        self.emit('while True:')
+        self.level += 1
+        _, xt, _ = self.instructions[edge]
+
+        def until() -> None:
+            condition: str = self.condition(xt)
+            self.flush()
+            self.emit(f'if {condition}: break')
+
+        self.loops.append(_Loop(head, edge + 1, False, '', ''))
+        self.block(head, edge, head=head, close=None if xt is primitives.xt_r_jmp else until)
+        self.loops.pop()
+        self.level -= 1
+        return edge + 1
+
+    def do_loop(self, index: int, end: int) -> int:
+        _, xt, _ = self.instructions[index]
+        body: int = index + 1
+        edge: int = next(
+            (edge for edge in range(body, end) if self.instructions[edge][1] in _LOOP and self.targets[edge] == body),
+            end
+        )
+        unloop: int = edge + 1
+        if unloop >= end or self.instructions[unloop][1] is not doloop.xt_r_unloop:
+            raise Unsupported(f"DO at {index} without LOOP")
+        if xt is doloop.xt_r_question_do and self.targets[index] != unloop:
+            raise Unsupported(f"?DO at {index} not skipping its loop")
+
+        start, limit = self.pop(), self.pop()
+        self.flush()
+        local: bool = all(self.keeps_return_stack(position) for position in range(body, edge))
+        if local:
+            frame = _Loop(body, unloop, True, self.local('i'), self.local('limit'))
+            self.emit(f'{frame.index}, {frame.limit} = {start}, {limit}')
+            skip, step = f'{frame.index} == {frame.limit}', f'{frame.index} += {{0}}'
+            index_value, limit_value = frame.index, frame.limit
+        else:
+            frame = _Loop(body, unloop, True, '', '')
+            self.emit(f'rs += ({limit}, {start})')
+            skip, step = 'rs[-1] == rs[-2]', 'rs[-1] += {0}'
+            index_value, limit_value = 'rs[-1]', 'rs[-2]'
+
+        if xt is doloop.xt_r_question_do:
+            self.emit(f'if not ({skip}):')
+            self.level += 1
+
+        def loop() -> None:
+            if self.instructions[edge][1] is doloop.xt_r_loop:
+                self.flush()
+                self.emit(step.format(1))
+                self.emit(f'if {index_value} == {limit_value}: break')
+            else:  # +LOOP ends when the index crosses the boundary between limit-1 and limit
+                increment: str = self.pop()
+                self.flush()
+                before: str = self.local('before')
+                self.emit(f'{before} = {index_value} - {limit_value}')
+                self.emit(step.format(increment))
+                self.emit(f'if ({before} < 0) != ({before} + {increment} < 0): break')
+
+        self.emit('while True:')
+        self.level += 1
+        self.loops.append(frame)
+        self.block(body, edge, close=loop)
+        self.loops.pop()
+        self.level -= 1 if xt is doloop.xt_r_do else 2
+        if not local:
+            self.emit('del rs[-2:]')
+        return unloop + 1
+
+    def keeps_return_stack(self, position: int) -> bool:
+        """true if the instruction neither uses the return stack nor calls a word that could"""
+        _, xt, _ = self.instructions[position]
+        if xt is doloop.xt_r_unloop:  # closing a nested loop, else an UNLOOP
+            return position - 1 in self.targets and self.instructions[position - 1][1] in _LOOP
+        return xt in _TRANSLATED and xt not in _RETURN_STACK_WORDS
+
+    def source(self) -> str:
+        self.block(0, len(self.instructions))
+        body: str = '\n'.join(self.lines)
+        parameters: str = ''.join(
+            f', {name}={name}' for name in ('_check_address', '_store', '_run_word', *self.constants) if name in body
+        )
+        return f'def {self.function}(state{parameters}):\n    ds, rs = state.ds, state.rs\n{body}'
+
+
+def compile_native(name: WORD, code: DEFINED_XT) -> Optional[NATIVE_XT]:
+    """function running code, None if code cannot be translated"""
+    instructions: list[INSTRUCTION] | None = decode(code)
+    if not instructions:
+        return None
+    function: str = 'forth_' + re.sub(r'\W', '_', name)
+    try:
+        translation = _Translation(name, instructions, len(code), function)
+        source: str = translation.source()
+        namespace: dict[str, Any] = {
+            '_check_address': heap.check_address,
+            '_store': heap.store,
+            '_run_word': primitives.run_word,
+            **translation.constants
+        }
+        exec(compile(source, f'<forth {name}>', 'exec'), namespace)
+    except (Unsupported, SyntaxError, RecursionError):  # SyntaxError for too deeply nested blocks
+        return None
+    native: NATIVE_XT = namespace[function]
+    setattr(native, 'name', name)
+    setattr(native, 'definition', code)  # threaded code it replaces
+    setattr(native, 'source', source)
+    return native
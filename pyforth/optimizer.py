@@ -0,0 +1,141 @@
+from __future__ import annotations
+from typing import Callable, Optional, Sequence, cast
+
+from .core import DEFINED_XT, NATIVE_XT, POINTER, XT_ATOM, DefinedExecutionToken
+from .runtime import arithmetic, comparison, primitives
+
+
+# (address, xt, operand) with operand set to None for xt without inline operand
+INSTRUCTION = tuple[POINTER, NATIVE_XT, Optional[XT_ATOM]]
+PATTERN = Callable[[Sequence[INSTRUCTION]], Optional[list[XT_ATOM]]]
+
+
+def operand_kind(xt: XT_ATOM) -> str | None:
+    return getattr(xt, '_operand', None)
+
+
+def decode(code: DEFINED_XT) -> list[INSTRUCTION] | None:
+    """split a definition into instructions, None if it cannot be safely done"""
+    instructions: list[INSTRUCTION] = []
+    address: POINTER = 0
+    while address < len(code):
+        xt = code[address]
+        if not callable(xt) or xt is primitives.xt_r_does:  # DOES> owns the rest of the code
+            return None
+        if operand_kind(xt) is None:
+            instructions.append((address, cast(NATIVE_XT, xt), None))
+            address += 1
+        elif address + 1 < len(code):
+            instructions.append((address, cast(NATIVE_XT, xt), code[address + 1]))
+            address += 2
+        else:
+            return None
+    return instructions
+
+
+def encode(instructions: Sequence[INSTRUCTION]) -> list[XT_ATOM]:
+    code: list[XT_ATOM] = []
+    for _, xt, operand in instructions:
+        code.append(xt)
+        if operand_kind(xt) is not None:
+            code.append(cast(XT_ATOM, operand))
+    return code
+
+
+def _sequence(*xts: NATIVE_XT) -> Callable[[Sequence[INSTRUCTION]], bool]:
+    def matches(window: Sequence[INSTRUCTION]) -> bool:
+        return len(window) >= len(xts) and all(
+            instruction[1] is xt for instruction, xt in zip(window, xts)
+        )
+    return matches
+
+
+_is_push_add = _sequence(primitives.xt_r_push, arithmetic.xt_r_add)
+_is_push_sub = _sequence(primitives.xt_r_push, arithmetic.xt_r_sub)
+_COMPARE_AND_BRANCH: dict[NATIVE_XT, NATIVE_XT] = {
+    comparison.xt_r_eq: primitives.xt_r_eq_jz,
+    comparison.xt_r_lt: primitives.xt_r_lt_jz,
+    comparison.xt_r_gt: primitives.xt_r_gt_jz,
+}
+
+
+def _push_literal_add(window: Sequence[INSTRUCTION]) -> list[XT_ATOM] | None:
+    # n + and n -
+    literal = window[0][2]
+    if not isinstance(literal, int) or isinstance(literal, bool):
+        return None
+    if _is_push_add(window):
+        return [primitives.xt_r_push_add, literal]
+    if _is_push_sub(window):
+        return [primitives.xt_r_push_add, -literal]
+    return None
+
+
+def _compare_and_branch(window: Sequence[INSTRUCTION]) -> list[XT_ATOM] | None:
+    # = jz, < jz and > jz
+    if len(window) >= 2 and window[1][1] is primitives.xt_r_jz and window[0][1] in _COMPARE_AND_BRANCH:
+        return [_COMPARE_AND_BRANCH[window[0][1]], cast(XT_ATOM, window[1][2])]
+    return None
+
+
+PATTERNS: tuple[tuple[int, PATTERN], ...] = (  # longest first
+    (2, _push_literal_add),
+    (2, _compare_and_branch),
+)
+
+
+def inline(code: DEFINED_XT, offset: POINTER, threshold: int) -> list[XT_ATOM] | None:
+    """copy of a short definition to compile at offset, None if it must be called instead
+
+    Definitions looking words up at runtime (forward references, RECURSE) are
+    never inlined. Jump addresses are rebased on offset.
+    """
+    if not code or len(code) > threshold:
+        return None
+    instructions: list[INSTRUCTION] | None = decode(code)
+    if instructions is None or any(xt is primitives.xt_r_run for _, xt, _ in instructions):
+        return None
+    return encode([
+        (address, xt, cast(POINTER, operand) + offset if operand_kind(xt) == 'jump' else operand)
+        for address, xt, operand in instructions
+    ])
+
+
+def optimize(code: DEFINED_XT) -> DEFINED_XT:
+    """fuse common sequences of a definition into superinstructions
+
+    Sequences are only fused when no jump lands inside them, then every
+    jump address is relocated to the optimized code.
+    """
+    instructions: list[INSTRUCTION] | None = decode(code)
+    if instructions is None:
+        return code
+
+    targets: set[POINTER] = {
+        cast(POINTER, operand) for _, xt, operand in instructions if operand_kind(xt) == 'jump'
+    }
+    relocations: dict[POINTER, POINTER] = {}
+    optimized: list[XT_ATOM] = []
+    index: int = 0
+    while index < len(instructions):
+        for length, pattern in PATTERNS:
+            window = instructions[index:index + length]
+            if any(address in targets for address, _, _ in window[1:]):
+                continue
+            fused: list[XT_ATOM] | None = pattern(window)
+            if fused is not None:
+                break
+        else:
+            length, fused = 1, encode(instructions[index:index + 1])
+        relocations[instructions[index][0]] = len(optimized)
+        optimized += fused
+        index += length
+    relocations[len(code)] = len(optimized)
+
+    relocated: list[INSTRUCTION] | None = decode(DefinedExecutionToken(optimized))
+    assert relocated is not None
+    for address, xt, operand in relocated:
+        if operand_kind(xt) == 'jump':
+            optimized[address + 1] = relocations[cast(POINTER, operand)]
+
+    return DefinedExecutionToken(optimized)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+from collections import defaultdict
+from collections.abc import Mapping
+from typing import NamedTuple
+
+from .core import NATIVE_XT, WORD, XT
+from .runtime import primitives
+
+
+# calling a definition through these, the definition is profiled instead
+TRANSPARENT_XTS: frozenset[NATIVE_XT] = frozenset({primitives.xt_r_call, primitives.xt_r_run})
+
+
+class WordProfile(NamedTuple):
+    calls: int
+    inclusive: float  # seconds, callees included, recursive calls counted once
+    exclusive: float  # seconds, callees excluded
+
+
+class Profiler:
+    """Calls and time spent per word, and per call path
+
+    Words are named after the dictionary. A native xt missing from it, a
+    primitive compiled by a control structure for instance, is named after
+    its Python function. Inlined definitions are profiled as part of their
+    caller.
+    """
+
+    def __init__(self, words: Mapping[WORD, XT]) -> None:
+        self._names: dict[int, WORD] = {}
+        for word, xt in words.items():
+            self._names.setdefault(id(xt), word)
+        self._words: dict[WORD, list[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+        self._stacks: dict[tuple[WORD, ...], float] = defaultdict(float)
+        self._path: list[WORD] = []
+        self._callees: list[float] = []  # time spent in callees, per word of the path
+
+    def name(self, xt: XT) -> WORD:
+        name: WORD | None = self._names.get(id(xt))
+        if name is None:
+            name = getattr(xt, 'name', '') or getattr(xt, '__name__', '') or '?'
+            self._names[id(xt)] = name  # xts profiled are kept alive by the code calling them
+        return name
+
+    def enter(self, word: WORD) -> None:
+        self._path.append(word)
+        self._callees.append(0.0)
+
+    def leave(self, elapsed: float) -> None:
+        word: WORD = self._path[-1]
+        exclusive: float = elapsed - self._callees.pop()
+        stats: list[float] = self._words[word]
+        stats[0] += 1
+        stats[2] += exclusive
+        if word not in self._path[:-1]:
+            stats[1] += elapsed
+        self._stacks[tuple(self._path)] += exclusive
+        self._path.pop()
+        if self._callees:
+            self._callees[-1] += elapsed
+
+    def words(self) -> dict[WORD, WordProfile]:
+        return {
+            word: WordProfile(int(calls), inclusive, exclusive)
+            for word, (calls, inclusive, exclusive) in self._words.items()
+        }
+
+    def collapsed_stacks(self) -> str:
+        """one line per call path with its exclusive time in microseconds, as flamegraph.pl reads them"""
+        return ''.join(
+            f"{';'.join(path)} {round(seconds * 1_000_000)}\n"
+            for path, seconds in sorted(self._stacks.items())
+        )
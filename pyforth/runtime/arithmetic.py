@@ -1,58 +1,119 @@
-from pyforth.core import STACK
-from .utils import pure_stack_operation, intercept_stack_error
+from pyforth.core import State
 
 
-@intercept_stack_error
-@pure_stack_operation
-def xt_r_add(ds: STACK) -> None:
+def xt_r_add(state: State) -> None:
+    ds = state.ds
     b = ds.pop()
     a = ds.pop()
     ds.append(a + b)
 
 
-@intercept_stack_error
-@pure_stack_operation
-def xt_r_mul(ds: STACK) -> None:
+def xt_r_mul(state: State) -> None:
+    ds = state.ds
     b = ds.pop()
     a = ds.pop()
     ds.append(a * b)
 
 
-@intercept_stack_error
-@pure_stack_operation
-def xt_r_sub(ds: STACK) -> None:
+def xt_r_sub(state: State) -> None:
+    ds = state.ds
     b = ds.pop()
     a = ds.pop()
     ds.append(a - b)
 
 
-@intercept_stack_error
-@pure_stack_operation
-def xt_r_div(ds: STACK) -> None:
+def xt_r_div(state: State) -> None:
+    ds = state.ds
     b = ds.pop()
     a = ds.pop()
     ds.append(a // b)
 
 
-@intercept_stack_error
-@pure_stack_operation
-def xt_r_mod(ds: STACK) -> None:
+def xt_r_mod(state: State) -> None:
+    ds = state.ds
     b = ds.pop()
     a = ds.pop()
     ds.append(a % b)
 
 
-@intercept_stack_error
-@pure_stack_operation
-def xt_r_rshift(ds: STACK) -> None:
+def xt_r_rshift(state: State) -> None:
+    ds = state.ds
     u = ds.pop()
     v = ds.pop()
     ds.append(v >> u)
 
 
-@intercept_stack_error
-@pure_stack_operation
-def xt_r_lshift(ds: STACK) -> None:
+def xt_r_lshift(state: State) -> None:
+    ds = state.ds
     u = ds.pop()
     v = ds.pop()
     ds.append(v << u)
+
+
+def xt_r_one_plus(state: State) -> None:
+    ds = state.ds
+    ds.append(ds.pop() + 1)
+
+
+def xt_r_one_minus(state: State) -> None:
+    ds = state.ds
+    ds.append(ds.pop() - 1)
+
+
+def xt_r_two_mul(state: State) -> None:
+    ds = state.ds
+    ds.append(ds.pop() << 1)
+
+
+def xt_r_two_div(state: State) -> None:
+    ds = state.ds
+    ds.append(ds.pop() >> 1)
+
+
+def xt_r_negate(state: State) -> None:
+    ds = state.ds
+    ds.append(-ds.pop())
+
+
+def xt_r_abs(state: State) -> None:
+    ds = state.ds
+    ds.append(abs(ds.pop()))
+
+
+def xt_r_min(state: State) -> None:
+    ds = state.ds
+    b = ds.pop()
+    a = ds.pop()
+    ds.append(min(a, b))
+
+
+def xt_r_max(state: State) -> None:
+    ds = state.ds
+    b = ds.pop()
+    a = ds.pop()
+    ds.append(max(a, b))
+
+
+def xt_r_divmod(state: State) -> None:
+    ds = state.ds
+    b = ds.pop()
+    a = ds.pop()
+    quot, rem = divmod(a, b)
+    ds += [rem, quot]
+
+
+def xt_r_mul_div(state: State) -> None:
+    ds = state.ds
+    c = ds.pop()
+    b = ds.pop()
+    a = ds.pop()
+    ds.append(a * b // c)
+
+
+def xt_r_mul_divmod(state: State) -> None:
+    ds = state.ds
+    c = ds.pop()
+    b = ds.pop()
+    a = ds.pop()
+    quot, rem = divmod(a * b, c)
+    ds += [rem, quot]
@@ -0,0 +1,129 @@
+"""Words operating on whole heap arrays at once
+
+Arrays are given as MOVE takes its regions: ( addr1 addr2 u ) for two
+of them, ( addr u ) for one. NumPy computes on the heap in place when it
+is installed and the results fit in cells, Python integers otherwise.
+F-prefixed words take their operands as fixed-point numbers.
+"""
+from array import array
+from operator import mul
+from typing import Any, Final, Iterable
+
+from pyforth.core import ForthRuntimeError, State
+from pyforth.runtime.heap import CELL_TYPECODE, check_region
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+CELL_MAX: Final[int] = 2 ** 63 - 1
+NUMPY_THRESHOLD: Final[int] = 64  # below this many cells, NumPy costs more than it saves
+
+
+def _cells(state: State, region: slice) -> Any:
+    """numpy view of the heap region, to drop before the heap grows"""
+    return np.frombuffer(state.heap, dtype=np.int64)[region]
+
+
+def _bound(view: Any) -> int:
+    """largest magnitude of the cells viewed"""
+    return max(-int(view.min()), int(view.max()))
+
+
+def _vectorized(u: int) -> bool:
+    return np is not None and u >= NUMPY_THRESHOLD
+
+
+def _store(state: State, region: slice, values: Iterable[int]) -> None:
+    try:
+        state.heap[region] = array(CELL_TYPECODE, values)
+    except (OverflowError, TypeError, ValueError):
+        raise ForthRuntimeError("Value does not fit in a cell") from None
+
+
+def _two_regions(state: State) -> tuple[slice, slice]:
+    u, addr2, addr1 = state.ds.pop(), state.ds.pop(), state.ds.pop()
+    return check_region(state, addr1, u), check_region(state, addr2, u)
+
+
+def _sum(state: State, region: slice) -> int:
+    if _vectorized(region.stop - region.start):
+        cells = _cells(state, region)
+        if _bound(cells) * len(cells) <= CELL_MAX:
+            return int(cells.sum())
+    return sum(state.heap[region])
+
+
+def _dot(state: State, region1: slice, region2: slice) -> int:
+    if _vectorized(region1.stop - region1.start):
+        cells1, cells2 = _cells(state, region1), _cells(state, region2)
+        if _bound(cells1) * _bound(cells2) * len(cells1) <= CELL_MAX:
+            return int(cells1 @ cells2)
+    return sum(map(mul, state.heap[region1], state.heap[region2]))
+
+
+def _scale(state: State, region: slice, factor: int, scale: int) -> None:
+    """cells times factor / scale, rounded down as by f*"""
+    if _vectorized(region.stop - region.start):
+        cells = _cells(state, region)
+        if max(_bound(cells), 1) * abs(factor) <= CELL_MAX and scale <= CELL_MAX:
+            cells *= factor
+            if scale != 1:
+                cells //= scale
+            return
+        del cells
+    _store(state, region, [cell * factor // scale for cell in state.heap[region]])
+
+
+def _combine(state: State, region1: slice, region2: slice, scale: int | None) -> None:
+    """cells of region1 added to those of region2, or multiplied with them as by f* if scale is given"""
+    if _vectorized(region1.stop - region1.start):
+        cells1, cells2 = _cells(state, region1), _cells(state, region2)
+        bound1, bound2 = _bound(cells1), _bound(cells2)
+        if scale is None and bound1 + bound2 <= CELL_MAX:
+            cells2 += cells1
+            return
+        if scale is not None and bound1 * bound2 <= CELL_MAX and scale <= CELL_MAX:
+            np.multiply(cells1, cells2, out=cells2)
+            cells2 //= scale
+            return
+        del cells1, cells2
+    pairs = zip(state.heap[region1], state.heap[region2])
+    _store(state, region2, [a + b for a, b in pairs] if scale is None else [a * b // scale for a, b in pairs])
+
+
+def xt_r_array_sum(state: State) -> None:  # ( addr u -- n )
+    u, addr = state.ds.pop(), state.ds.pop()
+    state.ds.append(_sum(state, check_region(state, addr, u)))
+
+
+def xt_r_array_dot(state: State) -> None:  # ( addr1 addr2 u -- n )
+    region1, region2 = _two_regions(state)
+    state.ds.append(_dot(state, region1, region2))
+
+
+def xt_r_array_f_dot(state: State) -> None:  # ( addr1 addr2 u -- f ) rounded down once, not per product
+    region1, region2 = _two_regions(state)
+    state.ds.append(_dot(state, region1, region2) // state.scale)
+
+
+def xt_r_array_scale(state: State) -> None:  # ( addr u n -- )
+    n, u, addr = state.ds.pop(), state.ds.pop(), state.ds.pop()
+    _scale(state, check_region(state, addr, u), n, 1)
+
+
+def xt_r_array_f_scale(state: State) -> None:  # ( addr u f -- )
+    f, u, addr = state.ds.pop(), state.ds.pop(), state.ds.pop()
+    _scale(state, check_region(state, addr, u), f, state.scale)
+
+
+def xt_r_array_add(state: State) -> None:  # ( addr1 addr2 u -- ) array 1 added to array 2
+    region1, region2 = _two_regions(state)
+    _combine(state, region1, region2, None)
+
+
+def xt_r_array_f_mul(state: State) -> None:  # ( addr1 addr2 u -- ) array 2 multiplied by array 1
+    region1, region2 = _two_regions(state)
+    _combine(state, region1, region2, state.scale)
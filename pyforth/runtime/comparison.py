@@ -1,23 +1,64 @@
-from pyforth.core import STACK
-from .utils import bool2forth, pure_stack_operation
+from pyforth.core import State
+from .utils import bool2forth
 
 
-@pure_stack_operation
-def xt_r_eq(ds: STACK) -> None:
+def xt_r_eq(state: State) -> None:
+    ds = state.ds
     b = ds.pop()
     a = ds.pop()
     ds.append(bool2forth(a == b))
 
 
-@pure_stack_operation
-def xt_r_gt(ds: STACK) -> None:
+def xt_r_gt(state: State) -> None:
+    ds = state.ds
     b = ds.pop()
     a = ds.pop()
     ds.append(bool2forth(a > b))
 
 
-@pure_stack_operation
-def xt_r_lt(ds: STACK) -> None:
+def xt_r_lt(state: State) -> None:
+    ds = state.ds
     b = ds.pop()
     a = ds.pop()
     ds.append(bool2forth(a < b))
+
+
+def xt_r_ne(state: State) -> None:
+    ds = state.ds
+    b = ds.pop()
+    a = ds.pop()
+    ds.append(bool2forth(a != b))
+
+
+def xt_r_ge(state: State) -> None:
+    ds = state.ds
+    b = ds.pop()
+    a = ds.pop()
+    ds.append(bool2forth(a >= b))
+
+
+def xt_r_le(state: State) -> None:
+    ds = state.ds
+    b = ds.pop()
+    a = ds.pop()
+    ds.append(bool2forth(a <= b))
+
+
+def xt_r_zero_eq(state: State) -> None:
+    ds = state.ds
+    ds.append(bool2forth(ds.pop() == 0))
+
+
+def xt_r_zero_ne(state: State) -> None:
+    ds = state.ds
+    ds.append(bool2forth(ds.pop() != 0))
+
+
+def xt_r_zero_lt(state: State) -> None:
+    ds = state.ds
+    ds.append(bool2forth(ds.pop() < 0))
+
+
+def xt_r_zero_gt(state: State) -> None:
+    ds = state.ds
+    ds.append(bool2forth(ds.pop() > 0))
@@ -2,6 +2,7 @@ from pyforth.core import WORD, XT
 
 from . import (
     arithmetic,
+    arrays,
     branching,
     comments,
     comparison,
@@ -11,6 +12,7 @@ from . import (
     loops,
     output,
     primitives,
+    profiling,
     stacks,
     fixed_point,
     strings,
@@ -23,6 +25,9 @@ dictionary: dict[WORD, XT] = {
     ":": primitives.xt_c_colon,
     ";": primitives.xt_c_semi,
     "'": primitives.xt_r_tick,
+    "profile-on": profiling.xt_r_profile_on,
+    "profile-off": profiling.xt_r_profile_off,
+    ".profile": profiling.xt_r_dot_profile,
     "execute": primitives.xt_r_execute,
     '[compile]': primitives.xt_c_bracket_compile,
     "postpone": primitives.xt_c_postpone,
@@ -37,7 +42,11 @@ dictionary: dict[WORD, XT] = {
     "while": loops.xt_c_while,
     "repeat": loops.xt_c_repeat,
     "do": doloop.xt_c_do,
+    "?do": doloop.xt_c_question_do,
     "loop": doloop.xt_c_loop,
+    "+loop": doloop.xt_c_plus_loop,
+    "leave": doloop.xt_c_leave,
+    "unloop": doloop.xt_r_unloop,
     'exit': primitives.xt_c_exit,
     'i': doloop.loop_index_factory(1, 'i'),
     'j': doloop.loop_index_factory(2, 'j'),
@@ -47,16 +56,52 @@ dictionary: dict[WORD, XT] = {
     "/": arithmetic.xt_r_div,
     'mod': arithmetic.xt_r_mod,
     "*": arithmetic.xt_r_mul,
+    "1+": arithmetic.xt_r_one_plus,
+    "1-": arithmetic.xt_r_one_minus,
+    "2*": arithmetic.xt_r_two_mul,
+    "2/": arithmetic.xt_r_two_div,
+    "negate": arithmetic.xt_r_negate,
+    "abs": arithmetic.xt_r_abs,
+    "min": arithmetic.xt_r_min,
+    "max": arithmetic.xt_r_max,
+    "/mod": arithmetic.xt_r_divmod,
+    "m*": arithmetic.xt_r_mul,
+    "*/": arithmetic.xt_r_mul_div,
+    "*/mod": arithmetic.xt_r_mul_divmod,
     'depth': stacks.xt_r_depth,
     "drop": stacks.xt_r_drop,
     "pick": stacks.xt_r_pick,
     "swap": stacks.xt_r_swap,
+    "dup": stacks.xt_r_dup,
+    "over": stacks.xt_r_over,
+    "rot": stacks.xt_r_rot,
+    "nip": stacks.xt_r_nip,
+    "tuck": stacks.xt_r_tuck,
+    "?dup": stacks.xt_r_qdup,
+    "2dup": stacks.xt_r_2dup,
+    "2drop": stacks.xt_r_2drop,
+    "2swap": stacks.xt_r_2swap,
+    "2over": stacks.xt_r_2over,
+    "stack?": stacks.xt_r_stack_q,
+    "clear": stacks.xt_r_clear,
     'emit': output.xt_r_emit,
     ".": output.xt_r_dot,
     "dump": output.xt_r_dump,
+    "cr": output.xt_r_cr,
+    "bl": output.xt_r_bl,
+    "space": output.xt_r_space,
+    "spaces": output.xt_r_spaces,
+    ".s": output.xt_r_dot_s,
     "=": comparison.xt_r_eq,
     ">": comparison.xt_r_gt,
     "<": comparison.xt_r_lt,
+    "<>": comparison.xt_r_ne,
+    ">=": comparison.xt_r_ge,
+    "<=": comparison.xt_r_le,
+    "0=": comparison.xt_r_zero_eq,
+    "0<>": comparison.xt_r_zero_ne,
+    "0<": comparison.xt_r_zero_lt,
+    "0>": comparison.xt_r_zero_gt,
     "lshift": arithmetic.xt_r_lshift,
     "rshift": arithmetic.xt_r_rshift,
     'and': logical.xt_r_and,
@@ -66,10 +111,32 @@ dictionary: dict[WORD, XT] = {
     ",": heap.xt_r_coma,
     "@": heap.xt_r_at,
     "!": heap.xt_r_bang,
+    "c,": heap.xt_r_coma,
+    "c@": heap.xt_r_at,
+    "c!": heap.xt_r_bang,
+    "2@": heap.xt_r_2at,
+    "2!": heap.xt_r_2bang,
+    "+!": heap.xt_r_plus_bang,
+    "move": heap.xt_r_move,
+    "cmove": heap.xt_r_cmove,
+    "cmove>": heap.xt_r_cmove_up,
+    "fill": heap.xt_r_fill,
+    "erase": heap.xt_r_erase,
+    "array-sum": arrays.xt_r_array_sum,
+    "array-dot": arrays.xt_r_array_dot,
+    "array-fdot": arrays.xt_r_array_f_dot,
+    "array-scale": arrays.xt_r_array_scale,
+    "array-fscale": arrays.xt_r_array_f_scale,
+    "array-add": arrays.xt_r_array_add,
+    "array-f*": arrays.xt_r_array_f_mul,
     ">r": stacks.xt_r_to_rs,
     "r>": stacks.xt_r_from_rs,
     "r@": stacks.xt_r_rs_at,
+    "2>r": stacks.xt_r_2to_rs,
+    "2r>": stacks.xt_r_2from_rs,
     "allot": heap.xt_r_allot,
+    "cells": heap.xt_r_cells,
+    "count": heap.xt_r_count,
     "create": primitives.xt_r_create,
     "does>": primitives.xt_r_does,
     'here': heap.xt_r_here,
@@ -78,6 +145,7 @@ dictionary: dict[WORD, XT] = {
     "f.": fixed_point.xt_r_dot_f,
     "f+": arithmetic.xt_r_add,
     "f-": arithmetic.xt_r_sub,
+    "fabs": arithmetic.xt_r_abs,
     "f*": fixed_point.xt_r_f_mul,
     'f/': fixed_point.xt_r_f_div,
     'f**': fixed_point.xt_r_f_power,
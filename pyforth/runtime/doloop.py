@@ -1,6 +1,8 @@
+from typing import cast
+
 from pyforth.core import POINTER, State, CONTROL_STACK, XT
-from pyforth.runtime import arithmetic, comparison, stacks, primitives
-from pyforth.runtime.utils import compiling_word, fatal
+from pyforth.runtime import primitives
+from pyforth.runtime.utils import compiling_word, fatal, jump_operand
 
 
 def _current_nested_count(cs: CONTROL_STACK) -> int:
@@ -14,54 +16,116 @@ def xt_c_do(state: State) -> None:
     if not state.is_compiling:
         fatal("DO: not in compile mode")
 
-    slot = state.compile_to_current_definition(
-        [
-            stacks.xt_r_swap,
-            stacks.xt_r_to_rs,  # push limit to rs
-            stacks.xt_r_to_rs  # push starting index to rs
-        ]
-    )
+    slot = state.compile_to_current_definition(xt_r_do)
     state.control_stack.append(("DO", slot, ()))  # flag for next LOOP
 
 
 @compiling_word
-def xt_c_loop(state: State) -> None:
+def xt_c_question_do(state: State) -> None:
+    if not state.is_compiling:
+        fatal("?DO: not in compile mode")
+
+    exit_slot = state.compile_to_current_definition(xt_r_question_do)
+    slot = state.compile_to_current_definition(0)  # skips the loop as EXIT does, set by LOOP
+    state.control_stack.append(("DO", slot, ("EXIT", exit_slot)))
 
+
+def _compile_loop(state: State, word: str, xt_r: XT) -> None:
     if not state.is_compiling:
-        fatal("LOOP: not in compile mode")
+        fatal(f"{word}: not in compile mode")
     if not state.control_stack:
-        fatal("No DO for LOOP to match")
-    word, slot, exit_, *_ = state.control_stack.pop()
-    if word != "DO":
-        fatal(f"LOOP preceded by {word} (not DO)")
+        fatal(f"No DO for {word} to match")
+    do, slot, exit_, *_ = state.control_stack.pop()
+    if do != "DO":
+        fatal(f"{word} preceded by {do} (not DO)")
     assert isinstance(slot, POINTER)
 
-    state.compile_to_current_definition(
-        [
-            stacks.xt_r_from_rs,  # rs> inx
-            primitives.xt_r_push, 1,  # inx++
-            arithmetic.xt_r_add,
-            stacks.xt_r_rs_at,    # rs@ limit
-            stacks.xt_r_swap,     # ds: limit, index
-            stacks.xt_r_dup,      # ds: limit, index, index
-            stacks.xt_r_to_rs,    # rs: limit, index - ds: limit, index
-            comparison.xt_r_eq,
-            primitives.xt_r_jz, slot, # back to DO or pass
-        ]
-    )
-
+    state.compile_to_current_definition([xt_r, slot])  # back to DO or pass
     state.set_exit_jump_address(exit_)
-    state.compile_to_current_definition(
-        [
-            stacks.xt_r_from_rs,  # UN-LOOP
-            stacks.xt_r_from_rs,
-            stacks.xt_r_drop,
-            stacks.xt_r_drop,
-        ]
-    )
+    state.compile_to_current_definition(xt_r_unloop)
+
+
+@compiling_word
+def xt_c_loop(state: State) -> None:
+    _compile_loop(state, "LOOP", xt_r_loop)
+
+
+@compiling_word
+def xt_c_plus_loop(state: State) -> None:
+    _compile_loop(state, "+LOOP", xt_r_plus_loop)
+
+
+@compiling_word
+def xt_c_leave(state: State) -> None:
+    if not state.is_compiling:
+        fatal("LEAVE: not in compile mode")
+    for index in range(len(state.control_stack) - 1, -1, -1):
+        word, slot, exit_ = state.control_stack[index]
+        if word == "DO":
+            break
+    else:
+        fatal("LEAVE outside DO..LOOP")
+    jump = state.compile_to_current_definition(primitives.xt_r_jmp)
+    state.compile_to_current_definition(0)  # unloop code address, set by LOOP
+    state.control_stack[index] = (word, slot, (*(exit_ or ("EXIT",)), jump))
+
+
+def xt_r_do(state: State) -> None:
+    """move index and limit to the return stack, the index on top"""
+    ds = state.ds
+    index = ds.pop()
+    state.rs += [ds.pop(), index]
+
+
+@jump_operand
+def xt_r_question_do(state: State) -> POINTER:
+    """as DO but jump to the unloop code when index and limit are equal"""
+    xt_r_do(state)
+    if state.rs[-1] == state.rs[-2]:
+        return cast(POINTER, state.current_execution_token)
+    return state.instruction_pointer + 1
+
+
+@jump_operand
+def xt_r_loop(state: State) -> POINTER:
+    """increment the loop index and branch back to DO until it reaches the limit"""
+    rs = state.rs
+    rs[-1] += 1
+    if rs[-1] == rs[-2]:
+        return state.instruction_pointer + 1
+    return cast(POINTER, state.current_execution_token)
+
+
+@jump_operand
+def xt_r_plus_loop(state: State) -> POINTER:
+    """add n to the loop index and branch back to DO until it crosses limit-1 and limit"""
+    rs = state.rs
+    before = rs[-1] - rs[-2]
+    after = before + state.ds.pop()
+    rs[-1] += after - before
+    if (before < 0) != (after < 0):
+        return state.instruction_pointer + 1
+    return cast(POINTER, state.current_execution_token)
+
+
+def xt_r_unloop(state: State) -> None:
+    del state.rs[-2:]
+
+
+def xt_r_i(state: State) -> None:
+    state.ds.append(state.rs[-1])
+
+
+def xt_r_j(state: State) -> None:
+    state.ds.append(state.rs[-3])
+
+
+def xt_r_k(state: State) -> None:
+    state.ds.append(state.rs[-5])
 
 
 def loop_index_factory(expected_nested_level: int, index_word: str) -> XT:
+    xt_r_index: XT = (xt_r_i, xt_r_j, xt_r_k)[expected_nested_level - 1]
 
     def func(state: State) -> None:
 
@@ -74,15 +138,5 @@ def loop_index_factory(expected_nested_level: int, index_word: str) -> XT:
             fatal(f"Loop index {index_word.upper()!r} usage: "
                   f"Unsupported level of nested DO..LOOP {nb_nested_do_loops}")
 
-        state.compile_to_current_definition(
-            [
-                stacks.xt_r_from_rs,  # move around outermost do-loop params
-                stacks.xt_r_from_rs,
-            ] * (expected_nested_level - 1)
-            + [stacks.xt_r_rs_at]    # reaching the one we need
-            + [
-                stacks.xt_r_rot, stacks.xt_r_rot,  # rearrange order
-                stacks.xt_r_to_rs, stacks.xt_r_to_rs,  # put them back
-            ] * (expected_nested_level - 1)
-        )
+        state.compile_to_current_definition(xt_r_index)  # each loop keeps two cells on rs
     return compiling_word(func)
@@ -0,0 +1,334 @@
+"""Transcendental functions of fixed-point numbers, computed on scaled integers
+
+A number x stands for x / scale, scale being a power of ten. Functions
+compute with GUARD_DIGITS more digits than scale, plus the digits the
+magnitude of their arguments costs, and round their result to the
+nearest number at scale.
+"""
+import math
+from functools import lru_cache
+from typing import Final
+
+from pyforth.core import ForthRuntimeError
+
+
+GUARD_DIGITS: Final[int] = 10
+EXP_LIMIT: Final[int] = 710  # e**710 overflows floats, hence cells wider than them are refused
+EXACT_POWER_DIGITS: Final[int] = 2000  # beyond, integer powers go through exp and ln
+
+
+def _domain_error() -> ForthRuntimeError:
+    return ForthRuntimeError("math domain error")
+
+
+def _range_error() -> ForthRuntimeError:
+    return ForthRuntimeError("math range error")
+
+
+def _div(a: int, b: int) -> int:
+    """a / b rounded to the nearest, b > 0"""
+    return (2 * a + b) // (2 * b)
+
+
+def _tdiv(a: int, b: int) -> int:
+    """a / b rounded toward zero, b > 0, series terms then vanish whatever their sign"""
+    return a // b if a >= 0 else -(-a // b)
+
+
+def _digits(n: int) -> int:
+    return len(str(abs(n)))
+
+
+def _vanishing(scale: int) -> int:
+    """k such that e**-k is below a quarter of a unit at scale"""
+    return 231 * _digits(scale) // 100 + 2
+
+
+def _atan_inv(n: int, w: int, hyperbolic: bool = False) -> int:
+    """atan(1/n), or atanh(1/n), at w"""
+    n2: int = n * n
+    term: int = w // n
+    total: int = 0
+    k: int = 1
+    while term:
+        total += term // k if hyperbolic or k % 4 == 1 else -(term // k)
+        term //= n2
+        k += 2
+    return total
+
+
+@lru_cache(maxsize=32)
+def _ln2(w: int) -> int:
+    return 2 * _atan_inv(3, w, hyperbolic=True)
+
+
+@lru_cache(maxsize=32)
+def _pi(w: int) -> int:
+    return 4 * (4 * _atan_inv(5, w) - _atan_inv(239, w))  # Machin's formula
+
+
+def _times_ln2(n: int, w: int) -> int:
+    """n * ln(2) at w, with the digits n costs"""
+    extra: int = 10 ** _digits(n)
+    return _div(n * _ln2(w * extra), extra)
+
+
+def _exp(x: int, w: int) -> int:
+    """e**x at w, x = n * ln(2) + r with |r| <= ln(2) / 2"""
+    n: int = _div(x, _ln2(w))
+    r: int = x - _times_ln2(n, w)
+    total: int = w
+    term: int = w
+    i: int = 1
+    while term:
+        term = _tdiv(term * r, w * i)
+        total += term
+        i += 1
+    return total << n if n >= 0 else total >> -n
+
+
+def _ln(x: int, w: int) -> int:
+    """ln(x) at w, x > 0, x = 2**k * m with m close to 1"""
+    k: int = x.bit_length() - w.bit_length()
+    m: int = x >> k if k >= 0 else x << -k
+    if m * m > 2 * w * w:
+        k += 1
+        m = x >> k if k >= 0 else x << -k
+    elif 2 * m * m < w * w:
+        k -= 1
+        m = x >> k if k >= 0 else x << -k
+    z: int = abs(m - w) * w // (m + w)  # ln(m) = 2 atanh(z), z <= 0.172
+    z2: int = z * z // w
+    term: int = z
+    total: int = 0
+    i: int = 1
+    while term:
+        total += term // i
+        term = term * z2 // w
+        i += 2
+    return _times_ln2(k, w) + (2 * total if m >= w else -2 * total)
+
+
+def _sin_cos(x: int, w: int) -> tuple[int, int]:
+    """sin(x) and cos(x) at w, x = n * pi / 2 + r with |r| <= pi / 4"""
+    extra: int = 10 ** _digits(x // w)
+    n: int = _div(2 * x * extra, _pi(w * extra))
+    r: int = x - _div(n * _pi(w * extra), 2 * extra)
+    sin: int = 0
+    cos: int = 0
+    term: int = w
+    i: int = 0
+    while term:
+        if i % 2:
+            sin += term if i % 4 == 1 else -term
+        else:
+            cos += term if i % 4 == 0 else -term
+        i += 1
+        term = _tdiv(term * r, w * i)
+    return ((sin, cos), (cos, -sin), (-sin, -cos), (-cos, sin))[n % 4]
+
+
+def _atan(t: int, w: int) -> int:
+    """atan(t) at w, t halved in angle twice so that the series converges fast"""
+    if t < 0:
+        return -_atan(-t, w)
+    if t > w:
+        return _pi(w) // 2 - _atan(w * w // t, w)
+    for _ in range(2):
+        t = t * w // (w + math.isqrt(w * w + t * t))
+    t2: int = t * t // w
+    term: int = t
+    total: int = 0
+    i: int = 1
+    while term:
+        total += term // i if i % 4 == 1 else -(term // i)
+        term = term * t2 // w
+        i += 2
+    return 4 * total
+
+
+def _atan2(y: int, x: int, w: int) -> int:
+    if abs(y) <= abs(x):
+        if x == 0:
+            return 0
+        angle: int = _atan(_tdiv(y * w, abs(x)) * (1 if x > 0 else -1), w)
+        if x < 0:
+            angle += _pi(w) if y >= 0 else -_pi(w)
+        return angle
+    return (_pi(w) // 2 if y > 0 else -(_pi(w) // 2)) - _atan(_tdiv(x * w, abs(y)) * (1 if y > 0 else -1), w)
+
+
+def _guard(*arguments_digits: int) -> int:
+    return 10 ** (GUARD_DIGITS + sum(arguments_digits))
+
+
+def _exp_guard(x: int, scale: int) -> int:
+    """guard for e**x, which has x / ln(10) integer digits"""
+    units: int = x // scale
+    if units >= EXP_LIMIT:
+        raise _range_error()
+    return _guard(max(0, units) * 44 // 100 + 1, _digits(units))
+
+
+def sqrt(x: int, scale: int) -> int:
+    if x < 0:
+        raise _domain_error()
+    square: int = x * scale
+    root: int = math.isqrt(square)
+    return root + 1 if square - root * root > root else root
+
+
+def exp(x: int, scale: int) -> int:
+    if x // scale < -_vanishing(scale):
+        return 0
+    guard: int = _exp_guard(x, scale)
+    return _div(_exp(x * guard, scale * guard), guard)
+
+
+def ln(x: int, scale: int) -> int:
+    if x <= 0:
+        raise _domain_error()
+    guard: int = _guard()
+    return _div(_ln(x * guard, scale * guard), guard)
+
+
+def log(x: int, scale: int) -> int:
+    if x <= 0:
+        raise _domain_error()
+    guard: int = _guard()
+    w: int = scale * guard
+    return _div(_ln(x * guard, w) * w // _ln(10 * w, w), guard)
+
+
+def sin(x: int, scale: int) -> int:
+    guard: int = _guard()
+    return _div(_sin_cos(x * guard, scale * guard)[0], guard)
+
+
+def cos(x: int, scale: int) -> int:
+    guard: int = _guard()
+    return _div(_sin_cos(x * guard, scale * guard)[1], guard)
+
+
+def tan(x: int, scale: int) -> int:
+    guard: int = _guard()
+    w: int = scale * guard
+    s, c = _sin_cos(x * guard, w)
+    if _digits(w // max(abs(c), 1)) > 1:  # close to a pole, c lacks the digits its inverse needs
+        guard = _guard(2 * _digits(w // max(abs(c), 1)))
+        w = scale * guard
+        s, c = _sin_cos(x * guard, w)
+        if c == 0:
+            raise _range_error()
+    return _div(_tdiv(s * w, abs(c)) * (1 if c > 0 else -1), guard)
+
+
+def atan(x: int, scale: int) -> int:
+    guard: int = _guard()
+    return _div(_atan(x * guard, scale * guard), guard)
+
+
+def atan2(y: int, x: int, scale: int) -> int:
+    guard: int = _guard()
+    return _div(_atan2(y * guard, x * guard, scale * guard), guard)
+
+
+def asin(x: int, scale: int) -> int:
+    if abs(x) > scale:
+        raise _domain_error()
+    guard: int = _guard()
+    w: int = scale * guard
+    return _div(_atan2(x * guard, math.isqrt(w * w - (x * guard) ** 2), w), guard)
+
+
+def acos(x: int, scale: int) -> int:
+    if abs(x) > scale:
+        raise _domain_error()
+    guard: int = _guard()
+    w: int = scale * guard
+    return _div(_atan2(math.isqrt(w * w - (x * guard) ** 2), x * guard, w), guard)
+
+
+def sinh(x: int, scale: int) -> int:
+    guard: int = _exp_guard(abs(x), scale)
+    w: int = scale * guard
+    e: int = _exp(abs(x) * guard, w)
+    result: int = _div(e - w * w // e, 2 * guard)
+    return result if x >= 0 else -result
+
+
+def cosh(x: int, scale: int) -> int:
+    guard: int = _exp_guard(abs(x), scale)
+    w: int = scale * guard
+    e: int = _exp(abs(x) * guard, w)
+    return _div(e + w * w // e, 2 * guard)
+
+
+def tanh(x: int, scale: int) -> int:
+    if 2 * abs(x) > _vanishing(scale) * scale:
+        return scale if x > 0 else -scale
+    guard: int = _guard()
+    w: int = scale * guard
+    e: int = _exp(2 * abs(x) * guard, w)
+    result: int = _div((e - w) * w // (e + w), guard)
+    return result if x >= 0 else -result
+
+
+def asinh(x: int, scale: int) -> int:
+    guard: int = _guard()
+    w: int = scale * guard
+    a: int = abs(x) * guard
+    result: int = _div(_ln(a + math.isqrt(a * a + w * w), w), guard)
+    return result if x >= 0 else -result
+
+
+def acosh(x: int, scale: int) -> int:
+    if x < scale:
+        raise _domain_error()
+    guard: int = _guard()
+    w: int = scale * guard
+    a: int = x * guard
+    return _div(_ln(a + math.isqrt(a * a - w * w), w), guard)
+
+
+def atanh(x: int, scale: int) -> int:
+    if abs(x) >= scale:
+        raise _domain_error()
+    guard: int = _guard()
+    w: int = scale * guard
+    a: int = x * guard
+    return _div(_ln((w + a) * w // (w - a), w), 2 * guard)
+
+
+def _power(base: int, exponent: int, scale: int) -> int:
+    """base**exponent through exp and ln, base > 0"""
+    estimate: float = exponent / scale * (math.log(base) - math.log(scale))
+    if estimate >= EXP_LIMIT:
+        raise _range_error()
+    if estimate < -_vanishing(scale):
+        return 0
+    guard: int = _guard(max(0, int(estimate)) * 44 // 100 + 1, _digits(int(estimate)), _digits(exponent // scale))
+    w: int = scale * guard
+    return _div(_exp(_ln(base * guard, w) * exponent // scale, w), guard)
+
+
+def power(base: int, exponent: int, scale: int) -> int:
+    """base**exponent, exactly with a small integer exponent, through exp and ln otherwise"""
+    if base == 0:
+        if exponent < 0:
+            raise _domain_error()
+        return scale if exponent == 0 else 0
+    if exponent % scale == 0:
+        n: int = exponent // scale
+        if abs(n) * max(_digits(base), _digits(scale)) > EXACT_POWER_DIGITS:  # too long integers to compute
+            result: int = _power(abs(base), exponent, scale)
+        elif n * (math.log10(abs(base)) - _digits(scale) + 1) > EXP_LIMIT * 0.4343:  # digits of the result
+            raise _range_error()
+        elif n >= 0:
+            return _div(base ** n * scale, scale ** n)
+        else:
+            result = _div(scale ** (1 - n), abs(base) ** -n)
+        return -result if base < 0 and n % 2 else result
+    if base < 0:
+        raise _domain_error()
+    return _power(base, exponent, scale)
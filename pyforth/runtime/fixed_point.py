@@ -1,128 +1,173 @@
 import math
-import sys
-from typing import Callable
+import re
+from functools import lru_cache
+from typing import Callable, Final
 
-from pyforth.core import State, WORD, NATIVE_XT, ForthRuntimeError
-from .utils import flush_stdout, intercept_stack_error
+from pyforth.core import State, WORD, NATIVE_XT, ForthCompilationError
+from pyforth.runtime import fixed_math
+
+
+# floats are exact to 1e-16, their results are kept up to this precision and within this range,
+# where arguments rounded to floats and math functions stay well below half a unit of the last digit
+FLOAT_PRECISION: Final[int] = 6
+FLOAT_SCALE: Final[int] = 10 ** FLOAT_PRECISION
+FLOAT_RANGE: Final[float] = 2.0 ** 20
+TAN_FLOAT_RANGE: Final[float] = 2.0 ** 10  # close to its poles, tan magnifies the rounding of its argument
+
+LITERAL_CACHE_SIZE: Final[int] = 4096  # literals parsed, per base and precision
+MAX_DIGITS: Final[int] = 4300  # of the largest literal, as many as int() converts by default
+MAX_SHIFT: Final[int] = MAX_DIGITS
+_DIGITS: Final[str] = '0123456789abcdefghijklmnopqrstuvwxyz'
+_DECIMAL: Final[re.Pattern[str]] = re.compile(r'([+-]?)(\d*)(?:\.(\d*))?(?:[eE]([+-]?\d+))?')
 
 
 def xt_r_get_precision(state: State) -> None:
     state.ds.append(state.precision)
 
 
-@intercept_stack_error
 def xt_r_set_precision(state: State) -> None:
     state.set_precision(state.ds.pop())
 
 
-@intercept_stack_error
-@flush_stdout
 def xt_r_dot_f(state: State) -> None:
     value: int = state.ds.pop()
-    precision: int = state.precision
-    sys.stdout.write(fp_to_str(value, precision))
+    state.output.write(state.fp_format.format('-' if value < 0 else '', *divmod(abs(value), state.scale)))
 
 
 def fp_to_str(f: int, precision: int) -> str:
-    negative: bool = f < 0
-    int_p: int = abs(f) // 10**precision
-    frac_p: int = abs(f) % 10**precision
-    fmt: str = '{:0' + str(precision) + 'd}'
-    result: str = ('-' if negative else '') + str(int_p) + '.' + fmt.format(frac_p)
-    return result
+    int_p, frac_p = divmod(abs(f), 10 ** precision)
+    return f"{'-' if f < 0 else ''}{int_p}.{frac_p:0{precision}d}"
+
+
+def _decimal_to_fp(match: re.Match[str], precision: int) -> int:
+    """digits scaled to precision, rounded to the nearest, halves toward zero"""
+    sign, int_part, frac_part, exponent = match.groups()
+    _check_length(match.string)
+    digits: int = int(int_part + (frac_part or ''))
+    shift: int = int(exponent or 0) - len(frac_part or '') + precision
+    if shift > MAX_SHIFT:
+        raise ForthCompilationError(f"Cannot parse {match.string!r} as a literal, out of range")
+    if shift >= 0:
+        value: int = digits * 10 ** shift
+    elif -shift > len(int_part + (frac_part or '')):
+        value = 0  # below half a unit
+    else:
+        divisor: int = 10 ** -shift
+        value, remainder = divmod(digits, divisor)
+        if 2 * remainder > divisor:
+            value += 1
+    return -value if sign == '-' else value
 
 
 def parse_to_fp(word: WORD, precision: int) -> int:
-    # 1. could be an integer?
-    try:
-        int(word)
+    match: re.Match[str] | None = _DECIMAL.fullmatch(word)
+    if match is None or not (match[2] or match[3]):
+        raise ValueError(f"{word!r} is not a number")
+    if match[3] is None and match[4] is None:
         raise ValueError(f"{word!r} Not a decimal number representation")
-    except ValueError as exc:
-        if "Not a decimal number representation" in str(exc):
-            raise exc from None
-        # 2. try to convert into float
-        f: float = float(word)
-        apparent_precision: int = 0
-        while round(f) != f:
-            f *= 10
-            apparent_precision += 1
-
-        # 3. adjust precision
-        div_or_mul = 1 if apparent_precision < precision else -1
-        while apparent_precision != precision:
-            if div_or_mul > 0:
-                f *= 10
-            else:
-                f /= 10
-            apparent_precision += div_or_mul
-
-        return int(round(f))
-
-
-@intercept_stack_error
+    return _decimal_to_fp(match, precision)
+
+
+def _check_length(word: WORD) -> None:
+    if len(word) > MAX_DIGITS:
+        raise ForthCompilationError(f"Cannot parse {word[:20]}... as a literal, more than {MAX_DIGITS} digits")
+
+
+@lru_cache(maxsize=None)
+def _integer_pattern(base: int) -> re.Pattern[str]:
+    return re.compile(f'[+-]?[{_DIGITS[:base]}]+', re.IGNORECASE)
+
+
+@lru_cache(maxsize=LITERAL_CACHE_SIZE)
+def parse_number(word: WORD, base: int, precision: int) -> int | None:
+    """value of an integer in base, or else of a decimal number scaled to precision, None if word is no number"""
+    base = base or 10  # BASE is 0 until bootstrap sets it
+    if 2 <= base <= len(_DIGITS) and _integer_pattern(base).fullmatch(word):
+        _check_length(word)
+        return int(word, base)
+    match: re.Match[str] | None = _DECIMAL.fullmatch(word)
+    if match is None or not (match[2] or match[3]):
+        return None
+    if match[3] is None and match[4] is None:
+        raise ForthCompilationError(f"Cannot parse {word!r} as a literal")  # decimal digits not in base
+    return _decimal_to_fp(match, precision)
+
+
 def xt_r_f_mul(state: State) -> None:
     b: int = state.ds.pop()
     a: int = state.ds.pop()
-    precision: int = state.precision
-    result: int = a * b // 10**precision
-    state.ds.append(result)
+    state.ds.append(a * b // state.scale)
 
 
-@intercept_stack_error
 def xt_r_f_div(state: State) -> None:
     b: int = state.ds.pop()
     a: int = state.ds.pop()
-    precision: int = state.precision
-    result: int = (a * 10**precision) // b
-    state.ds.append(result)
+    state.ds.append(a * state.scale // b)
 
 
-def _math_func_factory(func: Callable[[float], float]) -> NATIVE_XT:
+def _math_func_factory(
+    func: Callable[[float], float],
+    exact: Callable[[int, int], int],
+    float_range: float = FLOAT_RANGE
+) -> NATIVE_XT:
+    """the float result of func is kept when its error is far below the last digit, else exact computes it"""
     def wrapped(state: State) -> None:
-        x: float = state.ds.pop() / 10 ** state.precision
-        try:
-            y: float = func(x)
-            result: int = parse_to_fp(str(y), state.precision)
-            state.ds.append(result)
-        except ValueError as e:
-            if "math domain error" in str(e):
-                raise ForthRuntimeError(str(e)) from None
-            raise
+        x: int = state.ds.pop()
+        scale: int = state.scale
+        if scale <= FLOAT_SCALE and abs(x) < FLOAT_RANGE * scale:
+            try:
+                y: float = func(x / scale)
+                if abs(y) < float_range:
+                    state.ds.append(round(y * scale))
+                    return
+            except (ValueError, OverflowError):
+                pass  # exact raises the error
+        state.ds.append(exact(x, scale))
+
+    return wrapped
 
-    return intercept_stack_error(wrapped)
+
+def xt_r_f_sqrt(state: State) -> None:
+    state.ds.append(fixed_math.sqrt(state.ds.pop(), state.scale))  # isqrt is exact and faster than floats
 
 
-@intercept_stack_error
 def xt_r_f_power(state: State) -> None:
-    exponent: float = state.ds.pop() / 10 ** state.precision
-    base: float = state.ds.pop() / 10 ** state.precision
-    z: float = base ** exponent
-    result: int = parse_to_fp(str(z), state.precision)
-    state.ds.append(result)
-
-
-xt_r_f_sqrt = _math_func_factory(math.sqrt)
-xt_r_f_exp = _math_func_factory(math.exp)
-xt_r_f_ln = _math_func_factory(math.log)
-xt_r_f_log = _math_func_factory(math.log10)
-xt_r_f_sin = _math_func_factory(math.sin)
-xt_r_f_cos = _math_func_factory(math.cos)
-xt_r_f_tan = _math_func_factory(math.tan)
-xt_r_f_sinh = _math_func_factory(math.sinh)
-xt_r_f_cosh = _math_func_factory(math.cosh)
-xt_r_f_tanh = _math_func_factory(math.tanh)
-xt_r_f_asin = _math_func_factory(math.asin)
-xt_r_f_acos = _math_func_factory(math.acos)
-xt_r_f_atan = _math_func_factory(math.atan)
-xt_r_f_acosh = _math_func_factory(math.acosh)
-xt_r_f_asinh = _math_func_factory(math.asinh)
-xt_r_f_atanh = _math_func_factory(math.atanh)
-
-
-@intercept_stack_error
+    exponent: int = state.ds.pop()
+    base: int = state.ds.pop()
+    scale: int = state.scale
+    if scale <= FLOAT_SCALE and abs(base) < FLOAT_RANGE * scale and abs(exponent) < FLOAT_RANGE * scale:
+        try:
+            z: float = math.pow(base / scale, exponent / scale)
+            if abs(z) < FLOAT_RANGE:
+                state.ds.append(round(z * scale))
+                return
+        except (ValueError, OverflowError):
+            pass
+    state.ds.append(fixed_math.power(base, exponent, scale))
+
+
+xt_r_f_exp = _math_func_factory(math.exp, fixed_math.exp)
+xt_r_f_ln = _math_func_factory(math.log, fixed_math.ln)
+xt_r_f_log = _math_func_factory(math.log10, fixed_math.log)
+xt_r_f_sin = _math_func_factory(math.sin, fixed_math.sin)
+xt_r_f_cos = _math_func_factory(math.cos, fixed_math.cos)
+xt_r_f_tan = _math_func_factory(math.tan, fixed_math.tan, float_range=TAN_FLOAT_RANGE)
+xt_r_f_sinh = _math_func_factory(math.sinh, fixed_math.sinh)
+xt_r_f_cosh = _math_func_factory(math.cosh, fixed_math.cosh)
+xt_r_f_tanh = _math_func_factory(math.tanh, fixed_math.tanh)
+xt_r_f_asin = _math_func_factory(math.asin, fixed_math.asin)
+xt_r_f_acos = _math_func_factory(math.acos, fixed_math.acos)
+xt_r_f_atan = _math_func_factory(math.atan, fixed_math.atan)
+xt_r_f_acosh = _math_func_factory(math.acosh, fixed_math.acosh)
+xt_r_f_asinh = _math_func_factory(math.asinh, fixed_math.asinh)
+xt_r_f_atanh = _math_func_factory(math.atanh, fixed_math.atanh)
+
+
 def xt_r_f_atan2(state: State) -> None:
-    x: float = state.ds.pop() / 10 ** state.precision
-    y: float = state.ds.pop() / 10 ** state.precision
-    z: float = math.atan2(y, x)
-    result: int = parse_to_fp(str(z), state.precision)
-    state.ds.append(result)
+    x: int = state.ds.pop()
+    y: int = state.ds.pop()
+    scale: int = state.scale
+    if scale <= FLOAT_SCALE and abs(x) < FLOAT_RANGE * scale and abs(y) < FLOAT_RANGE * scale:
+        state.ds.append(round(math.atan2(y / scale, x / scale) * scale))
+    else:
+        state.ds.append(fixed_math.atan2(y, x, scale))
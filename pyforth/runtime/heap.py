@@ -1,31 +1,131 @@
-from pyforth.core import State
-from pyforth.runtime.utils import intercept_stack_error
+from array import array
+from typing import Final
+
+from pyforth.core import ForthRuntimeError, LITERAL, POINTER, State
+
+
+CELL_SIZE: Final[int] = 1
+CELL_TYPECODE: Final[str] = 'q'  # heap cells are signed 64 bits integers
+CELL_BYTES: Final[int] = array(CELL_TYPECODE).itemsize
+
+
+def check_address(state: State, addr: POINTER) -> POINTER:
+    if not 0 <= addr < len(state.heap):
+        raise ForthRuntimeError(f"Invalid heap address: {addr!r}")
+    return addr
+
+
+def check_region(state: State, addr: POINTER, nb_cells: int) -> slice:
+    """heap slice of nb_cells from addr, assigning a slice of another length would resize the heap"""
+    if nb_cells < 0 or not 0 <= addr <= addr + nb_cells <= len(state.heap):
+        raise ForthRuntimeError(f"Invalid heap region: {nb_cells!r} cells from {addr!r}")
+    return slice(addr, addr + nb_cells)
+
+
+def store(state: State, addr: POINTER, value: LITERAL) -> None:
+    try:
+        state.heap[addr] = value
+    except (OverflowError, TypeError, ValueError):  # ValueError for a mapped heap
+        raise ForthRuntimeError(f"Value does not fit in a cell: {value!r}") from None
 
 
-@intercept_stack_error
 def xt_r_allot(state: State) -> None:
     """reserve n words for last create"""
     nb_cells = state.ds.pop()
     assert isinstance(nb_cells, int)
-    state.next_heap_address += nb_cells
+    state.allot(nb_cells)
 
 
-@intercept_stack_error
 def xt_r_at(state: State) -> None:
-    state.ds.append(state.heap[state.ds.pop()])  # get heap @ address
+    state.ds.append(state.heap[check_address(state, state.ds.pop())])  # get heap @ address
 
 
-@intercept_stack_error
 def xt_r_bang(state: State) -> None:
-    a = state.ds.pop()
-    state.heap[a] = state.ds.pop()  # set heap @ address
+    a = check_address(state, state.ds.pop())
+    store(state, a, state.ds.pop())  # set heap @ address
 
 
-@intercept_stack_error
 def xt_r_coma(state: State) -> None:  # push tos into heap
-    state.heap[state.next_heap_address] = state.ds.pop()
-    state.next_heap_address += 1
+    value = state.ds.pop()
+    store(state, state.allot(1), value)
 
 
 def xt_r_here(state: State) -> None:  # push next heap address onto tos
     state.ds.append(state.next_heap_address)
+
+
+def xt_r_cells(state: State) -> None:  # a cell holds a whole int, addresses are cell indexes
+    state.ds.append(state.ds.pop() * CELL_SIZE)
+
+
+def xt_r_count(state: State) -> None:  # counted string address to its first char and length
+    addr = state.ds.pop()
+    state.ds += [addr + 1, state.heap[check_address(state, addr)]]
+
+
+def xt_r_2at(state: State) -> None:  # the cell at addr is the top of the pair
+    addr = state.ds.pop()
+    region = check_region(state, addr, 2)
+    state.ds += [state.heap[region.start + 1], state.heap[region.start]]
+
+
+def xt_r_2bang(state: State) -> None:
+    addr = state.ds.pop()
+    region = check_region(state, addr, 2)
+    x2 = state.ds.pop()
+    x1 = state.ds.pop()
+    store(state, region.start, x2)
+    store(state, region.start + 1, x1)
+
+
+def xt_r_plus_bang(state: State) -> None:
+    addr = check_address(state, state.ds.pop())
+    store(state, addr, state.heap[addr] + state.ds.pop())
+
+
+def _cells(state: State, region: slice) -> array:
+    """a copy of the heap region, not a view of it"""
+    return array(CELL_TYPECODE, state.heap[region])
+
+
+def xt_r_move(state: State) -> None:  # ( addr1 addr2 u -- ) as if copied through a buffer
+    u, dst, src = state.ds.pop(), state.ds.pop(), state.ds.pop()
+    source = check_region(state, src, u)
+    state.heap[check_region(state, dst, u)] = _cells(state, source)
+
+
+def xt_r_cmove(state: State) -> None:  # ( addr1 addr2 u -- ) copied from lower addresses up
+    u, dst, src = state.ds.pop(), state.ds.pop(), state.ds.pop()
+    source, destination = check_region(state, src, u), check_region(state, dst, u)
+    distance: int = dst - src
+    if 0 < distance < u:  # cells overwritten before they are read: the first ones repeat
+        pattern = _cells(state, slice(src, dst))
+        state.heap[destination] = (pattern * (u // distance + 1))[:u]
+    else:
+        state.heap[destination] = _cells(state, source)
+
+
+def xt_r_cmove_up(state: State) -> None:  # ( addr1 addr2 u -- ) copied from higher addresses down
+    u, dst, src = state.ds.pop(), state.ds.pop(), state.ds.pop()
+    source, destination = check_region(state, src, u), check_region(state, dst, u)
+    distance: int = src - dst
+    if 0 < distance < u:  # cells overwritten before they are read: the last ones repeat
+        pattern = _cells(state, slice(src + u - distance, src + u))
+        repeated = pattern * (u // distance + 1)
+        state.heap[destination] = repeated[len(repeated) - u:]
+    else:
+        state.heap[destination] = _cells(state, source)
+
+
+def xt_r_fill(state: State) -> None:  # ( addr u char -- )
+    char, u, addr = state.ds.pop(), state.ds.pop(), state.ds.pop()
+    region = check_region(state, addr, u)
+    try:
+        state.heap[region] = array(CELL_TYPECODE, [char]) * u
+    except (OverflowError, TypeError, ValueError):
+        raise ForthRuntimeError(f"Value does not fit in a cell: {char!r}") from None
+
+
+def xt_r_erase(state: State) -> None:  # ( addr u -- )
+    u, addr = state.ds.pop(), state.ds.pop()
+    state.heap[check_region(state, addr, u)] = array(CELL_TYPECODE, bytes(u * CELL_BYTES))
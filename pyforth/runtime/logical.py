@@ -1,31 +1,30 @@
 import operator
 
-from pyforth.core import STACK
-from .utils import pure_stack_operation
+from pyforth.core import State
 
 
-@pure_stack_operation
-def xt_r_and(ds: STACK) -> None:
+def xt_r_and(state: State) -> None:
+    ds = state.ds
     b = ds.pop()
     a = ds.pop()
     ds.append(a & b)
 
 
-@pure_stack_operation
-def xt_r_or(ds: STACK) -> None:
+def xt_r_or(state: State) -> None:
+    ds = state.ds
     b = ds.pop()
     a = ds.pop()
     ds.append(a | b)
 
 
-@pure_stack_operation
-def xt_r_invert(ds: STACK) -> None:
+def xt_r_invert(state: State) -> None:
+    ds = state.ds
     a = ds.pop()
     ds.append(operator.invert(a))
 
 
-@pure_stack_operation
-def xt_r_xor(ds: STACK) -> None:
+def xt_r_xor(state: State) -> None:
+    ds = state.ds
     b = ds.pop()
     a = ds.pop()
     ds.append(operator.xor(a, b))
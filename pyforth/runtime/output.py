@@ -1,24 +1,37 @@
-import sys
+from pyforth.core import State
 
-from pyforth.core import STACK, State
 
-from .utils import pass_both_stacks, flush_stdout, intercept_stack_error
+def xt_r_dump(state: State) -> None:
+    state.output.write(f"state.ds = {state.ds}\n")
+    state.output.write(f"state.rs = {state.rs}\n")
 
 
-@pass_both_stacks
-def xt_r_dump(ds: STACK, rs: STACK) -> None:
-    print(f"state.ds = {ds}")
-    print(f"state.rs = {rs}")
-
-
-@intercept_stack_error
-@flush_stdout
 def xt_r_dot(state: State) -> None:
     value: int = state.ds.pop()
-    sys.stdout.write(state.int_to_str(value))
+    state.output.write(state.int_to_str(value))
 
 
-@intercept_stack_error
-@flush_stdout
 def xt_r_emit(state: State) -> None:
-    sys.stdout.write(chr(state.ds.pop()))
+    state.output.write(chr(state.ds.pop()))
+
+
+def xt_r_cr(state: State) -> None:
+    state.output.write('\n')
+    state.output.flush()
+
+
+def xt_r_space(state: State) -> None:
+    state.output.write(' ')
+
+
+def xt_r_spaces(state: State) -> None:
+    state.output.write(' ' * max(state.ds.pop(), 0))
+
+
+def xt_r_bl(state: State) -> None:
+    state.ds.append(ord(' '))
+
+
+def xt_r_dot_s(state: State) -> None:
+    if state.ds:
+        state.output.write(''.join(state.int_to_str(value) + ' ' for value in state.ds) + '\n')
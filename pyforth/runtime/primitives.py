@@ -1,58 +1,102 @@
+from collections.abc import Mapping
 from typing import cast, Optional
 from pyforth.core import DEFINED_XT, LITERAL, POINTER, WORD, XT
 from pyforth.core import DefinedExecutionToken, ForthCompilationError, State
-from pyforth.runtime.utils import compiling_word, fatal, intercept_stack_error
+from pyforth.runtime.utils import compiling_word, fatal, jump_operand, stack_underflow, literal_operand
 
 
 def xt_r_create(state: State) -> None:
     label = state.next_word()
     # when created word is run, pushes its address
     state.execution_tokens[label] = DefinedExecutionToken([xt_r_push, state.next_heap_address])
+    state.execution_tokens[label].name = label
     state.reveal_created_word(label)
 
 
 def xt_r_does(state: State) -> POINTER:
     assert isinstance(state.execution_tokens[state.last_created_word], list)
-    ref_xt: DEFINED_XT = cast(DEFINED_XT, state.execution_tokens[state.last_created_word])
+    ref_xt: DEFINED_XT = cast(DEFINED_XT, state.writable_xt(state.last_created_word))
     # rest of words belong to created words runtime
     ref_xt += state.current_defined_execution_token[state.instruction_pointer:]
     return len(state.current_defined_execution_token)  # jump p over these
 
 
+@jump_operand
 def xt_r_jmp(state: State) -> POINTER:
     return cast(POINTER, state.current_execution_token)
 
 
+@jump_operand
 def xt_r_jz(state: State) -> POINTER:
-    return (
-        cast(POINTER, state.current_execution_token),
-        state.instruction_pointer + 1
-    )[state.ds.pop()]
+    if state.ds.pop():  # any non-zero flag is true
+        return state.instruction_pointer + 1
+    return cast(POINTER, state.current_execution_token)
 
 
+@jump_operand
 def xt_r_jnz(state: State) -> POINTER:
-    return (
-        state.instruction_pointer + 1,
-        cast(POINTER, state.current_execution_token)
-    )[state.ds.pop()]
+    if state.ds.pop():
+        return cast(POINTER, state.current_execution_token)
+    return state.instruction_pointer + 1
 
 
+@literal_operand
 def xt_r_push(state: State) -> POINTER:
     state.ds.append(cast(LITERAL, state.current_execution_token))
     return state.instruction_pointer + 1
 
 
+@literal_operand
+def xt_r_push_add(state: State) -> POINTER:
+    state.ds.append(state.ds.pop() + cast(LITERAL, state.current_execution_token))
+    return state.instruction_pointer + 1
+
+
+@jump_operand
+def xt_r_eq_jz(state: State) -> POINTER:
+    b = state.ds.pop()
+    a = state.ds.pop()
+    return state.instruction_pointer + 1 if a == b else cast(POINTER, state.current_execution_token)
+
+
+@jump_operand
+def xt_r_lt_jz(state: State) -> POINTER:
+    b = state.ds.pop()
+    a = state.ds.pop()
+    return state.instruction_pointer + 1 if a < b else cast(POINTER, state.current_execution_token)
+
+
+@jump_operand
+def xt_r_gt_jz(state: State) -> POINTER:
+    b = state.ds.pop()
+    a = state.ds.pop()
+    return state.instruction_pointer + 1 if a > b else cast(POINTER, state.current_execution_token)
+
+
+@literal_operand
 def xt_r_run(state: State) -> POINTER:
     p: POINTER = state.instruction_pointer  # save current IP
-    word: WORD = cast(WORD, state.current_execution_token)
+    run_word(state, cast(WORD, state.current_execution_token))
+    return p + 1
+
+
+def run_word(state: State, word: WORD) -> None:
+    """run the definition word has now, threaded or native"""
     try:
-        xt_r: DEFINED_XT = cast(DEFINED_XT, state.execution_tokens[word])
-        state.execute(xt_r)
-        return p + 1
+        xt_r: XT = state.execution_tokens[word]
     except KeyError:
         raise ForthCompilationError(f"Undefined word {word!r}") from None
+    execute_immediate(state, xt_r)
 
 
+@literal_operand
+def xt_r_call(state: State) -> POINTER:
+    p: POINTER = state.instruction_pointer  # save current IP
+    state.execute(cast(DEFINED_XT, state.current_execution_token))
+    return p + 1
+
+
+@literal_operand
 def xt_r_push_rs(state: State) -> POINTER:
     state.rs.append(cast(LITERAL, state.current_execution_token))
     return state.instruction_pointer + 1
@@ -105,7 +149,7 @@ def xt_c_exit(state: State) -> None:
             if word not in ('COLON', 'BEGIN', 'DO'):
                 fatal(f"EXIT: Unexpected block structure {word}")
             slot = _state.compile_to_current_definition(xt_r_jmp)
-            _state.control_stack.append((word, label, ('EXIT', slot)))
+            _state.control_stack.append((word, label, (*(_ or ('EXIT',)), slot)))
             _state.compile_to_current_definition(0)
 
     _exit(state)
@@ -120,17 +164,16 @@ def xt_c_postpone(state: State) -> None:
     if xt is None:
         fatal(f"POSTPONE: unknown word {word!r}")
     assert xt is not None  # so mypy is happy...
-    state.compile_to_current_definition(compile_address(word, xt))
+    state.compile_word(word, xt)
 
 
 def xt_r_immediate(state: State) -> None:
     if state.is_compiling:
         fatal("IMMEDIATE: In compile mode")
     word: WORD = state.last_created_word
-    xt: XT | None = state.execution_tokens.get(word)
-    if xt is None:
+    if word not in state.execution_tokens:
         fatal(f"IMMEDIATE: unknown word {word!r}")
-    setattr(xt, '_immediate', True)
+    setattr(state.writable_xt(word), '_immediate', True)
 
 
 @compiling_word
@@ -154,17 +197,18 @@ def xt_c_recurse(state: State) -> None:
 
 def xt_r_tick(state: State):
     word: WORD = state.next_word()
-    addr: POINTER | None = get_word_address(state.execution_tokens, word)
-    assert addr is not None
-    state.ds.append(addr)
+    xt: XT | None = state.execution_tokens.get(word)
+    if xt is None:
+        fatal(f"Unknown word: {word!r}")
+    state.ds.append(state.xt_address(word, cast(XT, xt)))
 
 
-@intercept_stack_error
 def xt_r_execute(state: State) -> Optional[POINTER]:
     xt_addr: POINTER = state.ds.pop()
-    word_and_xt = get_word_from_address(state.execution_tokens, xt_addr)
-    assert word_and_xt is not None
-    return execute_immediate(state, word_and_xt[1])
+    word_and_xt = state.xt_at(xt_addr)
+    if word_and_xt is None:
+        fatal(f"Cannot find word from address: {xt_addr!r}")
+    return execute_immediate(state, cast(tuple[WORD, XT], word_and_xt)[1])
 
 
 @compiling_word
@@ -175,11 +219,16 @@ def xt_c_bracket_compile(state: State) -> None:
     state.compile_to_current_definition([xt_c_compile, word])
 
 
+@literal_operand
 @compiling_word
 def xt_c_compile(state: State) -> POINTER:
     assert state.is_compiling
     word: WORD = cast(WORD, state.current_execution_token)
-    state.compile_to_current_definition(deferred_definition(word))
+    xt: XT | None = state.execution_tokens.get(word)
+    if xt is None:
+        state.compile_to_current_definition(deferred_definition(word))
+    else:
+        state.compile_word(word, xt)
     return state.instruction_pointer + 1
 
 
@@ -188,26 +237,13 @@ def execute_immediate(state: State, func: XT) -> Optional[POINTER]:
         return state.execute(cast(DEFINED_XT, func))
     else:
         assert callable(func)
-        return func(state)
+        try:
+            return func(state)
+        except IndexError:
+            raise stack_underflow(state, func) from None
 
 
-def get_word_from_address(words: dict[WORD, XT], addr: POINTER) -> tuple[WORD, XT] | None:
-    for index, (word, xt) in enumerate(words.items()):
-        if index == addr:
-            return word, xt
-    fatal(f"Cannot find word from address: {addr!r}")
-    return None
-
-
-def get_word_address(words: dict[WORD, XT], word: WORD) -> POINTER | None:
-    for addr, (label, xt) in enumerate(words.items()):
-        if label == word:
-            return addr
-    fatal(f"Unknown word: {word!r}")
-    return None
-
-
-def search_word(words: dict[WORD, XT], word: WORD) -> tuple[bool, bool, XT | None]:
+def search_word(words: Mapping[WORD, XT], word: WORD) -> tuple[bool, bool, XT | None]:
 
     xt: XT | None = words.get(word)
 
@@ -216,8 +252,12 @@ def search_word(words: dict[WORD, XT], word: WORD) -> tuple[bool, bool, XT | Non
     return found, immediate, xt
 
 
-def compile_address(word: WORD, xt_r: XT) -> DEFINED_XT:
+def compile_address(word: WORD, xt_r: XT, early_binding: bool = False) -> DEFINED_XT:
     if isinstance(xt_r, list):
+        if early_binding:  # bind to the definition visible now, as Forth does
+            return DefinedExecutionToken([xt_r_call, xt_r])
+        return deferred_definition(word)
+    if not early_binding and hasattr(xt_r, 'definition'):  # colon definition translated to Python
         return deferred_definition(word)
 
     return DefinedExecutionToken([xt_r, ])  # push builtin for runtime
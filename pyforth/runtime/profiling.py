@@ -0,0 +1,13 @@
+from pyforth.core import State
+
+
+def xt_r_profile_on(state: State) -> None:
+    state.set_profiling(True)
+
+
+def xt_r_profile_off(state: State) -> None:
+    state.set_profiling(False)
+
+
+def xt_r_dot_profile(state: State) -> None:  # collapsed stacks, one per line
+    state.output.write(state.collapsed_stacks())
@@ -1,64 +1,137 @@
-from pyforth.core import STACK, LITERAL
-from .utils import pass_both_stacks, pure_stack_operation, intercept_stack_error
+from pyforth.core import LITERAL, State
+from .utils import bool2forth
 
 
-@intercept_stack_error
-@pure_stack_operation
-def xt_r_depth(ds: STACK) -> None:
+def xt_r_depth(state: State) -> None:
+    ds = state.ds
     ds.append(len(ds))
 
 
-@intercept_stack_error
-@pure_stack_operation
-def xt_r_swap(ds: STACK) -> None:
+def xt_r_swap(state: State) -> None:
+    ds = state.ds
     a = ds.pop()
     b = ds.pop()
     ds.append(a)
     ds.append(b)
 
 
-@intercept_stack_error
-@pure_stack_operation
-def xt_r_dup(ds: STACK) -> None:
-    ds.append(ds[-1])
+def xt_r_dup(state: State) -> None:
+    ds = state.ds
+    a = ds.pop()
+    ds += [a, a]
 
 
-@intercept_stack_error
-@pure_stack_operation
-def xt_r_drop(ds: STACK) -> None:
+def xt_r_drop(state: State) -> None:
+    ds = state.ds
     ds.pop()
 
 
-@intercept_stack_error
-@pure_stack_operation
-def xt_r_rot(ds: STACK) -> None:
+def xt_r_rot(state: State) -> None:
+    ds = state.ds
     first = ds.pop()
     second = ds.pop()
     third = ds.pop()
     ds += [second, first, third]
 
 
-@intercept_stack_error
-@pass_both_stacks
-def xt_r_to_rs(ds: STACK, rs: STACK) -> None:
-    rs.append(ds.pop())
+def xt_r_to_rs(state: State) -> None:
+    state.rs.append(state.ds.pop())
 
 
-@intercept_stack_error
-@pass_both_stacks
-def xt_r_from_rs(ds: STACK, rs: STACK) -> None:
-    ds.append(rs.pop())
+def xt_r_from_rs(state: State) -> None:
+    state.ds.append(state.rs.pop())
 
 
-@intercept_stack_error
-@pass_both_stacks
-def xt_r_rs_at(ds: STACK, rs: STACK) -> None:
-    ds.append(rs[-1])
+def xt_r_rs_at(state: State) -> None:
+    state.ds.append(state.rs[-1])
 
 
-@intercept_stack_error
-@pure_stack_operation
-def xt_r_pick(ds: STACK) -> None:
+def xt_r_pick(state: State) -> None:
+    ds = state.ds
     index: LITERAL = ds.pop()
     value = ds[-(1+index)]
     ds.append(value)
+
+
+def xt_r_over(state: State) -> None:
+    ds = state.ds
+    b = ds.pop()
+    a = ds.pop()
+    ds += [a, b, a]
+
+
+def xt_r_nip(state: State) -> None:
+    ds = state.ds
+    b = ds.pop()
+    ds.pop()
+    ds.append(b)
+
+
+def xt_r_tuck(state: State) -> None:
+    ds = state.ds
+    b = ds.pop()
+    a = ds.pop()
+    ds += [b, a, b]
+
+
+def xt_r_qdup(state: State) -> None:
+    ds = state.ds
+    a = ds.pop()
+    ds.append(a)
+    if a != 0:
+        ds.append(a)
+
+
+def xt_r_2dup(state: State) -> None:
+    ds = state.ds
+    b = ds.pop()
+    a = ds.pop()
+    ds += [a, b, a, b]
+
+
+def xt_r_2drop(state: State) -> None:
+    ds = state.ds
+    ds.pop()
+    ds.pop()
+
+
+def xt_r_2swap(state: State) -> None:
+    ds = state.ds
+    d = ds.pop()
+    c = ds.pop()
+    b = ds.pop()
+    a = ds.pop()
+    ds += [c, d, a, b]
+
+
+def xt_r_2over(state: State) -> None:
+    ds = state.ds
+    d = ds.pop()
+    c = ds.pop()
+    b = ds.pop()
+    a = ds.pop()
+    ds += [a, b, c, d, a, b]
+
+
+def xt_r_2to_rs(state: State) -> None:
+    ds, rs = state.ds, state.rs
+    b = ds.pop()
+    a = ds.pop()
+    rs += [a, b]
+
+
+def xt_r_2from_rs(state: State) -> None:
+    ds, rs = state.ds, state.rs
+    b = rs.pop()
+    a = rs.pop()
+    ds += [a, b]
+
+
+def xt_r_stack_q(state: State) -> None:
+    ds = state.ds
+    ds.append(bool2forth(ds))
+
+
+def xt_r_clear(state: State) -> None:
+    ds = state.ds
+    ds.clear()
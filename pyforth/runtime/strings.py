@@ -1,9 +1,10 @@
-import sys
+from array import array
 from typing import Final
 
-from pyforth.core import State, LITERAL, POINTER, WORD, NATIVE_XT
+from pyforth.core import State, LITERAL, POINTER, WORD
+from .heap import CELL_TYPECODE, check_region
 from .primitives import xt_r_push
-from .utils import flush_stdout, compiling_word, fatal, intercept_stack_error
+from .utils import compiling_word, fatal
 
 QUOTE: Final[str] = r'"'
 
@@ -12,9 +13,8 @@ QUOTE: Final[str] = r'"'
 def xt_c_dot_quote(state: State) -> None:
     value: str = parse_string(state, until=QUOTE)
 
-    @flush_stdout
-    def xt_r_dot_quote(*_) -> None:
-        sys.stdout.write(value)
+    def xt_r_dot_quote(state: State) -> None:
+        state.output.write(value)
 
     if state.is_compiling:
         state.compile_to_current_definition([xt_r_dot_quote,])
@@ -27,51 +27,38 @@ def xt_c_char_quote(state: State) -> None:
     if not state.is_compiling:
         fatal("C\" Interpreting a compile-only word")
     value: str = parse_string(state, until=QUOTE)
-    state.compile_to_current_definition([_store_string(value, counted=True)])
+    state.compile_to_current_definition([xt_r_push, state.intern_string(value, counted=True)])
 
 
-def _store_string(s: str, counted: bool = False) -> NATIVE_XT:
-
-    def _xt(state: State) -> None:
-        cells: list[int] = [ord(c) for c in s]
-        start: int = state.next_heap_address
-        state.next_heap_address += len(cells) + (1 if counted else 0)
-        if counted:
-            state.heap[start] = len(s)
-        for offset, cell in enumerate(cells):
-            state.heap[start + offset + (1 if counted else 0)] = cells[offset]
-        state.ds.append(start)
-        if not counted:
-            state.ds.append(len(s))
-
-    return _xt
+def store_string(state: State, s: str, counted: bool = False) -> POINTER:
+    """copy s to the heap, prefixed with its length when counted"""
+    cells: array[int] = array(CELL_TYPECODE, [ord(c) for c in s])
+    if counted:
+        cells.insert(0, len(s))
+    start: POINTER = state.allot(len(cells))
+    state.heap[start:start + len(cells)] = cells
+    return start
 
 
 @compiling_word
 def xt_c_s_quote(state: State) -> None:
     value: str = parse_string(state, until=QUOTE)
 
-    if state.is_compiling:
-        state.compile_to_current_definition([_store_string(value),])
+    if state.is_compiling:  # stored once, running the definition only pushes addr len
+        state.compile_to_current_definition([xt_r_push, state.intern_string(value), xt_r_push, len(value)])
     else:
-        _store_string(value)(state)
+        state.ds += [store_string(state, value), len(value)]
 
 
-@flush_stdout
 def xt_r_type(state: State) -> None:
     count: LITERAL = state.ds.pop()
     addr: POINTER = state.ds.pop()
-    s: str = ''.join(chr(state.heap[inx]) for inx in range(addr, addr+count))
-    sys.stdout.write(s)
+    s: str = ''.join(map(chr, state.heap[check_region(state, addr, count)]))
+    state.output.write(s)
 
 
 def parse_string(state: State, until: str) -> str:
-    c: str = state.next_char()
-    s: str = ''
-    while c and c != until:
-        s += c
-        c = state.next_char()
-    return s
+    return state.parse(until)
 
 
 def xt_r_char(state: State) -> None:
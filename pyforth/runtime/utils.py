@@ -1,8 +1,8 @@
-import sys
+import copy
 from functools import wraps
-from typing import Callable, Optional, Any, cast
+from typing import Callable, Optional, Any
 
-from pyforth.core import DEFINED_XT, NATIVE_XT, POINTER, STACK, State, WORD, StackUnderflowError
+from pyforth.core import NATIVE_XT, POINTER, State, XT, XT_ATOM, StackUnderflowError
 from pyforth.core import ForthCompilationError
 
 
@@ -11,45 +11,20 @@ def fatal(msg: str) -> None:
     raise ForthCompilationError(msg)
 
 
-def flush_stdout(func: NATIVE_XT) -> NATIVE_XT:
-    @wraps(func)
-    def wrapper(state: State) -> None:
-        func(state)
-        if state.interactive:
-            sys.stdout.flush()
-
-    return wrapper
-
-
-def bool2forth(value: Any) -> int:
-    return -1 if bool(value) else 0
-
-
-def pass_both_stacks(func: Callable[[STACK, STACK], None]) -> NATIVE_XT:
-
-    @wraps(func)
-    def wrapper(state: State, *_) -> None:
-        func(state.ds, state.rs)
-
-    return wrapper
+def copy_xt(xt: XT) -> XT:
+    """a copy of xt with the same attributes, so that they can be changed"""
+    if isinstance(xt, list):
+        return copy.copy(xt)
 
-
-def pass_data_stack(func: Callable[[STACK], Optional[POINTER]]) -> NATIVE_XT:
-
-    @wraps(func)
+    @wraps(xt)
     def wrapper(state: State) -> Optional[POINTER]:
-        return func(state.ds)
+        return xt(state)
 
     return wrapper
 
 
-def pure_stack_operation(func: Callable[[STACK], None]) -> NATIVE_XT:
-
-    @wraps(func)
-    def wrapper(state: State) -> None:
-        func(state.ds)
-
-    return wrapper
+def bool2forth(value: Any) -> int:
+    return -1 if bool(value) else 0
 
 
 def compiling_word(func: Callable[[State], Optional[POINTER]]) -> NATIVE_XT:
@@ -63,14 +38,22 @@ def compiling_word(func: Callable[[State], Optional[POINTER]]) -> NATIVE_XT:
     return wrapper
 
 
-def intercept_stack_error(func: NATIVE_XT) -> NATIVE_XT:
+def literal_operand(func: NATIVE_XT) -> NATIVE_XT:
+    """the cell following func in a definition is an operand, not an xt"""
+    setattr(func, '_operand', 'literal')
+    return func
 
-    @wraps(func)
-    def wrapper(*args, **kwargs) -> Any:
-        try:
-            return func(*args, **kwargs)
-        except IndexError as err:
-            if "pop from empty list" in str(err).lower():
-                raise StackUnderflowError("Stack underflow error") from None
-
-    return cast(NATIVE_XT, wrapper)
+
+def jump_operand(func: NATIVE_XT) -> NATIVE_XT:
+    """the cell following func in a definition is a jump address"""
+    setattr(func, '_operand', 'jump')
+    return func
+
+
+def stack_underflow(state: State, xt: XT_ATOM) -> StackUnderflowError:
+    """error naming the word whose xt popped from an empty stack"""
+    word: str = next(
+        (label for label, candidate in state.execution_tokens.items() if candidate is xt),
+        getattr(xt, '__name__', repr(xt))
+    )
+    return StackUnderflowError(f"Stack underflow error: {word}")
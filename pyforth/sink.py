@@ -0,0 +1,46 @@
+from __future__ import annotations
+import io
+import sys
+from typing import BinaryIO, Final, Optional, TextIO, cast
+
+
+BUFFER_SIZE: Final[int] = 8 * 1024
+
+
+class OutputSink:
+    """Text written by output words, buffered until flushed to a stream
+
+    Without a stream, text goes to whatever sys.stdout is when flushed.
+    Binary streams are written encoded text.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO | BinaryIO] = None,
+        buffer_size: int = BUFFER_SIZE,
+        encoding: str = 'utf-8'
+    ) -> None:
+        self._stream: Optional[TextIO | BinaryIO] = stream
+        self._buffer_size: int = buffer_size
+        self._encoding: str = encoding
+        self._pieces: list[str] = []
+        self._size: int = 0
+
+    def write(self, text: str) -> None:
+        self._pieces.append(text)
+        self._size += len(text)
+        if self._size >= self._buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pieces:
+            return
+        text: str = ''.join(self._pieces)
+        self._pieces.clear()
+        self._size = 0
+        stream: TextIO | BinaryIO = sys.stdout if self._stream is None else self._stream
+        if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+            cast(BinaryIO, stream).write(text.encode(self._encoding))
+        else:
+            cast(TextIO, stream).write(text)
+        stream.flush()
@@ -0,0 +1,139 @@
+from __future__ import annotations
+import functools
+import hashlib
+import importlib
+import io
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Final, NamedTuple, Optional, Sequence
+
+from .core import LITERAL, POINTER, WORD, XT
+
+
+SNAPSHOT_VERSION: Final[int] = 3
+CACHE_DIR_VARIABLE: Final[str] = 'PYFORTH_CACHE_DIR'
+_ALLOWED_GLOBALS: Final[frozenset[tuple[str, str]]] = frozenset({  # all a snapshot refers to, native xts apart
+    ('pyforth.snapshot', 'Snapshot'), ('pyforth.core', 'DefinedExecutionToken'),
+    ('array', 'array'), ('array', '_array_reconstructor'),
+})
+
+
+class Snapshot(NamedTuple):
+    """State left by the bootstrap of an interpreter"""
+    words: dict[WORD, XT]
+    heap: Sequence[LITERAL]
+    next_heap_address: POINTER
+    xts: list[tuple[WORD, XT]]  # addresses given by ' the heap may hold
+
+
+def cache_dir() -> Path:
+    if CACHE_DIR_VARIABLE in os.environ:
+        return Path(os.environ[CACHE_DIR_VARIABLE])
+    return Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'pyforth'
+
+
+@functools.cache
+def _runtime_fingerprint() -> str:
+    """identifies the modules compiled definitions refer to, they do not change once imported"""
+    digest = hashlib.sha256()
+    for module in sorted(Path(__file__).parent.rglob('*.py')):
+        stat = module.stat()
+        digest.update(f'{module.name}:{stat.st_size}:{stat.st_mtime_ns}'.encode())
+    return digest.hexdigest()
+
+
+def snapshot_key(extensions: Sequence[Path], options: Sequence[Any]) -> str:
+    """hash of the extensions and compiler options, then of their sources and the runtime it was compiled with
+
+    The first hash names the snapshots of a configuration, only the last of them is kept.
+    """
+    configuration: str = hashlib.sha256(repr((tuple(map(str, extensions)), tuple(options))).encode()).hexdigest()
+    digest = hashlib.sha256(repr((SNAPSHOT_VERSION, _runtime_fingerprint())).encode())
+    for extension in extensions:
+        digest.update(extension.read_bytes())
+    return f'{configuration[:16]}-{digest.hexdigest()}'
+
+
+def _native_xts() -> dict[int, tuple[str, str]]:
+    """module and name of every native xt a definition may refer to"""
+    natives: dict[int, tuple[str, str]] = {}
+    for module_name, module in list(sys.modules.items()):
+        if not module_name.startswith('pyforth.runtime'):
+            continue
+        for name, obj in vars(module).items():
+            if callable(obj) and not isinstance(obj, type):
+                natives.setdefault(id(obj), (module_name, name))
+    return natives
+
+
+class _Pickler(pickle.Pickler):
+    """native xts are pickled by reference, closures included"""
+
+    def __init__(self, file: io.BytesIO) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._natives: dict[int, tuple[str, str]] = _native_xts()
+
+    def persistent_id(self, obj: Any) -> Optional[tuple[str, str]]:
+        if callable(obj) and not isinstance(obj, (list, type)):
+            return self._natives.get(id(obj))
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+    """only the globals of a snapshot and runtime xts are loaded, the cache directory may be shared"""
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) not in _ALLOWED_GLOBALS:  # dotted names included, they would reach module globals
+            raise pickle.UnpicklingError(f"Unexpected global in snapshot: {module}.{name}")
+        return super().find_class(module, name)
+
+    def persistent_load(self, pid: Any) -> Any:
+        module_name, name = pid
+        xt: Any = None
+        if module_name.startswith('pyforth.runtime.') and name.startswith('xt_'):
+            xt = vars(importlib.import_module(module_name)).get(name)
+        if not callable(xt) or isinstance(xt, type):
+            raise pickle.UnpicklingError(f"Unexpected native xt in snapshot: {module_name}.{name}")
+        return xt
+
+
+def load_snapshot(key: str) -> Snapshot | None:
+    path: Path = cache_dir() / f'{key}.snapshot'
+    try:
+        with path.open('rb') as stream:
+            snapshot = _Unpickler(stream).load()
+    except Exception:  # missing, stale or corrupted, will be overwritten
+        return None
+    return snapshot if isinstance(snapshot, Snapshot) else None
+
+
+def save_snapshot(key: str, snapshot: Snapshot) -> bool:
+    """False when the snapshot cannot be pickled (closures compiled by ." for instance) or stored"""
+    buffer = io.BytesIO()
+    try:
+        _Pickler(buffer).dump(snapshot)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    directory: Path = cache_dir()
+    temp_path: Path = directory / f'{key}.{os.getpid()}.tmp'
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        temp_path.write_bytes(buffer.getvalue())
+        os.replace(temp_path, directory / f'{key}.snapshot')  # atomic for concurrent workers
+    except OSError:
+        return False
+    _remove_stale_snapshots(directory, key)
+    return True
+
+
+def _remove_stale_snapshots(directory: Path, key: str) -> None:
+    """snapshots of the same configuration left by older sources or runtimes"""
+    configuration: str = key.partition('-')[0]
+    for path in directory.glob(f'{configuration}-*.snapshot'):
+        if path.stem != key:
+            try:
+                path.unlink()
+            except OSError:  # removed by a concurrent worker
+                pass
@@ -0,0 +1,85 @@
+from __future__ import annotations
+import re
+from typing import Final, Optional, Pattern, TextIO
+
+
+CHUNK_SIZE: Final[int] = 64 * 1024
+
+
+class InputSource:
+    """Forth source text consumed from an offset, never by slicing what remains
+
+    Every read starts at the current offset, hence parsing a source is
+    linear in its size. Consumed text is only dropped when more is fed.
+    Given a stream, text is pulled from it chunk by chunk when a read
+    reaches the end of what is buffered.
+    """
+
+    _WORD: Final[Pattern[str]] = re.compile(r'\s*(\S+)\s+')
+    _NON_BLANK: Final[Pattern[str]] = re.compile(r'\S')
+
+    def __init__(self, text: str = '', stream: Optional[TextIO] = None, chunk_size: int = CHUNK_SIZE) -> None:
+        self._buffer: str = text
+        self._offset: int = 0
+        self._stream: Optional[TextIO] = stream
+        self._chunk_size: int = chunk_size
+
+    @property
+    def remaining(self) -> str:
+        return self._buffer[self._offset:]
+
+    @property
+    def blank(self) -> bool:
+        """nothing but whitespaces left"""
+        while self._NON_BLANK.search(self._buffer, self._offset) is None:
+            if self._stream is None:
+                return True
+            self._offset = len(self._buffer)  # no need to keep them around while reading on
+            self._pull()
+        return False
+
+    def feed(self, text: str) -> None:
+        self._buffer = self._buffer[self._offset:] + text
+        self._offset = 0
+
+    def _pull(self) -> bool:
+        """read next chunk from the stream, False when there is nothing more to read"""
+        if self._stream is None:
+            return False
+        chunk: str = self._stream.read(self._chunk_size)
+        if not chunk:
+            self._stream = None
+            chunk = ' \n'  # as for a text source, the last word is followed by a whitespace
+        self.feed(chunk)
+        return True
+
+    def next_word(self) -> str:
+        match = self._WORD.match(self._buffer, self._offset)
+        # trailing whitespaces or the word itself might go on in next chunk
+        while (match is None or match.end() == len(self._buffer)) and self._pull():
+            match = self._WORD.match(self._buffer, self._offset)
+        if match is None:
+            return ''
+        self._offset = match.end()
+        return match.group(1)
+
+    def next_char(self) -> str:
+        if self._offset >= len(self._buffer) and not self._pull():
+            return ''
+        c: str = self._buffer[self._offset]
+        self._offset += 1
+        return c
+
+    def parse(self, delimiter: str) -> tuple[str, bool]:
+        """text up to delimiter, which is consumed, and whether delimiter was met"""
+        pieces: list[str] = []
+        while True:
+            end: int = self._buffer.find(delimiter, self._offset)
+            if end >= 0:
+                pieces.append(self._buffer[self._offset:end])
+                self._offset = end + len(delimiter)
+                return ''.join(pieces), True
+            pieces.append(self._buffer[self._offset:])
+            self._offset = len(self._buffer)
+            if not self._pull():
+                return ''.join(pieces), False
@@ -0,0 +1,45 @@
+from __future__ import annotations
+from collections import deque
+from collections.abc import Mapping
+from typing import Final, NamedTuple, Optional
+
+from .core import DEFINED_XT, LITERAL, POINTER, WORD, XT, XT_ATOM
+
+
+TRACE_SIZE: Final[int] = 64
+
+
+class TraceEntry(NamedTuple):
+    definition: WORD
+    ip: POINTER  # address of word in definition
+    word: WORD
+    tos: Optional[LITERAL]  # top of the data stack before word ran, None when empty
+
+    def __str__(self) -> str:
+        tos: str = 'empty' if self.tos is None else repr(self.tos)
+        return f"{self.definition or '?'}+{self.ip} {self.word} tos={tos}"
+
+
+class Tracer:
+    """Last instructions executed, kept in a ring buffer
+
+    Recording stores references only, xts are named when the trace is read.
+    Primitives run from the input are recorded as words of an '(input)'
+    definition.
+    """
+
+    def __init__(self, size: int = TRACE_SIZE) -> None:
+        self._entries: deque[tuple[DEFINED_XT, POINTER, XT_ATOM, Optional[LITERAL]]] = deque(maxlen=size)
+        self.record = self._entries.append
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def entries(self, words: Mapping[WORD, XT]) -> list[TraceEntry]:
+        names: dict[int, WORD] = {}
+        for word, xt in words.items():
+            names.setdefault(id(xt), word)
+        return [
+            TraceEntry(getattr(code, 'name', ''), ip, names.get(id(xt)) or getattr(xt, '__name__', '?'), tos)
+            for code, ip, xt, tos in self._entries
+        ]
@@ -3,6 +3,14 @@ import pytest
 from pyforth.interpreter import Interpreter
 
 
+@pytest.fixture(scope='session', autouse=True)
+def cache_dir_for_session(tmp_path_factory):
+    """snapshots go to a temporary directory, not to the user cache"""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv('PYFORTH_CACHE_DIR', str(tmp_path_factory.mktemp('cache')))
+        yield
+
+
 @pytest.fixture(scope='function')
 def interpreter():
     interpreter = Interpreter()
@@ -0,0 +1,22 @@
+from pyforth.interpreter import Interpreter
+
+
+CONTROL_FLOW_PROGRAMS = [  # every branching word, for the tests comparing two ways of running code
+    ': main 0 IF 1 ELSE 2 THEN DUP ; main',
+    ': main 1 begin dup 1 + 2dup < until 2drop ; 3 main',
+    ': main 0 begin DUP 3 < while 1 + dup repeat drop ; main',
+    ': main begin dup 3 > if drop exit then dup 1 + again ; 1 main',
+    ': main begin dup 3 = if exit then 1 +  false until ; 1 main',
+    ': main 1 1 do i 1 = if exit then loop ; main',
+    ': main 4 1 do 3 1 do 2 1 do i j k + + loop loop loop ; main',
+    ': main 10 0 do i 5 > if i 1 - then loop ; main',
+    ': fact dup 2 < if drop 1 exit then dup 1 - recurse * ; 5 fact',
+]
+
+
+def assert_parity(program: str, reference: Interpreter, other: Interpreter) -> None:
+    """both interpreters leave the same stacks after running the program"""
+    reference.run(program)
+    other.run(program)
+    assert other.data_stack == reference.data_stack
+    assert other.return_stack == reference.return_stack
@@ -0,0 +1,61 @@
+import pytest
+
+from pyforth.core import ForthRuntimeError
+from pyforth.runtime import arrays
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def interpreter(request, interpreter, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(arrays, 'np', None)
+    interpreter.run('create a 100 allot create b 100 allot : init 100 0 do i a i + ! i 2 * b i + ! loop ; init')
+    return interpreter
+
+
+def cells(interpreter, name, n=100):
+    interpreter.run(name)
+    addr = interpreter._state.ds.pop()
+    return list(interpreter._state.heap[addr:addr + n])
+
+
+def test_sum(interpreter):
+    interpreter.run('a 100 array-sum a 3 array-sum')
+    assert interpreter.data_stack == [4950, 3]
+
+
+def test_dot(interpreter):
+    interpreter.run('a b 100 array-dot')
+    assert interpreter.data_stack == [2 * sum(i * i for i in range(100))]
+
+
+def test_scale_and_add(interpreter):
+    interpreter.run('a 100 3 array-scale a b 100 array-add')
+    assert cells(interpreter, 'a') == [3 * i for i in range(100)]
+    assert cells(interpreter, 'b') == [5 * i for i in range(100)]
+
+
+def test_fixed_point(interpreter):
+    interpreter.run('a 100 1.0 array-scale b 100 1.0 array-scale')  # i and 2i as fixed-point numbers
+    interpreter.run('a 100 1.5 array-fscale a b 100 array-f* a b 100 array-fdot')
+    assert interpreter.data_stack == [450000 * sum(i ** 3 for i in range(100))]
+    assert cells(interpreter, 'a') == [150000 * i for i in range(100)]
+    assert cells(interpreter, 'b') == [300000 * i * i for i in range(100)]
+
+
+def test_overlapping_regions(interpreter):
+    interpreter.run('a a 1 + 99 array-add')
+    assert cells(interpreter, 'a')[:4] == [0, 1, 3, 5]
+
+
+def test_results_beyond_cells(interpreter):
+    interpreter.run('1 62 lshift a 50 + ! a 100 array-sum')
+    assert interpreter.data_stack[-1] == 4950 - 50 + 2 ** 62
+    with pytest.raises(ForthRuntimeError):
+        interpreter.run('a 100 4 array-scale')
+
+
+def test_invalid_region(interpreter):
+    with pytest.raises(ForthRuntimeError):
+        interpreter.run('a 1000000 array-sum')
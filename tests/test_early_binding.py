@@ -0,0 +1,27 @@
+import pytest
+
+from pyforth.interpreter import Interpreter
+
+
+@pytest.mark.parametrize(
+    'early_binding, data_stack', [
+        (True, [1, 2]),
+        (False, [2, 2]),
+    ]
+)
+def test_redefinition(early_binding, data_stack):
+    interpreter = Interpreter(early_binding=early_binding)
+    interpreter.run(': foo 1 ; : bar foo ; : foo 2 ; bar foo')
+    assert interpreter.data_stack == data_stack
+
+
+@pytest.mark.parametrize(
+    'program, data_stack', [
+        (': caller callee ; : callee 5 ; caller', [5]),
+        (': sum dup 0= if exit then dup 1- recurse + ; 4 sum', [10]),
+        (': foo 1 ; : foo foo 1+ ; foo', [2]),
+    ]
+)
+def test_deferred_lookup(interpreter, program, data_stack):
+    interpreter.run(program)
+    assert interpreter.data_stack == data_stack
@@ -1,5 +1,9 @@
+import re
+
 import pytest
 
+from pyforth.core import StackUnderflowError
+
 
 @pytest.mark.parametrize(
     'program, word, data_stack, return_stack', [
@@ -20,6 +24,8 @@ def test_basic_define(interpreter, program, word, data_stack, return_stack):
         pytest.param(': MAIN 1 IF 2 THEN ; MAIN', [2], [], ),
         pytest.param(': MAIN IF 2 THEN DUP ; 3 0 MAIN', [3, 3], [], ),
         pytest.param(': MAIN IF DROP 2 THEN DUP ; 3 1 MAIN', [2, 2], []),
+        pytest.param(': MAIN 5 IF 1 ELSE 2 THEN ; MAIN', [1], []),
+        pytest.param(': MAIN 3 BEGIN DUP WHILE 1- REPEAT ; MAIN', [0], []),
     ]
 )
 def test_branching_structures(interpreter, program, data_stack, return_stack):
@@ -107,3 +113,49 @@ def test_non_reg_dot_s(interpreter, capsys):
     interpreter.run(program)
     captured = capsys.readouterr()
     assert captured.out == '1 2 3 4 \n'
+
+
+def test_execution_context_unwound_on_error(interpreter):
+    with pytest.raises(StackUnderflowError):
+        interpreter.run(': inner drop ; : outer inner ; outer')
+    interpreter.run(': main 3 0 do i loop ; main')
+    assert interpreter.data_stack == [0, 1, 2]
+    assert interpreter.return_stack == []
+
+
+@pytest.mark.parametrize(
+    'program, word', [
+        ('1 +', '+'),
+        (': inner drop drop ; : outer 1 inner ; outer', 'drop'),
+        (': main r> ; main', 'r>'),
+        ("' dup execute", 'dup'),
+        (': main 5 0 do loop ; main 2 2 */', '*/'),
+    ]
+)
+def test_stack_underflow_names_word(interpreter, program, word):
+    with pytest.raises(StackUnderflowError, match=f"Stack underflow error: {re.escape(word)}$"):
+        interpreter.run(program)
+
+
+@pytest.mark.parametrize(
+    'program, data_stack', [
+        (': main 10 0 do i 3 +loop ; main', [0, 3, 6, 9]),
+        (': main 0 10 do i -3 +loop ; main', [10, 7, 4, 1]),
+        (': main 0 3 do i -1 +loop ; main', [3, 2, 1, 0]),
+        (': main 0 0 ?do i loop 1 ; main', [1]),
+        (': main 3 0 ?do i loop ; main', [0, 1, 2]),
+        (': main 10 0 do i i 3 = if leave then loop ; main', [0, 1, 2, 3]),
+        (': main 10 0 do begin i 2 = if leave then true until i loop 7 ; main', [0, 1, 7]),
+        (': main 3 0 do 3 0 do j i = if leave then i loop loop ; main', [0, 0, 1]),
+        (': main 10 0 do i 2 = if leave then i 5 = if leave then i loop ; main', [0, 1]),
+        (': main 1 2 >r >r unloop ; main', []),
+        (': main 10 0 do i 5 = if exit then i 3 = if exit then i loop ; main', [0, 1, 2]),
+        (': main 10 0 do i 3 = if exit then i 5 = if exit then i loop ; main', [0, 1, 2]),
+        (': main 2 0 do 2 0 do 2 0 do k j i loop loop loop ; main',
+         [0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 1, 1, 1, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1]),
+    ]
+)
+def test_loop_words(interpreter, program, data_stack):
+    interpreter.run(program)
+    assert interpreter.data_stack == data_stack
+    assert interpreter.return_stack == []
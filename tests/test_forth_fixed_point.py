@@ -1,7 +1,11 @@
-import pytest
+import math
+import time
 
+import pytest
 
-from pyforth.runtime.fixed_point import parse_to_fp
+from pyforth.core import ForthCompilationError, ForthRuntimeError
+from pyforth.runtime import fixed_math
+from pyforth.runtime.fixed_point import parse_number, parse_to_fp
 
 
 @pytest.mark.parametrize(
@@ -75,3 +79,124 @@ def test_f_literal(interpreter, program, data_stack):
     interpreter.run(program)
     assert interpreter.data_stack == data_stack
 
+
+
+@pytest.mark.parametrize(
+    'program, data_stack', [
+        ('2.0 fsqrt', [141421]),
+        ('1.0 fexp', [271828]),
+        ('2.0 fln', [69315]),
+        ('100.0 flog', [200000]),
+        ('0.5 fsin 0.5 fcos', [47943, 87758]),
+        ('3.0 4.0 fatan2 -1.0 -1.0 fatan2', [64350, -235619]),
+        ('2.0 0.5 f** -2.0 3.0 f** 2.0 -1.0 f**', [141421, -800000, 50000]),
+        ('20 set-precision 2 100000000000000000000 * fsqrt', [141421356237309504880]),
+        ('20 set-precision 100000000000000000000 fexp', [271828182845904523536]),
+        ('20 set-precision 3 100000000000000000000 * 4 100000000000000000000 * fatan2', [64350110879328438680]),
+        ('12 set-precision 3141592653590 fsin', [0]),
+        ('12 set-precision -1000000000000 facos', [3141592653590]),
+    ]
+)
+def test_f_math(interpreter, program, data_stack):
+    interpreter.run(program)
+    assert interpreter.data_stack == data_stack
+
+
+@pytest.mark.parametrize('program', ['-1.0 fsqrt', '0 fln', '2.0 fasin', '2.0 facos', '-8.0 0.5 f**', '0 -1.0 f**'])
+def test_f_math_domain_error(interpreter, program):
+    with pytest.raises(ForthRuntimeError, match='domain'):
+        interpreter.run(program)
+
+
+@pytest.mark.parametrize('program', ['1000.0 fexp', '1000.0 fcosh', '10.0 400.0 f**'])
+def test_f_math_range_error(interpreter, program):
+    with pytest.raises(ForthRuntimeError, match='range'):
+        interpreter.run(program)
+
+
+@pytest.mark.parametrize(
+    'program, data_stack', [
+        ('0.5 2000000.0 f**', [0]),
+        ('2.0 -2000000.0 f**', [0]),
+        ('2.0 -20000000.0 f**', [0]),
+        ('7 set-precision 1.0000001 1000000.0 f**', [11051709]),  # (1 + 1e-7)**1e6 = 1.10517091...
+        ('7 set-precision 0.9999999 1000000.0 f**', [9048374]),  # 0.90483741...
+        ('7 set-precision -1.0000001 -1000001.0 f**', [-9048373]),  # -0.90483732...
+    ]
+)
+def test_f_power_large_exponent(interpreter, program, data_stack):
+    started = time.perf_counter()
+    interpreter.run(program)
+    assert interpreter.data_stack == data_stack
+    assert time.perf_counter() - started < 1.0
+
+
+@pytest.mark.parametrize('name', [
+    'sqrt', 'exp', 'ln', 'log', 'sin', 'cos', 'tan', 'sinh', 'cosh', 'tanh',
+    'asin', 'acos', 'atan', 'asinh', 'acosh', 'atanh'
+])
+def test_float_path_matches_exact(name):
+    """with the default precision floats are used, they must round like exact computations"""
+    scale = 10 ** 5
+    func = getattr(math, {'ln': 'log', 'log': 'log10'}.get(name, name))
+    exact = getattr(fixed_math, name)
+    for x in range(-1_000_000, 1_000_000, 7919):
+        try:
+            y = exact(x, scale)
+        except ForthRuntimeError:
+            continue
+        assert round(func(x / scale) * scale) == y, x
+
+
+def test_set_precision_reaches_compiled_definitions(interpreter, capsys):
+    interpreter.run(': area dup f* f. ; 1.5 area 2 set-precision 150 area 0 set-precision 7 area')
+    assert capsys.readouterr().out == '2.250002.2549.0'
+
+
+@pytest.mark.parametrize(
+    'program, data_stack', [
+        ('hex 1E5 ff -A decimal', [0x1E5, 0xFF, -10]),
+        ('hex 1.5 decimal', [150000]),
+        ('binary 101 decimal', [5]),
+        ('30 set-precision 0.1', [10 ** 29]),
+        ('1. .5 +2.5 1e2', [100000, 50000, 250000, 10000000]),
+        ('0.000004 0.000005 0.000006', [0, 0, 1]),
+    ]
+)
+def test_number_literal(interpreter, program, data_stack):
+    interpreter.run(program)
+    assert interpreter.data_stack == data_stack
+
+
+def test_decimal_digits_not_in_base(interpreter):
+    with pytest.raises(ForthCompilationError):
+        interpreter.run('binary 123')
+
+
+@pytest.mark.parametrize('word', ['1' * 5000, '1.' + '5' * 5000, '-' + '9' * 4301])
+def test_literal_too_long(interpreter, word):
+    with pytest.raises(ForthCompilationError, match='digits'):
+        interpreter.run(word)
+    assert not interpreter.is_literal(word)
+
+
+def test_is_literal(interpreter):
+    assert interpreter.is_literal('12') and interpreter.is_literal('1.5') and not interpreter.is_literal('dup')
+    interpreter.run('binary')
+    assert interpreter.is_literal('123')  # a number still, which the base cannot represent
+
+
+def test_cell_bounds_precision(interpreter):
+    interpreter.run('18 set-precision variable x 1.0 x ! x @')
+    assert interpreter.data_stack == [10 ** 18]
+    with pytest.raises(ForthRuntimeError, match='does not fit in a cell'):
+        interpreter.run('19 set-precision variable y 1.0 y !')
+
+
+def test_literals_are_cached():
+    parse_number.cache_clear()
+    assert parse_number('1.5', 10, 5) == 150000
+    assert parse_number('1.5', 10, 5) == 150000
+    assert parse_number('1.5', 10, 3) == 1500
+    assert parse_number.cache_info().hits == 1
+    assert parse_number('word', 10, 5) is None
@@ -0,0 +1,112 @@
+import pytest
+
+from pyforth.core import ForthRuntimeError
+from pyforth.interpreter import Interpreter, MEMORY_SIZE
+
+
+@pytest.mark.parametrize(
+    'program, data_stack', [
+        ("create buffer 1000 allot 7 buffer 999 + ! buffer 999 + @", [7]),
+        ("create list 1 , 2 , 3 , list @ list 2 + @", [1, 3]),
+        ("here 10 allot -10 allot here =", [-1]),
+    ]
+)
+def test_heap(interpreter, program, data_stack):
+    interpreter.run(program)
+    assert interpreter.data_stack == data_stack
+
+
+def test_heap_grows(interpreter):
+    interpreter.run(f"create big {MEMORY_SIZE * 1000} allot 42 big {MEMORY_SIZE * 1000 - 1} + ! here")
+    assert interpreter.data_stack[0] > MEMORY_SIZE * 1000
+
+
+def test_heap_limit():
+    interpreter = Interpreter(heap_limit=MEMORY_SIZE)
+    with pytest.raises(ForthRuntimeError):
+        interpreter.run(f"create big {MEMORY_SIZE} allot")
+
+
+@pytest.mark.parametrize(
+    'program', [
+        "-1 @",
+        "1 -1 !",
+        "10000000 @",
+        "create x -100 allot",
+        "variable x 9223372036854775808 x !",
+    ]
+)
+def test_heap_errors(interpreter, program):
+    with pytest.raises(ForthRuntimeError):
+        interpreter.run(program)
+
+
+def test_mapped_heap(tmp_path):
+    heap_file = tmp_path / 'heap.bin'
+    program = "create table 100000 allot"
+    with Interpreter(heap_file=heap_file) as interpreter:
+        interpreter.run(f"{program} 42 table 99999 + ! 7 table !")
+
+    assert heap_file.stat().st_size >= 100000 * 8
+    with Interpreter(heap_file=heap_file) as interpreter:  # reopened without storing anything
+        interpreter.run(f"{program} table @ table 99999 + @")
+        assert interpreter.data_stack == [7, 42]
+
+
+def test_mapped_heap_errors(tmp_path):
+    with Interpreter(heap_file=tmp_path / 'heap.bin', heap_limit=MEMORY_SIZE) as interpreter:
+        with pytest.raises(ForthRuntimeError):
+            interpreter.run("variable x 9223372036854775808 x !")
+        with pytest.raises(ForthRuntimeError):
+            interpreter.run(f"{MEMORY_SIZE} allot")
+
+
+@pytest.mark.parametrize(
+    'program, data_stack', [
+        ("create a 1 , 2 , a 2@", [2, 1]),
+        ("create a 0 , 0 , 1 2 a 2! a @ a 1 + @", [2, 1]),
+        ("variable x 5 x ! 3 x +! -1 x +! x @", [7]),
+        ("create a 9 , 9 , 9 , 9 , a 1 + 2 7 fill a 1 + 2 erase a @ a 1 + @ a 2 + @ a 3 + @", [9, 0, 0, 9]),
+        ("create a 1 , 2 , 3 , 4 , a a 1 + 3 move a @ a 1 + @ a 2 + @ a 3 + @", [1, 1, 2, 3]),
+        ("create a 1 , 2 , 3 , a 1 + 0 -1 fill a 1 + @", [2]),
+    ]
+)
+def test_bulk_words(interpreter, program, data_stack):
+    interpreter.run(program)
+    assert interpreter.data_stack == data_stack
+
+
+def _reference_cmove(cells, src, dst, u, upwards):
+    for offset in (range(u) if upwards else reversed(range(u))):
+        cells[dst + offset] = cells[src + offset]
+    return cells
+
+
+@pytest.mark.parametrize('word, upwards', [('cmove', True), ('cmove>', False)])
+@pytest.mark.parametrize('src, dst, u', [
+    (0, 0, 5), (0, 2, 6), (2, 0, 6), (0, 1, 7), (1, 0, 7), (0, 3, 2), (3, 0, 2), (0, 5, 5), (5, 2, 5), (2, 3, 0),
+])
+@pytest.mark.parametrize('mapped', [False, True])
+def test_cmove(tmp_path, word, upwards, src, dst, u, mapped):
+    cells = list(range(1, 11))
+    with Interpreter(heap_file=tmp_path / 'heap.bin' if mapped else None) as interpreter:
+        interpreter.run(
+            f"create a {' , '.join(map(str, cells))} , "
+            f"a {src} + a {dst} + {u} {word} "
+            + ' '.join(f"a {offset} + @" for offset in range(len(cells)))
+        )
+        assert interpreter.data_stack == _reference_cmove(cells, src, dst, u, upwards)
+
+
+@pytest.mark.parametrize(
+    'program', [
+        "create a 1 , a 10000000 2 move",
+        "create a 1 , a a 1 + -1 cmove",
+        "100000000 2@",
+        "5 10000000 +!",
+        "create a 1 , a 1 9223372036854775808 fill",
+    ]
+)
+def test_bulk_errors(interpreter, program):
+    with pytest.raises(ForthRuntimeError):
+        interpreter.run(program)
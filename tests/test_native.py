@@ -0,0 +1,67 @@
+import pytest
+
+from pyforth.core import StackUnderflowError
+from pyforth.interpreter import Interpreter
+from tests.programs import CONTROL_FLOW_PROGRAMS, assert_parity
+
+
+PROGRAMS = CONTROL_FLOW_PROGRAMS + [
+    ': sign dup 0 < if drop -1 else 0 > if 1 else 0 then then ; -5 sign 0 sign 7 sign',
+    ': main 0 100 0 do i 7 = if leave then 1+ loop ; main',
+    ': main 0 10 0 do i + 3 +loop 0 -10 0 do i + -2 +loop ; main',
+    ': main 0 swap 0 ?do 1+ loop ; 0 main 3 main',
+    ': main 3 0 do 1 >r i r> + 2 0 do i j + + loop loop ; main',
+    ': main 1 >r 2 >r r@ r> r> - ; main',
+    ': main 1 2 3 rot over tuck nip 2swap 2over 2dup 2drop swap drop ; main',
+    ': main 7 2 /mod 7 2 mod 7 2 / -7 abs 3 negate 3 5 min 3 5 max ; main',
+    ': main 2.5 1.5 f* 2.5 0.5 f/ ; main',
+    'variable v : main 3 v ! v @ 1+ v ! v @ ; main',
+    ': main late ; : late 42 ; main',
+    ': main 0 10 0 do begin i 2 = if leave then true until i + loop ; main',
+]
+
+
+@pytest.mark.parametrize('program', PROGRAMS)
+def test_native_parity(program):
+    assert_parity(program, Interpreter(), Interpreter(native_code=True))
+
+
+def test_definition_translated():
+    interpreter = Interpreter(native_code=True)
+    interpreter.run(': main 10 0 do i + loop ;')
+    main = interpreter._state.execution_tokens['main']
+    assert not isinstance(main, list)
+    assert 'while True:' in main.source
+    assert isinstance(main.definition, list)  # threaded code it replaces
+
+
+def test_loop_index_kept_in_a_local():
+    interpreter = Interpreter(native_code=True)
+    interpreter.run(': main 0 10 0 do i + loop ;')
+    assert 'rs' not in interpreter._state.execution_tokens['main'].source.split('\n', 2)[2]
+
+
+def test_does_stays_threaded():
+    interpreter = Interpreter(native_code=True)
+    interpreter.run(': const create , does> @ ; 5 const five five')
+    assert isinstance(interpreter._state.execution_tokens['const'], list)
+    assert interpreter.data_stack == [5]
+
+
+def test_unstructured_jumps_stay_threaded():
+    interpreter = Interpreter(native_code=True)
+    interpreter.run(': main 0 10 0 do begin i 2 = if leave then true until i + loop ;')
+    assert isinstance(interpreter._state.execution_tokens['main'], list)
+
+
+def test_stack_underflow():
+    interpreter = Interpreter(native_code=True)
+    interpreter.run(': main + ;')
+    with pytest.raises(StackUnderflowError, match='main'):
+        interpreter.run('1 main')
+
+
+def test_late_binding_kept():
+    interpreter = Interpreter(native_code=True, early_binding=False)
+    interpreter.run(': foo 1 ; : bar foo ; : foo 2 ; bar foo')
+    assert interpreter.data_stack == [2, 2]
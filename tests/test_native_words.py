@@ -0,0 +1,128 @@
+import pytest
+
+
+# former core.forth definitions of the words now implemented natively
+REFERENCE = r"""
+: ref-dup 0 pick ;
+: ref-over 1 pick ;
+: ref-rot >r swap r> swap ;
+: ref-nip swap drop ;
+: ref-tuck swap ref-over ;
+: ref-1+ 1 + ;
+: ref-1- 1 - ;
+: ref-2* 1 LSHIFT ;
+: ref-2/ 1 RSHIFT ;
+: ref-negate 0 swap - ;
+: ref-abs ref-dup 0 < if ref-negate then ;
+: ref-2dup ref-over ref-over ;
+: ref-min ref-2dup < if else swap then drop ;
+: ref-max ref-2dup > if else swap then drop ;
+: ref-2drop drop drop ;
+: ref-2swap ref-rot >r ref-rot r> ;
+: ref-2>r swap >r >r ;
+: ref-2r> r> r> swap ;
+: ref-2over ref-2>r ref-2dup ref-2r> ref-2swap ;
+: ref-<> = invert ;
+: ref-0< 0 < ;
+: ref-0= 0 = ;
+: ref-0> 0 > ;
+: ref-0<> ref-0= invert ;
+: ref->= < invert ;
+: ref-<= > invert ;
+: ref-stack? depth ref-0<> ;
+: ref-?dup ref-dup ref-0<> if ref-dup then ;
+: ref-cells 1 * ;
+: ref-count ref-dup @ swap ref-1+ swap ;
+: ref-cr 10 emit ;
+: ref-bl 32 ;
+: ref-space ref-bl emit ;
+: ref-spaces ref-dup ref-0<> if 0 do ref-space loop then ;
+: ref-.s ref-stack? if depth 0 do depth i - ref-1- pick . ref-bl emit loop ref-cr then ;
+"""
+
+
+@pytest.mark.parametrize(
+    'word, arguments', [
+        ('dup', '3'),
+        ('over', '1 2'),
+        ('rot', '1 2 3'),
+        ('nip', '1 2'),
+        ('tuck', '1 2'),
+        ('1+', '-1'),
+        ('1-', '0'),
+        ('2*', '-7'),
+        ('2/', '-7'),
+        ('2/', '7'),
+        ('negate', '5'),
+        ('abs', '-5'),
+        ('abs', '5'),
+        ('min', '2 -3'),
+        ('min', '-3 2'),
+        ('max', '2 -3'),
+        ('max', '-3 2'),
+        ('2dup', '1 2'),
+        ('2drop', '1 2 3'),
+        ('2swap', '1 2 3 4'),
+        ('2over', '1 2 3 4'),
+        ('2>r', '1 2'),
+        ('2>r 2r>', '1 2'),
+        ('<>', '1 2'),
+        ('<>', '2 2'),
+        ('0<', '-1'),
+        ('0<', '0'),
+        ('0=', '0'),
+        ('0=', '3'),
+        ('0>', '1'),
+        ('0>', '0'),
+        ('0<>', '0'),
+        ('0<>', '-4'),
+        ('>=', '1 2'),
+        ('>=', '2 2'),
+        ('<=', '3 2'),
+        ('<=', '2 2'),
+        ('stack?', ''),
+        ('stack?', '1'),
+        ('?dup', '0'),
+        ('?dup', '2'),
+        ('cells', '4'),
+        ('count', '1 , 3 0'),
+        ('bl', ''),
+    ]
+)
+def test_stack_parity(interpreter, word, arguments):
+    interpreter.run(REFERENCE + f'{arguments} {word}')
+    native = interpreter.data_stack, interpreter.return_stack
+    reference = ' '.join(f'ref-{w}' for w in word.split())
+    interpreter.run(REFERENCE + f'{arguments} {reference}')
+    assert (interpreter.data_stack, interpreter.return_stack) == native
+
+
+@pytest.mark.parametrize(
+    'word, arguments', [
+        ('cr', ''),
+        ('space', ''),
+        ('spaces', '3'),
+        ('.s', ''),
+        ('.s', '1 2 3'),
+    ]
+)
+def test_output_parity(interpreter, word, arguments, capsys):
+    interpreter.run(REFERENCE + f'{arguments} {word}')
+    native = capsys.readouterr().out, interpreter.data_stack
+    interpreter.run(REFERENCE + f'{arguments} ref-{word}')
+    assert (capsys.readouterr().out, interpreter.data_stack) == native
+
+
+@pytest.mark.parametrize(
+    'program, data_stack', [
+        ('17 5 /mod', [2, 3]),
+        ('-17 5 /mod', [3, -4]),
+        ('7 3 2 */', [10]),
+        ('7 3 2 */mod', [1, 10]),
+        ('0 spaces', []),
+    ]
+)
+def test_standard_semantics(interpreter, program, data_stack):
+    # the former Forth versions of these words did not follow the standard
+    interpreter.run(program)
+    assert interpreter.data_stack == data_stack
@@ -0,0 +1,95 @@
+import pytest
+
+from pyforth.core import DefinedExecutionToken
+from pyforth.interpreter import Interpreter
+from pyforth.optimizer import optimize
+from pyforth.runtime import arithmetic, comparison, doloop, primitives
+from tests.programs import CONTROL_FLOW_PROGRAMS, assert_parity
+
+
+@pytest.mark.parametrize('program', CONTROL_FLOW_PROGRAMS)
+def test_optimizer_parity(program):
+    assert_parity(program, Interpreter(optimize=False), Interpreter(optimize=True))
+
+
+def test_push_literal_add():
+    code = DefinedExecutionToken([
+        primitives.xt_r_push, 1,
+        arithmetic.xt_r_add,
+        primitives.xt_r_push, 2,
+        arithmetic.xt_r_sub,
+    ])
+    assert optimize(code) == [primitives.xt_r_push_add, 1, primitives.xt_r_push_add, -2]
+
+
+def test_compare_and_branch_relocation():
+    code = DefinedExecutionToken([
+        primitives.xt_r_push, 1,
+        arithmetic.xt_r_add,
+        comparison.xt_r_lt,
+        primitives.xt_r_jz, 9,
+        primitives.xt_r_push, 2,
+        arithmetic.xt_r_mul,
+    ])
+    assert optimize(code) == [
+        primitives.xt_r_push_add, 1,
+        primitives.xt_r_lt_jz, 7,
+        primitives.xt_r_push, 2,
+        arithmetic.xt_r_mul,
+    ]
+
+
+def test_no_fusion_across_jump_target():
+    code = DefinedExecutionToken([
+        primitives.xt_r_push, 1,
+        arithmetic.xt_r_add,   # target of the backward jump below
+        primitives.xt_r_jmp, 2,
+    ])
+    assert optimize(code) == code
+
+
+def test_native_loop():
+    interpreter = Interpreter(optimize=True)
+    interpreter.run(': main 3 0 do i loop ;')
+    code = interpreter._state.execution_tokens['main']
+    assert doloop.xt_r_loop in code
+    assert doloop.xt_r_unloop in code
+
+
+INLINED_PROGRAMS = [
+    ': main 1 2 2dup rot ; main',
+    ': main 5 -3 abs swap abs ; main',
+    ': sign dup 0 < if drop -1 else 0 > if 1 else 0 then then ; : main -5 sign 0 sign 7 sign ; main',
+    ': early dup 3 > if exit then 1+ ; : main 1 early 9 early ; main',
+    ': foo 1 ; : bar foo ; : foo 2 ; bar foo',
+    ': down dup 0 > if 1- recurse then ; : main 3 down ; main',
+]
+
+
+@pytest.mark.parametrize('program', INLINED_PROGRAMS)
+def test_inlining_parity(program):
+    reference = Interpreter(inline_threshold=0)
+    reference.run(program)
+    inlined = Interpreter(inline_threshold=32)
+    inlined.run(program)
+    assert inlined.data_stack == reference.data_stack
+    assert inlined.return_stack == reference.return_stack
+
+
+@pytest.mark.parametrize(
+    'inline_threshold, called', [
+        (0, True),
+        (16, False),
+    ]
+)
+def test_inline_threshold(inline_threshold, called):
+    interpreter = Interpreter(inline_threshold=inline_threshold)
+    interpreter.run(': pair dup dup ; : main pair ;')
+    code = interpreter._state.execution_tokens['main']
+    assert (primitives.xt_r_call in code) is called
+
+
+def test_recursive_definition_not_inlined():
+    interpreter = Interpreter(inline_threshold=16)
+    interpreter.run(': down dup 0 > if 1- recurse then ; : main down ;')
+    assert interpreter._state.execution_tokens['main'][0] is primitives.xt_r_call
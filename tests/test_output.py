@@ -0,0 +1,78 @@
+import io
+
+import pytest
+
+from pyforth.core import StackUnderflowError
+from pyforth.interpreter import Interpreter
+from pyforth.sink import BUFFER_SIZE, OutputSink
+
+
+class _CountingStream(io.StringIO):
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes: int = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+def test_text_stream():
+    stream = io.StringIO()
+    Interpreter(output=stream).run('1 . space 2 . ." three"')
+    assert stream.getvalue() == '1 2three'
+
+
+def test_binary_stream():
+    stream = io.BytesIO()
+    Interpreter(output=stream).run('char é emit 65 emit')
+    assert stream.getvalue() == 'éA'.encode('utf-8')
+
+
+def test_output_is_buffered_until_cr():
+    stream = _CountingStream()
+    Interpreter(output=stream).run(': main 1000 0 do i . loop cr 1 . ; main')
+    assert stream.writes == 2
+
+
+def test_buffer_size():
+    stream = _CountingStream()
+    sink = OutputSink(stream, buffer_size=4)
+    for c in 'abcdefghij':
+        sink.write(c)
+    assert stream.writes == 2 and stream.getvalue() == 'abcdefgh'
+    sink.flush()
+    assert stream.getvalue() == 'abcdefghij'
+
+
+def test_large_output_is_flushed_by_chunks():
+    stream = _CountingStream()
+    Interpreter(output=stream).run(f': main {BUFFER_SIZE} 0 do 42 emit loop ; main')
+    assert stream.writes == 1 and len(stream.getvalue()) == BUFFER_SIZE
+
+
+def test_flushed_on_error():
+    stream = io.StringIO()
+    with pytest.raises(StackUnderflowError):
+        Interpreter(output=stream).run('1 . drop drop')
+    assert stream.getvalue() == '1'
+
+
+def test_flushed_before_input(monkeypatch):
+    stream = io.StringIO()
+    lines = iter(['2 .', 'bye'])
+    seen: list[str] = []
+
+    def answer(_: str) -> str:
+        seen.append(stream.getvalue())
+        return next(lines)
+
+    monkeypatch.setattr('builtins.input', answer)
+    Interpreter(output=stream).run('1 .', interactive=True)
+    assert seen == ['1', '12']
+
+
+def test_default_is_sys_stdout(interpreter, capsys):
+    interpreter.run('1 .')
+    assert capsys.readouterr().out == '1'
@@ -0,0 +1,64 @@
+import re
+
+import pytest
+
+from pyforth.interpreter import Interpreter
+
+
+PROGRAM = """
+: square dup * ;
+: fib dup 2 < if exit then dup 1- recurse swap 2 - recurse + ;
+: main 10 0 do i square drop loop 5 fib drop ;
+"""
+
+
+@pytest.fixture
+def profiled() -> Interpreter:
+    interpreter = Interpreter(inline_threshold=0)  # square is called, not inlined
+    interpreter.run(PROGRAM)
+    interpreter.run('profile-on main profile-off')
+    return interpreter
+
+
+def test_call_counts(profiled):
+    profile = profiled.profile()
+    assert profile['main'].calls == 1
+    assert profile['square'].calls == 10
+    assert profile['fib'].calls == 15
+    assert profile['*'].calls == 10
+
+
+def test_times(profiled):
+    profile = profiled.profile()
+    assert profile['main'].inclusive >= profile['fib'].inclusive + profile['square'].inclusive
+    assert profile['main'].exclusive < profile['main'].inclusive
+    assert profile['*'].exclusive == pytest.approx(profile['*'].inclusive)
+    assert profile['fib'].inclusive <= profile['main'].inclusive  # recursive calls are counted once
+
+
+def test_collapsed_stacks(profiled, capsys):
+    profiled.run('.profile')
+    lines = capsys.readouterr().out.splitlines()
+    assert all(re.fullmatch(r'[^ ]+ \d+', line) for line in lines)
+    paths = {line.rsplit(' ', 1)[0] for line in lines}
+    assert {'main', 'main;square', 'main;square;*', 'main;fib', 'main;fib;fib;fib'} <= paths
+
+
+def test_disabled_by_default(interpreter):
+    interpreter.run(': main 1 drop ; main')
+    assert interpreter.profile() == {}
+    assert 'execute' not in vars(interpreter._state)
+
+
+def test_profile_off_stops_recording(profiled):
+    profiled.run('main')
+    assert profiled.profile()['main'].calls == 1
+    assert 'execute' not in vars(profiled._state)
+
+
+def test_python_api(interpreter):
+    interpreter.run(': main 1 drop ;')
+    interpreter.profile_on()
+    interpreter.run('main main')
+    interpreter.profile_off()
+    assert interpreter.profile()['main'].calls == 2
@@ -0,0 +1,26 @@
+import pytest
+
+from pyforth.core import ForthCompilationError
+from pyforth.interpreter import Interpreter
+
+
+def test_definitions_do_not_leak():
+    first, second = Interpreter(), Interpreter()
+    first.run(': foo 1 ; : true 1 ; : ?if postpone if ; immediate')
+    with pytest.raises(ForthCompilationError):
+        second.run('foo')
+    second.run('true')
+    assert second.data_stack == [-1]
+    assert 'foo' in first.words and 'foo' not in second.words
+
+
+def test_heap_is_not_shared():
+    first, second = Interpreter(), Interpreter()
+    first.run('hex variable x 42 x !')
+    second.run('variable x x @ base @')
+    assert second.data_stack == [0, 10]
+
+
+def test_bootstrap_words_are_shared():
+    first, second = Interpreter(), Interpreter()
+    assert first.words == second.words
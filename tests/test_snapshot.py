@@ -0,0 +1,78 @@
+import os
+import pickle
+
+import pytest
+
+from pyforth import interpreter as interpreter_module
+from pyforth.interpreter import Interpreter
+from pyforth.snapshot import load_snapshot
+
+
+@pytest.fixture(scope='function')
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('PYFORTH_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr('pyforth.interpreter._BOOTSTRAP_IMAGES', {})  # not yet bootstrapped
+    return tmp_path
+
+
+def test_snapshot_is_cached(cache_dir):
+    reference = Interpreter(use_snapshot=False)
+    Interpreter()
+    assert len(list(cache_dir.glob('*.snapshot'))) == 1
+    interpreter = Interpreter()
+    assert interpreter.words == reference.words
+    interpreter.run('hex A 1 + . decimal true false 2 fsincos drop')
+    assert interpreter.data_stack == [-1, 0, 2]
+
+
+def test_snapshot_per_compiler_options(cache_dir):
+    Interpreter()
+    Interpreter(optimize=False)
+    assert len(list(cache_dir.glob('*.snapshot'))) == 2
+
+
+def test_corrupted_snapshot(cache_dir):
+    Interpreter()
+    for path in cache_dir.glob('*.snapshot'):
+        path.write_bytes(b'garbage')
+    interpreter = Interpreter()
+    interpreter.run('true')
+    assert interpreter.data_stack == [-1]
+
+
+def test_unpicklable_extension(cache_dir, tmp_path, capsys):
+    extension = tmp_path / 'hello.forth'
+    extension.write_text(': hello ." Hello" ;')
+    interpreter = Interpreter(extensions=('core.forth', str(extension)))
+    assert not list(cache_dir.glob('*.snapshot'))
+    interpreter.run('hello')
+    assert capsys.readouterr().out == 'Hello'
+
+
+def test_stale_snapshots_removed(cache_dir):
+    Interpreter()
+    (snapshot,) = cache_dir.glob('*.snapshot')
+    stale = cache_dir / f"{snapshot.stem.partition('-')[0]}-older.snapshot"
+    stale.write_bytes(snapshot.read_bytes())
+    snapshot.unlink()
+    interpreter_module._BOOTSTRAP_IMAGES.clear()  # bootstrapped again from the cache
+    Interpreter()
+    assert [path.name for path in cache_dir.glob('*.snapshot')] == [snapshot.name]
+
+
+def test_foreign_globals_refused(cache_dir):
+    Interpreter()
+    (snapshot,) = cache_dir.glob('*.snapshot')
+    snapshot.write_bytes(pickle.dumps(os.getcwd))
+    assert load_snapshot(snapshot.stem) is None
+
+
+def test_dotted_global_refused(cache_dir):
+    Interpreter()
+    (snapshot,) = cache_dir.glob('*.snapshot')
+    payload = (  # protocol 4: pyforth.snapshot.os.getcwd(), resolved through the module globals
+        b'\x80\x04' + b'\x8c\x10pyforth.snapshot' + b'\x8c\x09os.getcwd' + b'\x93' + b')R.'
+    )
+    snapshot.write_bytes(payload)
+    assert pickle.loads(payload) == os.getcwd()  # what an unrestricted unpickler runs
+    assert load_snapshot(snapshot.stem) is None
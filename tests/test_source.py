@@ -0,0 +1,67 @@
+import io
+
+import pytest
+
+from pyforth.source import InputSource
+
+
+def test_next_word():
+    source = InputSource('  dup   swap\n drop \n')
+    assert [source.next_word() for _ in range(4)] == ['dup', 'swap', 'drop', '']
+    assert source.blank
+
+
+@pytest.mark.parametrize(
+    'text, delimiter, parsed, remaining', [
+        ('Hello" cr ', '"', ('Hello', True), ' cr '),
+        ('comment\nnext', '\n', ('comment', True), 'next'),
+        ('unterminated', ')', ('unterminated', False), ''),
+    ]
+)
+def test_parse(text, delimiter, parsed, remaining):
+    source = InputSource(text)
+    assert source.parse(delimiter) == parsed
+    assert source.remaining == remaining
+
+
+def test_feed_keeps_unread_text():
+    source = InputSource('one two')
+    assert source.next_word() == 'one'
+    source.feed(' three ')
+    assert source.remaining == 'two three '
+    assert [source.next_word(), source.next_word()] == ['two', 'three']
+
+
+def test_large_source(interpreter):
+    interpreter.run('0 ' + ' '.join(['1 +'] * 100_000) + ' ( done )')
+    assert interpreter.data_stack == [100_000]
+
+
+def test_interactive_refill(interpreter, monkeypatch):
+    lines = iter([': foo ( a comment', 'spanning lines ) 42 ;', 'foo', 'bye'])
+    monkeypatch.setattr('builtins.input', lambda _: next(lines))
+    interpreter.run(interactive=True)
+    assert interpreter.data_stack == [42]
+
+
+STREAMED_PROGRAM = r"""
+\ a comment line
+: greet ( -- ) ." Hello, world!" cr ;
+: shout s" HEY" type ;
+greet shout 1 2 + .
+"""
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64])
+def test_run_stream_chunk_boundaries(interpreter, chunk_size, capsys):
+    interpreter.run(STREAMED_PROGRAM)
+    expected = capsys.readouterr().out
+    interpreter.run_stream(io.StringIO(STREAMED_PROGRAM), chunk_size=chunk_size)
+    assert capsys.readouterr().out == expected == 'Hello, world!\nHEY3'
+
+
+def test_load_file(interpreter, tmp_path, capsys):
+    path = tmp_path / 'program.fs'
+    path.write_text(STREAMED_PROGRAM.rstrip(), encoding='utf-8')  # no whitespace after last word
+    interpreter.load_file(path)
+    assert capsys.readouterr().out == 'Hello, world!\nHEY3'
@@ -1,5 +1,7 @@
 import pytest
 
+from pyforth.core import ForthRuntimeError
+
 
 @pytest.mark.parametrize(
     'program, res', [
@@ -41,3 +43,25 @@ def test_char_and_bracket_char(interpreter, program, res, capsys):
     interpreter.run(program)
     captured = capsys.readouterr()
     assert captured.out == res
+
+
+def test_string_literals_are_stored_once(interpreter, capsys):
+    interpreter.run(': greet s" hi" ; : main here 1000 0 do greet 2drop loop here = ; main')
+    assert interpreter.data_stack == [-1]
+
+
+def test_string_literals_survive_runs(interpreter, capsys):
+    interpreter.run(': greet s" Hello" ; : name c" Seb" ;')
+    interpreter.run('create buffer 100 allot buffer 100 erase greet type name count type')
+    assert capsys.readouterr().out == 'HelloSeb'
+
+
+def test_identical_string_literals_are_shared(interpreter):
+    interpreter.run(': a s" same" ; : b s" same" ; a drop b drop =')
+    assert interpreter.data_stack == [-1]
+
+
+@pytest.mark.parametrize('program', ['100000000 5 type', '-5 3 type'])
+def test_type_outside_heap(interpreter, program):
+    with pytest.raises(ForthRuntimeError, match='Invalid heap region'):
+        interpreter.run(program)
@@ -1,5 +1,7 @@
 import pytest
 
+from pyforth.core import ForthCompilationError
+
 
 @pytest.mark.parametrize(
     'program, data_stack', [
@@ -29,3 +31,44 @@ def test_tick_execute(interpreter, program, data_stack):
 def test_bracket_compile(interpreter, program, data_stack):
     interpreter.run(program)
     assert interpreter.data_stack == data_stack
+
+
+def test_address_survives_redefinition(interpreter):
+    interpreter.run("""
+    : greet 1 ;
+    ' greet constant old
+    : greet 2 ;
+    ' greet constant new
+    : other 3 ;
+    old execute new execute
+    """)
+    assert interpreter.data_stack == [1, 2]
+
+
+def test_same_word_same_address(interpreter):
+    interpreter.run("' dup ' dup ' swap")
+    first, second, third = interpreter.data_stack
+    assert first == second != third
+
+
+def test_execute_unknown_address(interpreter):
+    with pytest.raises(ForthCompilationError):
+        interpreter.run("12345 execute")
+
+
+def test_tick_unknown_word(interpreter):
+    with pytest.raises(ForthCompilationError):
+        interpreter.run("' no-such-word")
+
+
+def test_bootstrap_addresses_are_kept(tmp_path, monkeypatch):
+    from pyforth.interpreter import Interpreter
+
+    monkeypatch.setenv('PYFORTH_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr('pyforth.interpreter._BOOTSTRAP_IMAGES', {})
+    extension = tmp_path / 'vector.forth'
+    extension.write_text("variable vector ' dup vector !")
+    for _ in range(2):  # bootstrapped then loaded from its snapshot
+        interpreter = Interpreter(extensions=('core.forth', str(extension)))
+        interpreter.run("5 vector @ execute")
+        assert interpreter.data_stack == [5, 5]
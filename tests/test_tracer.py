@@ -0,0 +1,66 @@
+import pytest
+
+from pyforth.core import StackUnderflowError
+from pyforth.interpreter import Interpreter
+
+
+def test_disabled_by_default(interpreter):
+    interpreter.run(': main 1 drop ; main')
+    assert interpreter.trace() == []
+    assert 'execute' not in vars(interpreter._state)
+
+
+def test_records_words_and_top_of_stack(interpreter):
+    interpreter.run(': main 3 4 + drop ;')
+    interpreter.trace_on()
+    interpreter.run('main')
+    trace = interpreter.trace()
+    words = [entry.word for entry in trace]
+    assert 'drop' in words
+    assert trace[words.index('drop')].tos == 7
+    assert all(entry.definition for entry in trace)
+
+
+def test_ring_buffer_is_bounded(interpreter):
+    interpreter.run(': main 100 0 do i drop loop ;')
+    interpreter.trace_on(8)
+    interpreter.run('main')
+    trace = interpreter.trace()
+    assert len(trace) == 8
+    assert trace[-1].definition == 'main'
+
+
+def test_dumped_on_error(capsys):
+    interpreter = Interpreter(inline_threshold=0)  # inner is called, not inlined
+    interpreter.run(': inner drop drop ; : outer 1 inner ;')
+    interpreter.trace_on()
+    with pytest.raises(StackUnderflowError):
+        interpreter.run('outer')
+    err = capsys.readouterr().err
+    assert 'last words executed' in err
+    assert 'inner+' in err and 'drop tos=empty' in err
+
+
+def test_trace_off(interpreter, capsys):
+    interpreter.trace_on()
+    interpreter.trace_off()
+    with pytest.raises(StackUnderflowError):
+        interpreter.run('drop')
+    assert capsys.readouterr().err == ''
+    assert 'execute' not in vars(interpreter._state)
+
+
+def test_profiling_suspends_tracing(interpreter):
+    interpreter.trace_on()
+    interpreter.profile_on()
+    assert vars(interpreter._state)['execute'] == interpreter._state._execute_profiled
+    interpreter.profile_off()
+    assert vars(interpreter._state)['execute'] == interpreter._state._execute_traced
+
+
+def test_words_of_the_input_recorded(interpreter, capsys):
+    interpreter.trace_on()
+    with pytest.raises(StackUnderflowError):
+        interpreter.run('1 drop drop')
+    assert interpreter.trace()[-1].word == 'drop'
+    assert '(input)+0 drop tos=empty' in capsys.readouterr().err